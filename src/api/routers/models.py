@@ -18,7 +18,6 @@ All endpoints include proper error handling, validation, and status codes.
 import re
 from typing import List, Optional
 
-import structlog
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 from pydantic import ValidationError
 
@@ -31,6 +30,7 @@ from src.core.exceptions import (
 )
 from src.core.exceptions import ValidationError as DomainValidationError
 from src.core.services.model_service import ModelService
+from src.core.utils import get_logger
 from src.schemas.models import (
     ModelDTO,
     ModelPortfolioDTO,
@@ -39,15 +39,17 @@ from src.schemas.models import (
     ModelPutDTO,
 )
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 router = APIRouter(prefix="", tags=["models"])
 
+_is_model_id = re.compile(r'[a-fA-F0-9]{24}').fullmatch
+
 
 def validate_model_id(
     model_id: str = Path(..., description="24-character model ID")
 ) -> str:
     """Validate model ID format."""
-    if not re.match(r'^[a-fA-F0-9]{24}$', model_id):
+    if not _is_model_id(model_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid model ID format. Must be 24-character hexadecimal string.",
@@ -7,7 +7,6 @@ including model-based and individual portfolio rebalancing.
 
 from typing import List
 
-import structlog
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 
 from src.api.dependencies import get_rebalance_service
@@ -18,9 +17,10 @@ from src.core.exceptions import (
     PortfolioNotFoundError,
 )
 from src.core.services.rebalance_service import RebalanceService
+from src.core.utils import get_logger
 from src.schemas.rebalance import RebalanceDTO
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 router = APIRouter()
 
 
@@ -7,7 +7,7 @@ allowing for easy configuration management across different deployment environme
 
 import logging
 from functools import lru_cache
-from typing import Union
+from typing import Literal, Union
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -42,6 +42,10 @@ class Settings(BaseSettings):
     # Server Configuration
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8088, description="Server port")
+    workers: int = Field(
+        default=1,
+        description="Uvicorn worker processes for main() (0 = one per CPU)",
+    )
     debug: bool = Field(default=False, description="Debug mode")
     log_level: str = Field(default="DEBUG", description="Logging level")
 
@@ -65,6 +69,10 @@ class Settings(BaseSettings):
     database_idle_timeout_ms: int = Field(
         default=300000, description="Database connection idle timeout in milliseconds"
     )
+    database_wait_queue_timeout_ms: int = Field(
+        default=5000,
+        description="Maximum time to wait for a pooled connection in milliseconds",
+    )
 
     # Redis Configuration
     redis_url: str = Field(
@@ -180,6 +188,12 @@ class Settings(BaseSettings):
     metrics_port: int = Field(default=9090, description="Metrics endpoint port")
 
     # OpenTelemetry Configuration
+    otel_enabled: bool = Field(
+        default=True, description="Enable OpenTelemetry trace and metric export"
+    )
+    otel_protocol: Literal["grpc", "http"] = Field(
+        default="grpc", description="OTLP protocol used to reach the collector"
+    )
     otel_collector_grpc_endpoint: str = Field(
         default="otel-collector-collector.monitoring.svc.cluster.local:4317",
         description="OpenTelemetry Collector gRPC endpoint",
@@ -191,6 +205,15 @@ class Settings(BaseSettings):
     otel_insecure: bool = Field(
         default=True, description="Use insecure connection for OpenTelemetry gRPC"
     )
+    tracing_enabled: bool = Field(
+        default=True, description="Create a server span for every HTTP request"
+    )
+    otel_sample_ratio: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of new traces to sample (parent decisions are kept)",
+    )
 
     def configure_logging(self) -> None:
         """
@@ -159,8 +159,9 @@ class RebalanceMapper:
             positions_dto = []
 
             for position in portfolio.positions:
-                # Ensure all Decimal fields are properly converted
-                position_dto = RebalancePositionDTO(
+                # Ensure all Decimal fields are properly converted; the entity
+                # was validated when it was built, so the DTO is not revalidated
+                position_dto = RebalancePositionDTO.from_trusted(
                     security_id=position.security_id,
                     price=RebalanceMapper._ensure_decimal(position.price),
                     original_quantity=RebalanceMapper._ensure_decimal(
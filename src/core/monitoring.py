@@ -458,7 +458,7 @@ class EnhancedHTTPMetricsMiddleware(BaseHTTPMiddleware):
 
             # Extract labels for metrics
             method = self._get_method_label(request.method)
-            path = self._extract_route_pattern(request)
+            path = self._get_route_label(request)
             status = self._format_status_code(response.status_code)
 
             # Record all three metrics with proper error handling
@@ -482,7 +482,7 @@ class EnhancedHTTPMetricsMiddleware(BaseHTTPMiddleware):
 
             # Extract labels for error metrics
             method = self._get_method_label(request.method)
-            path = self._extract_route_pattern(request)
+            path = self._get_route_label(request)
             status = "500"  # All exceptions result in 500 status for metrics
 
             # Record metrics even when exceptions occur
@@ -659,6 +659,25 @@ class EnhancedHTTPMetricsMiddleware(BaseHTTPMiddleware):
                 exc_info=True,
             )
 
+    def _get_route_label(self, request: Request) -> str:
+        """
+        Get the path label for a request that has been through routing.
+
+        FastAPI stores the matched route in the request scope, and its path
+        template is already bounded, so it is used directly. Unmatched
+        requests (404s) fall back to ``_extract_route_pattern``.
+
+        Args:
+            request: The HTTP request
+
+        Returns:
+            Route template or extracted route pattern
+        """
+        route = request.scope.get("route")
+        if route is not None:
+            return route.path
+        return self._extract_route_pattern(request)
+
     def _extract_route_pattern(self, request: Request) -> str:
         """
         Extract route pattern from request URL to prevent high cardinality metrics.
@@ -7,8 +7,6 @@ coordinating between the API layer, domain logic, and infrastructure layer.
 
 from typing import List, Optional
 
-import structlog
-
 from src.core.exceptions import (
     BusinessRuleViolationError,
     NotFoundError,
@@ -17,6 +15,7 @@ from src.core.exceptions import (
     ValidationError,
 )
 from src.core.mappers import ModelMapper
+from src.core.utils import get_logger
 from src.domain.entities.model import InvestmentModel
 from src.domain.repositories.model_repository import ModelRepository
 from src.domain.services.implementations.portfolio_validation_service import (
@@ -30,7 +29,7 @@ from src.schemas.models import (
     ModelPutDTO,
 )
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class ModelService:
@@ -11,7 +11,6 @@ from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import Dict, List
 
-import structlog
 from bson import ObjectId
 
 from src.core.exceptions import (
@@ -21,6 +20,7 @@ from src.core.exceptions import (
     PortfolioNotFoundError,
 )
 from src.core.mappers import RebalanceMapper
+from src.core.utils import get_logger
 from src.domain.entities.rebalance import (
     Rebalance,
     RebalancePortfolio,
@@ -39,7 +39,7 @@ from src.infrastructure.optimization.cvxpy_solver import CVXPYOptimizationEngine
 from src.schemas.rebalance import DriftDTO, RebalanceDTO
 from src.schemas.transactions import TransactionDTO, TransactionType
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class RebalanceService:
@@ -691,6 +691,9 @@ class RebalanceService:
                         'after': Decimal('0'),
                     }
 
+        # Index model positions by security once for all portfolios
+        model_positions = {pos.security_id: pos for pos in model.positions}
+
         # Create rebalance portfolios
         rebalance_portfolios = []
         for portfolio_id in portfolio_ids:
@@ -703,20 +706,14 @@ class RebalanceService:
 
             # Get union of all securities (current + model)
             all_securities = set(data['current_positions'].keys())
-            for pos in model.positions:
-                all_securities.add(pos.security_id)
+            all_securities.update(model_positions)
 
             for security_id in all_securities:
                 original_qty = Decimal(data['current_positions'].get(security_id, 0))
                 adjusted_qty = Decimal(data['optimal_quantities'].get(security_id, 0))
                 price = data['prices'].get(security_id, Decimal('0'))
 
-                # Find model position for this security
-                model_position = None
-                for pos in model.positions:
-                    if pos.security_id == security_id:
-                        model_position = pos
-                        break
+                model_position = model_positions.get(security_id)
 
                 target = model_position.target.value if model_position else Decimal('0')
                 high_drift = (
@@ -7,17 +7,30 @@ correlation ID management, and other cross-cutting concerns.
 
 import json
 import logging
+import time
 import uuid
 from contextvars import ContextVar
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 
+import orjson
 import structlog
+from opentelemetry import trace
+from structlog.typing import EventDict
 
 # Context variable for correlation ID
 correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
 
+# Context variable for the request's start time, shared by documents it creates
+request_time_var: ContextVar[datetime | None] = ContextVar("request_time", default=None)
+
+# Static service fields shared by log events and response metadata
+_SERVICE_INFO: dict[str, str] = {
+    "service": "order-generation-service",
+    "version": "0.1.0",
+}
+
 
 def get_correlation_id() -> str:
     """
@@ -47,12 +60,48 @@ def set_correlation_id(correlation_id: str) -> None:
     """
     Set the correlation ID for the current context.
 
+    The value lives in a ContextVar, so it follows the current task across
+    ``await`` points and is not shared between concurrent requests.
+
     Args:
         correlation_id: The correlation ID to set
     """
     correlation_id_var.set(correlation_id)
 
 
+def set_request_time() -> datetime:
+    """
+    Record the current UTC time as the start time of the current request.
+
+    Returns:
+        The recorded time
+    """
+    now = datetime.now(UTC)
+    request_time_var.set(now)
+    return now
+
+
+def utc_now() -> datetime:
+    """
+    Get the current request's start time, or the current UTC time outside one.
+
+    Documents created while handling one request share a single timestamp
+    instead of reading the clock for each construction.
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    request_time = request_time_var.get()
+    if request_time is None:
+        return datetime.now(UTC)
+    return request_time
+
+
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
 def configure_structured_logging(log_level: str = "INFO") -> None:
     """
     Configure structured logging with correlation IDs.
@@ -75,32 +124,54 @@ def configure_structured_logging(log_level: str = "INFO") -> None:
 
     def add_timestamp(logger, method_name, event_dict):
         """Add timestamp to log events."""
-        event_dict["timestamp"] = datetime.utcnow().isoformat()
+        event_dict["timestamp"] = format_utc_timestamp()
         return event_dict
 
     def add_service_info(logger, method_name, event_dict):
         """Add service information to log events."""
-        event_dict["service"] = "order-generation-service"
-        event_dict["version"] = "0.1.0"
+        event_dict.update(_SERVICE_INFO)
+        return event_dict
+
+    def add_otel_context(
+        logger: Any, method_name: str, event_dict: EventDict
+    ) -> EventDict:
+        """Add the active trace and span IDs to log events."""
+        span = trace.get_current_span()
+        if span.is_recording():
+            span_context = span.get_span_context()
+            event_dict["trace_id"] = format(span_context.trace_id, "032x")
+            event_dict["span_id"] = format(span_context.span_id, "016x")
+        return event_dict
+
+    def add_logger_name(
+        logger: Any, method_name: str, event_dict: EventDict
+    ) -> EventDict:
+        """Expose the bound logger name under the standard ``logger`` key."""
+        name = event_dict.pop("logger_name", None)
+        if name is not None:
+            event_dict["logger"] = name
         return event_dict
 
-    # Configure structlog
+    # Configure structlog with a level-filtering bound logger that writes
+    # straight to the stream, bypassing the stdlib logging handler lock
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
+            add_logger_name,
+            structlog.processors.add_log_level,
             add_correlation_id,
+            add_otel_context,
             add_timestamp,
             add_service_info,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.PrintLoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, log_level.upper())
+        ),
         cache_logger_on_first_use=True,
     )
 
@@ -127,7 +198,7 @@ def configure_structured_logging(log_level: str = "INFO") -> None:
     print(f"[UTILS] Root logger level after configuration: {final_level}")
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
     """
     Get a structured logger instance.
 
@@ -137,7 +208,7 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     Returns:
         Configured structured logger
     """
-    return structlog.get_logger(name)
+    return structlog.get_logger(logger_name=name)
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -348,6 +419,31 @@ def sanitize_for_logging(data: Any, max_depth: int = 3) -> Any:
         return data
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def format_utc_timestamp() -> str:
+    """
+    Format the current UTC time as an ISO 8601 string with microseconds.
+
+    The date/time prefix is only re-rendered when the wall-clock second
+    changes; within a second only the microsecond suffix is formatted.
+
+    Returns:
+        Timestamp such as ``2024-12-19T10:30:00.123456``
+    """
+    global _timestamp_cache
+
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+
 def create_response_metadata() -> dict[str, Any]:
     """
     Create standard response metadata.
@@ -356,8 +452,43 @@ def create_response_metadata() -> dict[str, Any]:
         Dictionary containing response metadata
     """
     return {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": format_utc_timestamp(),
         "correlation_id": get_correlation_id(),
-        "service": "order-generation-service",
-        "version": "0.1.0",
+        **_SERVICE_INFO,
     }
+
+
+def encode_error_template(code: str, message: str) -> bytes:
+    """
+    Pre-encode a static error envelope with slots for per-request metadata.
+
+    The result matches the body built from ``create_response_metadata`` but
+    leaves ``%s`` slots for the timestamp and correlation ID, so error paths
+    only splice two values instead of building and serializing a dict.
+
+    Args:
+        code: Error code placed in the envelope
+        message: Human-readable error message
+
+    Returns:
+        JSON bytes to be filled by ``render_error_template``
+    """
+    head = orjson.dumps({"code": code, "message": message})[:-1]
+    tail = orjson.dumps(_SERVICE_INFO)[1:]
+    return b'{"error":%s,"timestamp":%%s,"correlation_id":%%s,%s}' % (head, tail)
+
+
+def render_error_template(template: bytes) -> bytes:
+    """
+    Fill a pre-encoded error envelope with the current timestamp and correlation ID.
+
+    Args:
+        template: Envelope produced by ``encode_error_template``
+
+    Returns:
+        Completed JSON response body
+    """
+    return template % (
+        orjson.dumps(format_utc_timestamp()),
+        orjson.dumps(get_correlation_id()),
+    )
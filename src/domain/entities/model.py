@@ -202,7 +202,10 @@ class InvestmentModel:
 
     def get_total_target_percentage(self) -> Decimal:
         """Calculate the total target percentage across all positions."""
-        return sum(pos.target.value for pos in self.positions)
+        total = Decimal(0)
+        for pos in self.positions:
+            total += pos.target.value
+        return total
 
     def get_nonzero_target_positions(self) -> list[Position]:
         """Get all positions with non-zero target allocations."""
@@ -20,6 +20,9 @@ from src.domain.value_objects.drift_bounds import DriftBounds
 from src.domain.value_objects.target_percentage import TargetPercentage
 
 
+_is_alphanumeric = re.compile(r'[A-Za-z0-9]+').fullmatch
+
+
 @dataclass(frozen=True)
 class Position:
     """
@@ -47,7 +50,7 @@ class Position:
             raise ValidationError("Security ID must be exactly 24 characters")
 
         # Check alphanumeric
-        if not re.match(r'^[A-Za-z0-9]+$', self.security_id):
+        if not _is_alphanumeric(self.security_id):
             raise ValidationError(
                 "Security ID must contain only alphanumeric characters"
             )
@@ -44,8 +44,10 @@ class RebalancePosition(BaseModel):
     @field_validator('security_id')
     @classmethod
     def validate_security_id_format(cls, v):
-        """Validate security ID format (24 alphanumeric characters)."""
-        if not isinstance(v, str) or len(v) != 24 or not v.isalnum():
+        """Validate security ID format (24 ASCII alphanumeric characters)."""
+        # isascii() is a constant-time flag check on str and rules out the
+        # Unicode letters and digits that isalnum() alone would accept
+        if not isinstance(v, str) or len(v) != 24 or not (v.isascii() and v.isalnum()):
             raise ValueError("Security ID must be exactly 24 alphanumeric characters")
         return v
 
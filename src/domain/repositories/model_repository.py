@@ -9,6 +9,8 @@ from abc import abstractmethod
 from datetime import datetime
 from typing import List, Optional
 
+from bson import ObjectId
+
 from src.domain.entities.model import InvestmentModel
 from src.domain.repositories.base_repository import BaseRepository
 
@@ -16,6 +18,19 @@ from src.domain.repositories.base_repository import BaseRepository
 class ModelRepository(BaseRepository[InvestmentModel]):
     """Repository interface for Investment Model persistence."""
 
+    @abstractmethod
+    async def create_many(self, models: list[InvestmentModel]) -> list[InvestmentModel]:
+        """
+        Create several models in a single batch.
+
+        Args:
+            models: The investment models to create
+
+        Returns:
+            The created models, in the order given
+        """
+        pass
+
     @abstractmethod
     async def get_by_name(self, name: str) -> InvestmentModel | None:
         """
@@ -55,6 +70,19 @@ class ModelRepository(BaseRepository[InvestmentModel]):
         """
         pass
 
+    @abstractmethod
+    async def find_ids_by_portfolio(self, portfolio_id: str) -> list[ObjectId]:
+        """
+        Find the IDs of all models that include the specified portfolio.
+
+        Args:
+            portfolio_id: The portfolio ID to search for
+
+        Returns:
+            List of model IDs that include this portfolio (may be empty)
+        """
+        pass
+
     @abstractmethod
     async def find_by_last_rebalance_date(
         self, cutoff_date: datetime
@@ -13,6 +13,9 @@ from src.domain.entities.model import InvestmentModel
 from src.domain.services.drift_calculator import DriftCalculator, DriftInfo
 
 
+_is_alphanumeric = re.compile(r'[A-Za-z0-9]+').fullmatch
+
+
 class PortfolioDriftCalculator(DriftCalculator):
     """Concrete implementation of portfolio drift calculator."""
 
@@ -273,7 +276,7 @@ class PortfolioDriftCalculator(DriftCalculator):
         if len(security_id) != 24:
             return False
 
-        if not re.match(r'^[A-Za-z0-9]+$', security_id):
+        if not _is_alphanumeric(security_id):
             return False
 
         return True
@@ -11,6 +11,10 @@ from decimal import Decimal
 from src.core.exceptions import BusinessRuleViolationError, ValidationError
 from src.domain.entities.model import InvestmentModel
 from src.domain.services.validation_service import ValidationService
+from src.domain.value_objects.target_percentage import TargetPercentage
+
+
+_is_alphanumeric = re.compile(r'[A-Za-z0-9]+').fullmatch
 
 
 class PortfolioValidationService(ValidationService):
@@ -285,7 +289,7 @@ class PortfolioValidationService(ValidationService):
             ValidationError: If percentage precision is invalid
         """
         # Check if percentage is a multiple of 0.005
-        remainder = percentage % Decimal("0.005")
+        remainder = percentage % TargetPercentage.INCREMENT
         if remainder != 0:
             raise ValidationError(f"Percentage {percentage} is not a multiple of 0.005")
 
@@ -309,9 +313,9 @@ class PortfolioValidationService(ValidationService):
 
     async def _validate_target_sum_limit(self, model: InvestmentModel) -> None:
         """Validate that target sum does not exceed 95%."""
-        total_target = sum(position.target.value for position in model.positions)
+        total_target = model.get_total_target_percentage()
 
-        if total_target > Decimal("0.95"):
+        if total_target > InvestmentModel.MAX_TARGET_SUM:
             raise BusinessRuleViolationError(
                 f"Target sum ({total_target:.1%}) exceeds maximum allowed (95%)"
             )
@@ -371,7 +375,7 @@ class PortfolioValidationService(ValidationService):
         if len(security_id) != 24:
             return False
 
-        if not re.match(r'^[A-Za-z0-9]+$', security_id):
+        if not _is_alphanumeric(security_id):
             return False
 
         return True
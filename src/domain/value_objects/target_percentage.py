@@ -49,16 +49,14 @@ class TargetPercentage:
             )
 
         # Check if it's a multiple of 0.005 (unless it's zero)
-        if self.value != Decimal("0"):
-            remainder = self.value % self.INCREMENT
-            if remainder != Decimal("0"):
-                raise ValidationError(
-                    f"Target percentage must be 0 or a multiple of {self.INCREMENT}"
-                )
+        if self.value % self.INCREMENT:
+            raise ValidationError(
+                f"Target percentage must be 0 or a multiple of {self.INCREMENT}"
+            )
 
     def is_zero(self) -> bool:
         """Check if the target percentage is zero."""
-        return self.value == Decimal("0")
+        return not self.value
 
     def to_percentage_string(self) -> str:
         """Convert to percentage string representation."""
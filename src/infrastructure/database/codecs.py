@@ -0,0 +1,61 @@
+"""
+BSON codec options for raw MongoDB reads.
+
+Documents read straight from a motor collection bypass the Beanie models and
+their Decimal128 conversion. Registering a type decoder converts Decimal128
+values while the BSON is decoded, instead of walking the decoded document
+afterwards.
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+from bson import Decimal128
+from bson.codec_options import TypeDecoder, TypeRegistry
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+
+@lru_cache(maxsize=8192)
+def _decimal_from_bid(bid: bytes) -> Decimal:
+    """Convert Decimal128 binary data to Decimal.
+
+    Prices, targets and drifts repeat across the portfolios of a rebalance,
+    and unpacking Decimal128 costs far more than the cache lookup. The key is
+    the raw binary form, so 0.1 and 0.10 stay distinct.
+    """
+    return Decimal128.from_bid(bid).to_decimal()
+
+
+class Decimal128Decoder(TypeDecoder):
+    """Decode BSON Decimal128 values to Python Decimal."""
+
+    bson_type = Decimal128
+
+    def transform_bson(self, value: Decimal128) -> Decimal:
+        """Convert a decoded Decimal128 to Decimal."""
+        return _decimal_from_bid(value.bid)
+
+
+DECIMAL_TYPE_REGISTRY = TypeRegistry([Decimal128Decoder()])
+
+
+def with_decimal_codec(
+    collection: AsyncIOMotorCollection[Any],
+) -> AsyncIOMotorCollection[Any]:
+    """
+    Return a view of the collection that decodes Decimal128 as Decimal.
+
+    The collection's other codec options (such as tz_aware) are kept.
+
+    Args:
+        collection: Motor collection
+
+    Returns:
+        The same collection with the Decimal type registry applied
+    """
+    return collection.with_options(
+        codec_options=collection.codec_options.with_options(
+            type_registry=DECIMAL_TYPE_REGISTRY
+        )
+    )
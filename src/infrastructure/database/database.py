@@ -7,11 +7,12 @@ and provides connection management for the application.
 
 import asyncio
 import logging
-from typing import List, Optional
+from typing import Any, List, Optional, cast
 
 from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import ConfigurationError, ServerSelectionTimeoutError
+from pymongo.topology_description import TopologyDescription
 
 from src.config import get_settings
 from src.core.exceptions import DatabaseConnectionError
@@ -64,6 +65,7 @@ class DatabaseManager:
                     maxPoolSize=settings.database_max_connections,
                     minPoolSize=settings.database_min_connections,
                     maxIdleTimeMS=settings.database_idle_timeout_ms,
+                    waitQueueTimeoutMS=settings.database_wait_queue_timeout_ms,
                 )
 
                 # Test connection
@@ -80,6 +82,8 @@ class DatabaseManager:
                     document_models=[ModelDocument, RebalanceDocument],
                 )
 
+                await self._warm_pool(self.database, settings.database_min_connections)
+
                 self._is_initialized = True
                 logger.info(
                     f"Database '{settings.database_name}' initialized with Beanie ODM"
@@ -100,9 +104,57 @@ class DatabaseManager:
             finally:
                 self._initialization_in_progress = False
 
+    async def _warm_pool(
+        self, database: AsyncIOMotorDatabase[Any], min_connections: int
+    ) -> None:
+        """
+        Open pooled connections before the first request arrives.
+
+        Issues ``min_connections`` concurrent lightweight reads spread over the
+        document collections so the pool already holds established sockets
+        instead of dialling MongoDB on the request path. Warmup is best-effort:
+        a failed read is logged and startup continues.
+
+        Args:
+            database: Database whose collections are read
+            min_connections: Number of connections to establish
+        """
+        collections = [
+            database[ModelDocument.Settings.name],
+            database[RebalanceDocument.Settings.name],
+        ]
+        try:
+            await asyncio.gather(
+                *(
+                    collections[i % len(collections)].find_one({}, {"_id": 1})
+                    for i in range(max(min_connections, len(collections)))
+                )
+            )
+        except Exception as e:
+            logger.warning(f"MongoDB connection pool warmup failed: {e}")
+            return
+        logger.debug(f"Warmed MongoDB connection pool ({min_connections} minimum)")
+
+    def _log_pool_stats(self, client: AsyncIOMotorClient[Any]) -> None:
+        """Log the topology the pool was connected to before shutdown."""
+        try:
+            # A property at runtime; motor's stubs declare it as a method
+            description = cast(TopologyDescription, client.topology_description)
+            servers = [
+                f"{host}:{port} ({server.server_type_name})"
+                for (host, port), server in description.server_descriptions().items()
+            ]
+            logger.info(
+                f"Closing MongoDB pool: topology={description.topology_type_name}, "
+                f"servers={servers}"
+            )
+        except Exception as e:
+            logger.debug(f"Could not read MongoDB topology description: {e}")
+
     async def disconnect(self) -> None:
         """Close database connection."""
         if self.client:
+            self._log_pool_stats(self.client)
             self.client.close()
             self.client = None
             self.database = None
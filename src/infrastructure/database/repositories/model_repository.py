@@ -7,11 +7,11 @@ for MongoDB persistence, using Beanie ODM for document operations.
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from beanie.exceptions import CollectionWasNotInitialized, DocumentNotFound
 from bson import ObjectId
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from src.core.exceptions import (
     ConcurrencyError,
@@ -20,7 +20,7 @@ from src.core.exceptions import (
 )
 from src.domain.entities.model import InvestmentModel
 from src.domain.repositories.model_repository import ModelRepository
-from src.models.model import ModelDocument
+from src.models.model import ModelDocument, ModelIdProjection
 
 logger = logging.getLogger(__name__)
 
@@ -64,12 +64,53 @@ class MongoModelRepository(ModelRepository):
             logger.error(error_msg)
             raise RepositoryError(error_msg, operation="create") from e
 
-    async def get_by_id(self, model_id: str) -> Optional[InvestmentModel]:
+    async def create_many(self, models: List[InvestmentModel]) -> List[InvestmentModel]:
+        """
+        Create several investment models with one insert command.
+
+        Args:
+            models: The investment models to create
+
+        Returns:
+            List[InvestmentModel]: The created models, in the order given
+
+        Raises:
+            RepositoryError: If a model name already exists or creation fails
+        """
+        if not models:
+            return []
+
+        try:
+            documents = [ModelDocument.from_domain_model(model) for model in models]
+
+            # IDs are assigned client-side, so the documents need no re-read
+            await ModelDocument.insert_many(documents)
+
+            logger.debug(f"Created {len(documents)} investment models")
+
+            return [document.to_domain_model() for document in documents]
+
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if any(error.get("code") == 11000 for error in write_errors):
+                error_msg = "One or more models with the given names already exist"
+            else:
+                error_msg = f"Failed to create {len(models)} models: {str(e)}"
+            logger.error(error_msg)
+            raise RepositoryError(error_msg, operation="create_many") from e
+        except Exception as e:
+            error_msg = f"Failed to create {len(models)} models: {str(e)}"
+            logger.error(error_msg)
+            raise RepositoryError(error_msg, operation="create_many") from e
+
+    async def get_by_id(
+        self, model_id: Union[str, ObjectId]
+    ) -> Optional[InvestmentModel]:
         """
         Retrieve a model by its ID.
 
         Args:
-            model_id: The model ID to search for
+            model_id: The model ID to search for, as a hex string or ObjectId
 
         Returns:
             Optional[InvestmentModel]: The model if found, None otherwise
@@ -82,7 +123,7 @@ class MongoModelRepository(ModelRepository):
                 f"ModelRepository.get_by_id(): Starting retrieval for model_id={model_id}"
             )
 
-            # Validate ObjectId format
+            # Validate ObjectId format (ObjectId instances pass without parsing)
             if not ObjectId.is_valid(model_id):
                 logger.error(
                     f"ModelRepository.get_by_id(): Invalid ObjectId format: {model_id}"
@@ -90,7 +131,9 @@ class MongoModelRepository(ModelRepository):
                 raise ValueError(f"Invalid ObjectId format: {model_id}")
 
             # Convert string ID to ObjectId
-            object_id = ObjectId(model_id)
+            object_id = (
+                model_id if isinstance(model_id, ObjectId) else ObjectId(model_id)
+            )
             logger.debug(f"ModelRepository.get_by_id(): Created ObjectId: {object_id}")
 
             # Try to find document by ID with fallback handling
@@ -262,12 +305,12 @@ class MongoModelRepository(ModelRepository):
             logger.error(error_msg)
             raise RepositoryError(error_msg, operation="update") from e
 
-    async def delete(self, model_id: str) -> bool:
+    async def delete(self, model_id: Union[str, ObjectId]) -> bool:
         """
         Delete a model by its ID.
 
         Args:
-            model_id: The ID of the model to delete
+            model_id: The ID of the model to delete, as a hex string or ObjectId
 
         Returns:
             bool: True if deleted successfully, False if not found
@@ -277,7 +320,9 @@ class MongoModelRepository(ModelRepository):
         """
         try:
             # Convert string ID to ObjectId
-            object_id = ObjectId(model_id)
+            object_id = (
+                model_id if isinstance(model_id, ObjectId) else ObjectId(model_id)
+            )
 
             # Find and delete document
             document = await ModelDocument.get(object_id)
@@ -473,6 +518,35 @@ class MongoModelRepository(ModelRepository):
             logger.error(error_msg)
             raise RepositoryError(error_msg, operation="find_by_portfolio") from e
 
+    async def find_ids_by_portfolio(self, portfolio_id: str) -> List[ObjectId]:
+        """
+        Find the IDs of all models associated with a specific portfolio.
+
+        Only the _id field is fetched, so no positions are transferred or
+        converted to domain objects.
+
+        Args:
+            portfolio_id: The portfolio ID to search for
+
+        Returns:
+            List[ObjectId]: IDs of models containing the portfolio
+        """
+        try:
+            projections = (
+                await ModelDocument.find({"portfolios": portfolio_id})
+                .sort("-created_at")
+                .project(ModelIdProjection)
+                .to_list()
+            )
+            return [projection.id for projection in projections]
+
+        except Exception as e:
+            error_msg = (
+                f"Failed to find model IDs for portfolio '{portfolio_id}': {str(e)}"
+            )
+            logger.error(error_msg)
+            raise RepositoryError(error_msg, operation="find_ids_by_portfolio") from e
+
     async def find_by_last_rebalance_date(
         self, cutoff_date: datetime
     ) -> List[InvestmentModel]:
@@ -602,10 +676,9 @@ class MongoModelRepository(ModelRepository):
             int: Total number of positions
         """
         try:
-            # Use aggregation pipeline to sum position counts
+            # Sum the position array sizes in a single server-side stage
             pipeline = [
-                {"$project": {"position_count": {"$size": "$positions"}}},
-                {"$group": {"_id": None, "total": {"$sum": "$position_count"}}},
+                {"$group": {"_id": None, "total": {"$sum": {"$size": "$positions"}}}},
             ]
 
             result = await ModelDocument.aggregate(pipeline).to_list()
@@ -719,23 +792,9 @@ class MongoModelRepository(ModelRepository):
             )
 
     def _convert_raw_to_domain_model(self, raw_document: dict) -> InvestmentModel:
-        """Convert raw MongoDB document to domain InvestmentModel without creating ModelDocument."""
-        from src.domain.entities.model import InvestmentModel
-        from src.models.model import PositionEmbedded
-
-        # Convert positions
-        positions = []
-        for pos_data in raw_document.get('positions', []):
-            # Create PositionEmbedded and convert to domain
-            pos_embedded = PositionEmbedded(**pos_data)
-            positions.append(pos_embedded.to_domain_position())
-
-        # Create domain model
-        return InvestmentModel(
-            model_id=raw_document['_id'],
-            name=raw_document['name'],
-            positions=positions,
-            portfolios=raw_document.get('portfolios', []).copy(),
-            last_rebalance_date=raw_document.get('last_rebalance_date'),
-            version=raw_document.get('version', 1),
-        )
+        """Convert raw MongoDB document to domain InvestmentModel.
+
+        Stored models were validated on write, so the document is built
+        without re-running the field and position validators.
+        """
+        return ModelDocument.from_mongo_trusted(raw_document).to_domain_model()
@@ -24,6 +24,7 @@ from src.domain.entities.rebalance import (
     RebalancePosition,
 )
 from src.domain.repositories.rebalance_repository import RebalanceRepository
+from src.infrastructure.database.codecs import with_decimal_codec
 from src.models.rebalance import PortfolioEmbedded, PositionEmbedded, RebalanceDocument
 from src.schemas.rebalance import PortfolioWithPositionsDTO, PositionDTO
 
@@ -211,20 +212,6 @@ class MongoRebalanceRepository(RebalanceRepository):
             )
             return obj
 
-    def _convert_decimal128_to_decimal_simple(self, obj):
-        """Simple conversion for Decimal128 values in dictionaries and lists only."""
-        if isinstance(obj, Decimal128):
-            return Decimal(str(obj))
-        elif isinstance(obj, dict):
-            return {
-                key: self._convert_decimal128_to_decimal_simple(value)
-                for key, value in obj.items()
-            }
-        elif isinstance(obj, list):
-            return [self._convert_decimal128_to_decimal_simple(item) for item in obj]
-        else:
-            return obj
-
     async def create(self, rebalance: Rebalance) -> Rebalance:
         """
         Create a new rebalance record in MongoDB.
@@ -300,8 +287,11 @@ class MongoRebalanceRepository(RebalanceRepository):
                 f"Repository.get_by_id(): Using collection access method: {access_method}"
             )
 
-            # Query for the document
-            raw_document = await collection.find_one({"_id": object_id})
+            # Query for the document; Decimal128 values are decoded to
+            # Decimal during BSON decoding
+            raw_document = await with_decimal_codec(collection).find_one(
+                {"_id": object_id}
+            )
             logger.debug(
                 f"Repository.get_by_id(): Query completed, found document: {raw_document is not None}"
             )
@@ -312,18 +302,13 @@ class MongoRebalanceRepository(RebalanceRepository):
                 )
                 return None
 
-            # Convert Decimal128 values in raw document
-            logger.debug(
-                f"Repository.get_by_id(): Converting Decimal128 values in raw document..."
-            )
-            converted_doc = self._convert_decimal128_to_decimal_simple(raw_document)
-            logger.debug(f"Repository.get_by_id(): Decimal128 conversion completed")
-
-            # Convert to domain model directly from dictionary
+            # Stored rebalances were validated on write, so the document is
+            # built without re-running validation over every position
             logger.debug(
                 f"Repository.get_by_id(): Converting raw document to domain object..."
             )
-            domain_obj = self._convert_raw_to_domain(converted_doc)
+            document = RebalanceDocument.from_mongo_trusted(raw_document)
+            domain_obj = self._convert_to_domain(document)
             logger.debug(
                 f"Repository.get_by_id(): Successfully converted to domain object"
             )
@@ -630,162 +615,59 @@ class MongoRebalanceRepository(RebalanceRepository):
             created_at=rebalance.created_at,
         )
 
-    def _convert_raw_to_domain(self, doc_dict: dict) -> Rebalance:
-        """Convert raw MongoDB document dictionary to domain Rebalance."""
+    def _convert_to_domain(self, document: RebalanceDocument) -> Rebalance:
+        """
+        Convert RebalanceDocument to domain Rebalance.
+
+        Fields are read straight off the document. Its Decimal fields already
+        hold Decimal values, whether Beanie validated the document or it was
+        built by from_mongo_trusted from a Decimal-decoding read, so there is
+        no intermediate dict to walk.
+        """
         try:
-            logger.debug(
-                f"_convert_raw_to_domain(): Starting conversion from raw document"
-            )
-            logger.debug(
-                f"_convert_raw_to_domain(): Document keys: {list(doc_dict.keys())}"
-            )
-
-            # Handle both '_id' (from raw MongoDB) and 'id' (from Beanie model_dump)
-            rebalance_id = doc_dict.get('_id') or doc_dict.get('id')
-            if rebalance_id is None:
-                raise KeyError("Neither '_id' nor 'id' found in document")
-
-            # Check a sample to verify Decimal128 conversion
-            if 'portfolios' in doc_dict and len(doc_dict['portfolios']) > 0:
-                sample_portfolio = doc_dict['portfolios'][0]
-                if (
-                    'positions' in sample_portfolio
-                    and len(sample_portfolio['positions']) > 0
-                ):
-                    sample_position = sample_portfolio['positions'][0]
-                    if 'target' in sample_position:
-                        logger.debug(
-                            f"_convert_raw_to_domain(): Sample position target type: {type(sample_position['target'])}"
+            portfolios = [
+                RebalancePortfolio(
+                    portfolio_id=portfolio.portfolio_id,
+                    market_value=portfolio.market_value,
+                    cash_before_rebalance=portfolio.cash_before_rebalance,
+                    cash_after_rebalance=portfolio.cash_after_rebalance,
+                    positions=[
+                        RebalancePosition(
+                            security_id=position.security_id,
+                            price=position.price,
+                            original_quantity=position.original_quantity,
+                            adjusted_quantity=position.adjusted_quantity,
+                            original_position_market_value=(
+                                position.original_position_market_value
+                            ),
+                            adjusted_position_market_value=(
+                                position.adjusted_position_market_value
+                            ),
+                            target=position.target,
+                            high_drift=position.high_drift,
+                            low_drift=position.low_drift,
+                            actual=position.actual,
+                            actual_drift=position.actual_drift,
+                            transaction_type=position.transaction_type,
+                            trade_quantity=position.trade_quantity,
+                            trade_date=position.trade_date,
                         )
-
-            logger.debug(
-                f"_convert_raw_to_domain(): Processing {len(doc_dict['portfolios'])} portfolios..."
-            )
-            portfolios = []
-            for i, portfolio_dict in enumerate(doc_dict['portfolios']):
-                logger.debug(
-                    f"_convert_raw_to_domain(): Processing portfolio {i+1}/{len(doc_dict['portfolios'])}"
+                        for position in portfolio.positions
+                    ],
                 )
-                positions = []
-                for j, position_dict in enumerate(portfolio_dict['positions']):
-                    logger.debug(
-                        f"_convert_raw_to_domain(): Processing position {j+1}/{len(portfolio_dict['positions'])} in portfolio {i+1}"
-                    )
-                    try:
-                        position = RebalancePosition(
-                            security_id=position_dict['security_id'],
-                            price=position_dict['price'],
-                            original_quantity=position_dict['original_quantity'],
-                            adjusted_quantity=position_dict['adjusted_quantity'],
-                            original_position_market_value=position_dict[
-                                'original_position_market_value'
-                            ],
-                            adjusted_position_market_value=position_dict[
-                                'adjusted_position_market_value'
-                            ],
-                            target=position_dict['target'],
-                            high_drift=position_dict['high_drift'],
-                            low_drift=position_dict['low_drift'],
-                            actual=position_dict['actual'],
-                            actual_drift=position_dict['actual_drift'],
-                            transaction_type=position_dict['transaction_type'],
-                            trade_quantity=position_dict['trade_quantity'],
-                            trade_date=position_dict['trade_date'],
-                        )
-                        positions.append(position)
-                        logger.debug(
-                            f"_convert_raw_to_domain(): Successfully created position {j+1}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"_convert_raw_to_domain(): Error creating position {j+1} in portfolio {i+1}: {str(e)}"
-                        )
-                        logger.error(
-                            f"_convert_raw_to_domain(): Position data types: security_id={type(position_dict['security_id'])}, price={type(position_dict['price'])}, target={type(position_dict['target'])}"
-                        )
-                        raise
-
-                try:
-                    portfolio = RebalancePortfolio(
-                        portfolio_id=portfolio_dict['portfolio_id'],
-                        market_value=portfolio_dict['market_value'],
-                        cash_before_rebalance=portfolio_dict['cash_before_rebalance'],
-                        cash_after_rebalance=portfolio_dict['cash_after_rebalance'],
-                        positions=positions,
-                    )
-                    portfolios.append(portfolio)
-                    logger.debug(
-                        f"_convert_raw_to_domain(): Successfully created portfolio {i+1}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"_convert_raw_to_domain(): Error creating portfolio {i+1}: {str(e)}"
-                    )
-                    logger.error(
-                        f"_convert_raw_to_domain(): Portfolio data types: portfolio_id={type(portfolio_dict['portfolio_id'])}, market_value={type(portfolio_dict['market_value'])}"
-                    )
-                    raise
-
-            logger.debug(
-                f"_convert_raw_to_domain(): Creating final Rebalance object..."
-            )
-            rebalance = Rebalance(
-                rebalance_id=rebalance_id,
-                model_id=doc_dict['model_id'],
-                rebalance_date=doc_dict['rebalance_date'],
-                model_name=doc_dict['model_name'],
-                number_of_portfolios=doc_dict['number_of_portfolios'],
+                for portfolio in document.portfolios
+            ]
+
+            return Rebalance(
+                rebalance_id=document.id,
+                model_id=document.model_id,
+                rebalance_date=document.rebalance_date,
+                model_name=document.model_name,
+                number_of_portfolios=document.number_of_portfolios,
                 portfolios=portfolios,
-                version=doc_dict['version'],
-                created_at=doc_dict['created_at'],
-            )
-            logger.debug(
-                f"_convert_raw_to_domain(): Successfully created Rebalance object"
+                version=document.version,
+                created_at=document.created_at,
             )
-            return rebalance
-
-        except Exception as e:
-            logger.error(
-                f"_convert_raw_to_domain(): Failed to convert raw document to domain object: {str(e)}"
-            )
-            logger.error(f"_convert_raw_to_domain(): Error type: {type(e).__name__}")
-            raise
-
-    def _convert_to_domain(self, document: RebalanceDocument) -> Rebalance:
-        """Convert RebalanceDocument to domain Rebalance."""
-        try:
-            logger.debug(
-                f"_convert_to_domain(): *** ENTRY POINT *** Starting conversion"
-            )
-            logger.debug(f"_convert_to_domain(): Document type: {type(document)}")
-
-            # Convert Beanie document to dictionary using model_dump
-            logger.debug(f"_convert_to_domain(): Converting document to dictionary...")
-            try:
-                if hasattr(document, 'model_dump'):
-                    doc_dict = document.model_dump()
-                elif hasattr(document, 'dict'):
-                    doc_dict = document.dict()
-                else:
-                    raise AttributeError("Document has no model_dump or dict method")
-
-                logger.debug(
-                    f"_convert_to_domain(): Successfully converted to dict with keys: {list(doc_dict.keys())}"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"_convert_to_domain(): ERROR converting document to dict: {str(e)}"
-                )
-                raise
-
-            # Convert Decimal128 values using the simple approach
-            logger.debug(f"_convert_to_domain(): Converting Decimal128 values...")
-            doc_dict = self._convert_decimal128_to_decimal_simple(doc_dict)
-            logger.debug(f"_convert_to_domain(): Decimal128 conversion completed")
-
-            # Use the existing _convert_raw_to_domain method
-            return self._convert_raw_to_domain(doc_dict)
 
         except Exception as e:
             logger.error(
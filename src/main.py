@@ -6,38 +6,28 @@ Order Generation Service. It sets up the application with all necessary middlewa
 routers, and configuration.
 """
 
+import asyncio
+import logging
 import os
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from datetime import datetime
+from functools import lru_cache
+from typing import cast
 
 import structlog
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-
-# --- OpenTelemetry Instrumentation (GlobeCo Standard) ---
-from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
-    OTLPMetricExporter as OTLPMetricExporterGRPC,
-)
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
-    OTLPSpanExporter as OTLPSpanExporterGRPC,
-)
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
-    OTLPMetricExporter as OTLPMetricExporterHTTP,
-)
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
-    OTLPSpanExporter as OTLPSpanExporterHTTP,
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.types import (
+    ASGIApp,
+    ExceptionHandler,
+    Message,
+    Receive,
+    Scope,
+    Send,
 )
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
 # Configure Prometheus multiprocess mode BEFORE importing monitoring module
 # This must happen before prometheus_client is imported anywhere
@@ -51,83 +41,146 @@ if _prometheus_multiproc_dir and not os.path.exists(_prometheus_multiproc_dir):
 
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from src.api.routers.health import router as health_router
-from src.api.routers.models import router as models_router
-from src.api.routers.rebalance import router as rebalance_router
-from src.api.routers.rebalances import router as rebalances_router
-from src.config import get_settings
+from src.config import Settings, get_settings
+from src.core.exceptions import (
+    BusinessRuleViolationError,
+    ExternalServiceError,
+    ModelNotFoundError,
+    NotFoundError,
+    OptimizationError,
+    OrderGenerationServiceError,
+    PortfolioNotFoundError,
+    ServiceException,
+    ValidationError,
+)
 from src.core.monitoring import (
     EnhancedHTTPMetricsMiddleware,
     cleanup_multiprocess_metrics,
+    registry,
     setup_monitoring,
+    update_otel_process_metrics,
 )
 from src.core.security import SecurityHeaders
 from src.core.utils import (
     configure_structured_logging,
     create_response_metadata,
+    encode_error_template,
+    format_utc_timestamp,
+    generate_correlation_id,
     get_correlation_id,
     get_logger,
+    render_error_template,
     set_correlation_id,
+    set_request_time,
 )
 
-# Set OpenTelemetry resource attributes
-resource = Resource.create(
-    {
-        "service.name": "globeco-order-generation-service",
-        # Optionally add version/namespace if desired
-        # "service.version": "0.1.0",
-        # "service.namespace": "globeco",
-    }
-)
-
-# Get settings for OpenTelemetry configuration
+# Get settings for logging configuration
 settings = get_settings()
 
-# Tracing setup (gRPC and HTTP exporters)
-trace.set_tracer_provider(TracerProvider(resource=resource))
-tracer_provider = trace.get_tracer_provider()
-tracer_provider.add_span_processor(
-    BatchSpanProcessor(
-        OTLPSpanExporterGRPC(
+# Configure structured logging early with settings
+configure_structured_logging(settings.log_level)
+logger = get_logger(__name__)
+
+
+# Set once the OpenTelemetry providers have been installed in this process
+_otel_configured = False
+
+# Scrape and probe endpoints; matched as regexes against the request URL
+_UNTRACED_URLS = "/metrics,/health"
+
+
+def _configure_opentelemetry(settings: Settings) -> None:
+    """
+    Install the OpenTelemetry tracer and meter providers (GlobeCo Standard).
+
+    The SDK and OTLP exporters are imported here rather than at module import
+    so that importing ``src.main`` stays cheap, and so that exporter threads
+    are started in each worker after forking rather than in a preloading
+    parent process.
+
+    Args:
+        settings: Application settings with the collector configuration
+    """
+    global _otel_configured
+
+    if _otel_configured or not settings.otel_enabled:
+        return
+
+    from opentelemetry import trace
+    from opentelemetry.metrics import set_meter_provider
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    # Set OpenTelemetry resource attributes
+    resource = Resource.create(
+        {
+            "service.name": "globeco-order-generation-service",
+            # Optionally add version/namespace if desired
+            # "service.version": "0.1.0",
+            # "service.namespace": "globeco",
+        }
+    )
+
+    # Export over a single OTLP protocol so each span/metric is encoded once
+    if settings.otel_protocol == "http":
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+            OTLPMetricExporter,
+        )
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        span_exporter = OTLPSpanExporter(
+            endpoint=f"{settings.otel_collector_http_endpoint}/v1/traces"
+        )
+        metric_exporter = OTLPMetricExporter(
+            endpoint=f"{settings.otel_collector_http_endpoint}/v1/metrics"
+        )
+    else:
+        from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+            OTLPMetricExporter,
+        )
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        span_exporter = OTLPSpanExporter(
             endpoint=settings.otel_collector_grpc_endpoint,
             insecure=settings.otel_insecure,
         )
+        metric_exporter = OTLPMetricExporter(
+            endpoint=settings.otel_collector_grpc_endpoint,
+            insecure=settings.otel_insecure,
+        )
+
+    # Tracing setup
+    tracer_provider = TracerProvider(
+        resource=resource,
+        sampler=ParentBased(TraceIdRatioBased(settings.otel_sample_ratio)),
     )
-)
-tracer_provider.add_span_processor(
-    BatchSpanProcessor(
-        OTLPSpanExporterHTTP(
-            endpoint=f"{settings.otel_collector_http_endpoint}/v1/traces"
+    tracer_provider.add_span_processor(
+        BatchSpanProcessor(
+            span_exporter,
+            max_queue_size=4096,
+            max_export_batch_size=1024,
+            schedule_delay_millis=5000,
         )
     )
-)
-
-# Metrics setup (gRPC and HTTP exporters)
-from opentelemetry.metrics import set_meter_provider
+    trace.set_tracer_provider(tracer_provider)
 
-meter_provider = MeterProvider(
-    resource=resource,
-    metric_readers=[
-        PeriodicExportingMetricReader(
-            OTLPMetricExporterGRPC(
-                endpoint=settings.otel_collector_grpc_endpoint,
-                insecure=settings.otel_insecure,
-            )
-        ),
-        PeriodicExportingMetricReader(
-            OTLPMetricExporterHTTP(
-                endpoint=f"{settings.otel_collector_http_endpoint}/v1/metrics"
-            )
-        ),
-    ],
-)
-set_meter_provider(meter_provider)
+    # Metrics setup
+    set_meter_provider(
+        MeterProvider(
+            resource=resource,
+            metric_readers=[PeriodicExportingMetricReader(metric_exporter)],
+        )
+    )
 
-# --- End OpenTelemetry Instrumentation ---
-
-# Configure structured logging early with settings
-configure_structured_logging(settings.log_level)
-logger = get_logger(__name__)
+    _otel_configured = True
 
 
 @asynccontextmanager
@@ -142,6 +195,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         None: Control back to the application
     """
     settings = get_settings()
+
+    # Install OpenTelemetry providers before serving any requests
+    _configure_opentelemetry(settings)
+
     logger.info(
         "Starting application",
         service=settings.service_name,
@@ -152,6 +209,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
     # Startup logic
     logger.info("Initializing database connections...")
+    # Beanie/Motor and the document models are imported here, once per
+    # process, so that importing src.main stays cheap
     from src.infrastructure.database.database import db_manager, init_database
 
     try:
@@ -170,10 +229,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     logger.info("External service clients configured via dependency injection")
 
     # Start background task for process metrics updates
-    import asyncio
-
-    from src.core.monitoring import update_otel_process_metrics
-
     async def update_metrics_periodically():
         """Background task to update process metrics every 30 seconds."""
         while True:
@@ -216,86 +271,183 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     logger.info("Application shutdown completed")
 
 
-async def correlation_middleware(request: Request, call_next):
-    """
-    Middleware to handle correlation IDs for request tracing.
+# Security headers encoded once as raw ASGI header tuples
+_SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in SecurityHeaders.get_default_headers().items()
+]
+# Response headers owned by ContextAndHeadersMiddleware
+_MANAGED_HEADER_NAMES = frozenset(
+    [b"x-correlation-id", *(name for name, _ in _SECURITY_HEADERS)]
+)
 
-    Args:
-        request: The incoming request
-        call_next: The next middleware/endpoint to call
+# Special CSP for Swagger UI endpoints to allow external resources
+_SWAGGER_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
+    "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
+    "img-src 'self' data: https:; "
+    "font-src 'self' https://cdn.jsdelivr.net https://unpkg.com;"
+)
+_SWAGGER_SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
+    (
+        (name, _SWAGGER_CSP.encode("latin-1"))
+        if name == b"content-security-policy"
+        else (name, value)
+    )
+    for name, value in _SECURITY_HEADERS
+]
+_SWAGGER_PATHS = frozenset({"/docs", "/redoc"})
+_SWAGGER_PATH_PREFIXES = ("/docs/", "/redoc/")
 
-    Returns:
-        Response with correlation ID header
+
+class ContextAndHeadersMiddleware:
+    """
+    Pure ASGI middleware for correlation IDs and security headers.
+
+    Reads the correlation ID straight from the raw ASGI headers, stores it in
+    the request context, and on ``http.response.start`` rewrites the response
+    headers once: the correlation ID and the precomputed security headers
+    replace any existing values with the same names. Doing both in one
+    ``send`` wrapper avoids a second closure and header pass per request. The
+    relaxed Swagger CSP is only considered when the docs endpoints are enabled.
     """
-    # Extract correlation ID from headers or generate new one
-    correlation_id = request.headers.get("X-Correlation-ID")
-    if not correlation_id:
-        from src.core.utils import generate_correlation_id
-
-        correlation_id = generate_correlation_id()
-
-    # Set correlation ID in context
-    set_correlation_id(correlation_id)
-
-    # Log request
-    logger.debug(
-        "Request received",
-        method=request.method,
-        url=str(request.url),
-        client_ip=request.client.host if request.client else None,
-    )
 
-    # Process request
-    response = await call_next(request)
+    def __init__(self, app: ASGIApp, docs_enabled: bool = True) -> None:
+        self.app = app
+        self.docs_enabled = docs_enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Extract correlation ID from headers or generate new one
+        correlation_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-correlation-id":
+                correlation_id = value.decode("latin-1")
+                break
+        if not correlation_id:
+            correlation_id = generate_correlation_id()
+
+        # Set correlation ID and request time in context
+        set_correlation_id(correlation_id)
+        set_request_time()
+
+        path = scope["path"]
+        if self.docs_enabled and (
+            path in _SWAGGER_PATHS or path.startswith(_SWAGGER_PATH_PREFIXES)
+        ):
+            security_headers = _SWAGGER_SECURITY_HEADERS
+        else:
+            security_headers = _SECURITY_HEADERS
+        added_headers = [
+            (b"x-correlation-id", correlation_id.encode("latin-1")),
+            *security_headers,
+        ]
+
+        # Only pay for request details and timing when debug logging is on
+        debug_enabled = logger.is_enabled_for(logging.DEBUG)
+        if debug_enabled:
+            method = scope["method"]
+            client = scope.get("client")
+            start_time = time.perf_counter()
+
+            # Log request
+            logger.debug(
+                "Request received",
+                method=method,
+                path=path,
+                query=scope["query_string"].decode("latin-1"),
+                client_ip=client[0] if client else None,
+            )
 
-    # Add correlation ID to response headers
-    response.headers["X-Correlation-ID"] = correlation_id
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    header
+                    for header in message.get("headers", [])
+                    if header[0].lower() not in _MANAGED_HEADER_NAMES
+                ]
+                headers.extend(added_headers)
+                message["headers"] = headers
+
+                # Log response
+                if debug_enabled:
+                    logger.debug(
+                        "Request completed",
+                        method=method,
+                        path=path,
+                        status_code=message["status"],
+                        duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+# Pre-encoded bodies for error paths that can fire in bursts (outages, timeouts)
+_INTERNAL_ERROR_TEMPLATE = encode_error_template(
+    "INTERNAL_SERVER_ERROR", "An unexpected error occurred"
+)
+_SERVICE_TIMEOUT_TEMPLATE = encode_error_template(
+    "SERVICE_TIMEOUT", "Request timed out"
+)
 
-    # Log response
-    logger.debug(
-        "Request completed",
-        method=request.method,
-        url=str(request.url),
-        status_code=response.status_code,
-    )
+# The two domain exception bases; both carry error_code, message and details
+_DomainException = ServiceException | OrderGenerationServiceError
 
-    return response
+# Domain exception -> (HTTP status, log level, log message)
+_DOMAIN_EXCEPTION_HANDLERS: list[tuple[type[_DomainException], int, str, str]] = [
+    (NotFoundError, 404, "warning", "Resource not found"),
+    (ModelNotFoundError, 404, "warning", "Model not found"),
+    (PortfolioNotFoundError, 404, "warning", "Portfolio not found"),
+    (ValidationError, 400, "warning", "Validation error"),
+    (BusinessRuleViolationError, 409, "warning", "Business rule violation"),
+    (OptimizationError, 422, "error", "Optimization error"),
+    (ExternalServiceError, 503, "error", "External service error"),
+]
 
 
-async def security_headers_middleware(request: Request, call_next):
+def _make_domain_exception_handler(
+    status_code: int, log_level: str, log_message: str
+) -> Callable[[Request, _DomainException], Awaitable[ORJSONResponse]]:
     """
-    Middleware to add security headers to responses.
+    Build an exception handler for a domain-specific exception.
 
     Args:
-        request: The incoming request
-        call_next: The next middleware/endpoint to call
+        status_code: HTTP status code to return
+        log_level: Logger method name used to record the error
+        log_message: Log event message
 
     Returns:
-        Response with security headers
+        Async exception handler producing the standard error envelope
     """
-    response = await call_next(request)
-
-    # Add security headers
-    security_headers = SecurityHeaders.get_default_headers()
-
-    # Special CSP for Swagger UI endpoints to allow external resources
-    if (
-        request.url.path in ["/docs", "/redoc"]
-        or request.url.path.startswith("/docs/")
-        or request.url.path.startswith("/redoc/")
-    ):
-        security_headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
-            "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
-            "img-src 'self' data: https:; "
-            "font-src 'self' https://cdn.jsdelivr.net https://unpkg.com;"
+
+    async def domain_exception_handler(
+        request: Request, exc: _DomainException
+    ) -> ORJSONResponse:
+        getattr(logger, log_level)(
+            log_message,
+            error_code=exc.error_code,
+            message=exc.message,
+            details=exc.details,
         )
 
-    for header_name, header_value in security_headers.items():
-        response.headers[header_name] = header_value
+        return ORJSONResponse(
+            status_code=status_code,
+            content={
+                "error": {
+                    "code": exc.error_code,
+                    "message": exc.message,
+                    "details": exc.details,
+                    **create_response_metadata(),
+                }
+            },
+        )
 
-    return response
+    return domain_exception_handler
 
 
 def create_app() -> FastAPI:
@@ -305,32 +457,45 @@ def create_app() -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application instance
     """
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+
+    from src.api.routers.health import router as health_router
+    from src.api.routers.models import router as models_router
+    from src.api.routers.rebalance import router as rebalance_router
+    from src.api.routers.rebalances import router as rebalances_router
+
     settings = get_settings()
 
     app = FastAPI(
         title=settings.service_name,
         description="Portfolio optimization and order generation microservice for the GlobeCo Suite",
         version=settings.version,
-        docs_url="/docs",
-        redoc_url="/redoc",
-        openapi_url="/openapi.json",
+        # API docs and the OpenAPI schema are only served in debug builds
+        docs_url="/docs" if settings.debug else None,
+        redoc_url="/redoc" if settings.debug else None,
+        openapi_url="/openapi.json" if settings.debug else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
-    # Instrument FastAPI, HTTPX, and logging for OpenTelemetry
-    FastAPIInstrumentor().instrument_app(app)
+    # Instrument FastAPI, HTTPX, and logging for OpenTelemetry. Per-request
+    # server spans are optional; RED metrics come from the metrics middleware
+    if settings.otel_enabled and settings.tracing_enabled:
+        FastAPIInstrumentor().instrument_app(app, excluded_urls=_UNTRACED_URLS)
     HTTPXClientInstrumentor().instrument()
-    LoggingInstrumentor().instrument(set_logging_format=True)
+    # Trace context reaches structlog events via add_otel_context; leave the
+    # stdlib log format alone
+    LoggingInstrumentor().instrument(set_logging_format=False)
 
     # Add Prometheus /metrics endpoint (OpenTelemetry standard)
     @app.get("/metrics")
     async def metrics():
         """Prometheus metrics endpoint."""
-        from fastapi import Response
-
-        from src.core.monitoring import registry
-
-        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+        # Rendering walks every metric, so keep it off the event loop
+        data = await run_in_threadpool(generate_latest, registry)
+        return Response(data, media_type=CONTENT_TYPE_LATEST)
 
     # CORS middleware (first in stack)
     app.add_middleware(
@@ -344,8 +509,7 @@ def create_app() -> FastAPI:
     # Add custom middleware
     if settings.enable_metrics:
         app.add_middleware(EnhancedHTTPMetricsMiddleware)
-    app.middleware("http")(correlation_middleware)
-    app.middleware("http")(security_headers_middleware)
+    app.add_middleware(ContextAndHeadersMiddleware, docs_enabled=settings.debug)
 
     # Setup monitoring and observability
     if settings.enable_metrics:
@@ -372,12 +536,12 @@ def create_app() -> FastAPI:
 
         # Special handling for health check endpoints
         if request.url.path.startswith("/health"):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={
                     "status": "not_ready",
                     "service": "GlobeCo Order Generation Service",
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
+                    "timestamp": format_utc_timestamp() + "Z",
                     "correlation_id": get_correlation_id(),
                     "error": {
                         "code": "TIMEOUT",
@@ -387,15 +551,10 @@ def create_app() -> FastAPI:
             )
 
         # For non-health endpoints, return generic service unavailable
-        return JSONResponse(
+        return Response(
+            content=render_error_template(_SERVICE_TIMEOUT_TEMPLATE),
             status_code=503,
-            content={
-                "error": {
-                    "code": "SERVICE_TIMEOUT",
-                    "message": "Request timed out",
-                    **create_response_metadata(),
-                }
-            },
+            media_type="application/json",
         )
 
     @app.exception_handler(Exception)
@@ -410,195 +569,54 @@ def create_app() -> FastAPI:
             exc_info=True,
         )
 
-        return JSONResponse(
+        return Response(
+            content=render_error_template(_INTERNAL_ERROR_TEMPLATE),
             status_code=500,
-            content={
-                "error": {
-                    "code": "INTERNAL_SERVER_ERROR",
-                    "message": "An unexpected error occurred",
-                    **create_response_metadata(),
-                }
-            },
+            media_type="application/json",
         )
 
     # Custom exception handlers for domain-specific exceptions
-    from src.core.exceptions import (
-        BusinessRuleViolationError,
-        ExternalServiceError,
-        ModelNotFoundError,
-        NotFoundError,
-        OptimizationError,
-        PortfolioNotFoundError,
-        ValidationError,
-    )
-
-    @app.exception_handler(NotFoundError)
-    async def not_found_exception_handler(request: Request, exc: NotFoundError):
-        """Handle not found errors."""
-        logger.warning(
-            "Resource not found",
-            error_code=exc.error_code,
-            message=exc.message,
-            details=exc.details,
-        )
-
-        return JSONResponse(
-            status_code=404,
-            content={
-                "error": {
-                    "code": exc.error_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                    **create_response_metadata(),
-                }
-            },
-        )
-
-    @app.exception_handler(ModelNotFoundError)
-    async def model_not_found_exception_handler(
-        request: Request, exc: ModelNotFoundError
-    ):
-        """Handle model not found errors."""
-        logger.warning(
-            "Model not found",
-            error_code=exc.error_code,
-            message=exc.message,
-            details=exc.details,
-        )
-
-        return JSONResponse(
-            status_code=404,
-            content={
-                "error": {
-                    "code": exc.error_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                    **create_response_metadata(),
-                }
-            },
-        )
-
-    @app.exception_handler(PortfolioNotFoundError)
-    async def portfolio_not_found_exception_handler(
-        request: Request, exc: PortfolioNotFoundError
-    ):
-        """Handle portfolio not found errors."""
-        logger.warning(
-            "Portfolio not found",
-            error_code=exc.error_code,
-            message=exc.message,
-            details=exc.details,
-        )
-
-        return JSONResponse(
-            status_code=404,
-            content={
-                "error": {
-                    "code": exc.error_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                    **create_response_metadata(),
-                }
-            },
-        )
-
-    @app.exception_handler(ValidationError)
-    async def validation_exception_handler(request: Request, exc: ValidationError):
-        """Handle validation errors."""
-        logger.warning(
-            "Validation error",
-            error_code=exc.error_code,
-            message=exc.message,
-            details=exc.details,
-        )
-
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error": {
-                    "code": exc.error_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                    **create_response_metadata(),
-                }
-            },
+    # Starlette types handlers as taking any Exception, but only dispatches
+    # instances of the registered class to them
+    for exc_class, status_code, log_level, log_message in _DOMAIN_EXCEPTION_HANDLERS:
+        app.add_exception_handler(
+            exc_class,
+            cast(
+                ExceptionHandler,
+                _make_domain_exception_handler(status_code, log_level, log_message),
+            ),
         )
 
-    @app.exception_handler(BusinessRuleViolationError)
-    async def business_rule_exception_handler(
-        request: Request, exc: BusinessRuleViolationError
-    ):
-        """Handle business rule violations."""
-        logger.warning(
-            "Business rule violation",
-            error_code=exc.error_code,
-            message=exc.message,
-            details=exc.details,
-        )
-
-        return JSONResponse(
-            status_code=409,
-            content={
-                "error": {
-                    "code": exc.error_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                    **create_response_metadata(),
-                }
-            },
-        )
+    return app
 
-    @app.exception_handler(OptimizationError)
-    async def optimization_exception_handler(request: Request, exc: OptimizationError):
-        """Handle optimization errors."""
-        logger.error(
-            "Optimization error",
-            error_code=exc.error_code,
-            message=exc.message,
-            details=exc.details,
-        )
 
-        return JSONResponse(
-            status_code=422,
-            content={
-                "error": {
-                    "code": exc.error_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                    **create_response_metadata(),
-                }
-            },
-        )
+@lru_cache(maxsize=1)
+def get_app() -> FastAPI:
+    """
+    Get the process-wide application instance, building it on first use.
 
-    @app.exception_handler(ExternalServiceError)
-    async def external_service_exception_handler(
-        request: Request, exc: ExternalServiceError
-    ):
-        """Handle external service errors."""
-        logger.error(
-            "External service error",
-            error_code=exc.error_code,
-            message=exc.message,
-            details=exc.details,
-        )
+    ``main()`` serves this through uvicorn's factory mode, so each worker or
+    reloaded process builds exactly one app.
 
-        return JSONResponse(
-            status_code=503,
-            content={
-                "error": {
-                    "code": exc.error_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                    **create_response_metadata(),
-                }
-            },
-        )
+    Returns:
+        The configured FastAPI application
+    """
+    return create_app()
 
-    return app
 
+def __getattr__(name: str):
+    """
+    Resolve the module-level ``app`` lazily (PEP 562).
 
-# Create the application instance
-app = create_app()
+    ``uvicorn src.main:app`` and ``gunicorn src.main:app`` still resolve the
+    application, while a plain ``import src.main`` does not pay for importing
+    every router and building the app.
+    """
+    if name == "app":
+        application = get_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
@@ -612,11 +630,23 @@ def main() -> None:
 
     settings = get_settings()
 
+    # Reload mode runs a single supervised process, so it excludes workers
+    if settings.debug:
+        workers = None
+    else:
+        workers = settings.workers or (os.cpu_count() or 1)
+
     uvicorn.run(
-        "src.main:app",
+        "src.main:get_app",
+        factory=True,
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_config=None,
         log_level=settings.log_level.lower(),
     )
 
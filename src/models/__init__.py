@@ -2,17 +2,35 @@
 Database models package for MongoDB persistence.
 
 This package contains Beanie ODM document models for MongoDB collections.
+Exports are resolved lazily (PEP 562), so importing one document module does
+not also build the Pydantic schemas of the other.
 """
 
-from .model import ModelDocument, PositionEmbedded
-from .rebalance import PortfolioEmbedded
-from .rebalance import PositionEmbedded as RebalancePositionEmbedded
-from .rebalance import RebalanceDocument
-
-__all__ = [
-    "ModelDocument",
-    "PositionEmbedded",
-    "RebalanceDocument",
-    "PortfolioEmbedded",
-    "RebalancePositionEmbedded",
-]
+from importlib import import_module
+from typing import Any
+
+# Exported name -> (submodule, attribute)
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "ModelDocument": (".model", "ModelDocument"),
+    "PositionEmbedded": (".model", "PositionEmbedded"),
+    "RebalanceDocument": (".rebalance", "RebalanceDocument"),
+    "PortfolioEmbedded": (".rebalance", "PortfolioEmbedded"),
+    "RebalancePositionEmbedded": (".rebalance", "PositionEmbedded"),
+}
+
+__all__ = tuple(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported model from its submodule on first access."""
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
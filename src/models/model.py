@@ -5,68 +5,92 @@ This module defines the MongoDB document structure using Beanie ODM
 for investment models and their associated positions.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, List, Mapping, Optional
 
 from beanie import Document
 from bson import Decimal128, ObjectId
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 from pymongo import IndexModel
 
+from src.core.utils import utc_now
 from src.domain.entities.model import InvestmentModel
 from src.domain.entities.position import Position
 from src.domain.value_objects.drift_bounds import DriftBounds
 from src.domain.value_objects.target_percentage import TargetPercentage
 
 
+def _decimal128_to_decimal(value: Any) -> Any:
+    """Convert a Decimal128 read from MongoDB to Decimal, passing others through."""
+    return value.to_decimal() if isinstance(value, Decimal128) else value
+
+
+_DECIMAL_FIELDS = ('target', 'high_drift', 'low_drift')
+_ZERO = Decimal(0)
+_MAX_TOTAL_TARGET = Decimal('0.95')
+
+
+@lru_cache(maxsize=1024)
+def _decimal128_from_str(value: str) -> Decimal128:
+    """Build a Decimal128 for storage, reusing it across saves.
+
+    Targets and drifts take few distinct values, and building a Decimal128
+    costs far more than the str() key. Decimal128 is immutable, so cached
+    values are safe to share.
+    """
+    return Decimal128(value)
+
+
 class PositionEmbedded(BaseModel):
     """Embedded document for position data within investment models."""
 
+    # Frozen so instances built by from_domain_position can be shared between
+    # documents through the position cache
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         str_strip_whitespace=True,
+        frozen=True,
     )
 
-    security_id: str = Field(..., description="24-character security identifier")
-    target: Decimal = Field(..., description="Target allocation percentage (0-0.95)")
-    high_drift: Decimal = Field(..., description="Upper drift tolerance (0-1)")
-    low_drift: Decimal = Field(..., description="Lower drift tolerance (0-1)")
-
-    @field_validator('security_id')
-    @classmethod
-    def validate_security_id_format(cls, v):
-        """Validate security ID format (24 alphanumeric characters)."""
-        if not isinstance(v, str) or len(v) != 24 or not v.isalnum():
-            raise ValueError("Security ID must be exactly 24 alphanumeric characters")
-        return v
-
-    @field_validator('target', 'high_drift', 'low_drift', mode='before')
-    @classmethod
-    def validate_decimal_fields(cls, v):
-        """Convert Decimal128 to Decimal and validate ranges."""
-        # Convert Decimal128 to Decimal if needed
-        if isinstance(v, Decimal128):
-            v = v.to_decimal()
-        elif isinstance(v, (int, float, str)):
-            v = Decimal(str(v))
-        return v
-
-    @field_validator('target')
-    @classmethod
-    def validate_target_range(cls, v):
-        """Validate target percentage is within acceptable range."""
-        if not (Decimal('0') <= v <= Decimal('0.95')):
-            raise ValueError("Target must be between 0 and 0.95 (95%)")
-        return v
+    # Format and range checks are schema constraints, enforced by pydantic-core
+    # in the same pass that builds the model; only the Decimal128 conversion
+    # and the cross-field drift check run as Python validators
+    security_id: str = Field(
+        ...,
+        pattern=r'^[A-Za-z0-9]{24}$',
+        description="24-character security identifier",
+    )
+    target: Decimal = Field(
+        ..., ge=0, le=_MAX_TOTAL_TARGET, description="Target allocation percentage"
+    )
+    high_drift: Decimal = Field(..., ge=0, le=1, description="Upper drift tolerance")
+    low_drift: Decimal = Field(..., ge=0, le=1, description="Lower drift tolerance")
 
-    @field_validator('high_drift', 'low_drift')
+    @model_validator(mode='before')
     @classmethod
-    def validate_drift_range(cls, v):
-        """Validate drift values are within acceptable range."""
-        if not (Decimal('0') <= v <= Decimal('1')):
-            raise ValueError("Drift values must be between 0 and 1")
-        return v
+    def validate_decimal_fields(cls, data):
+        """Convert Decimal128, int, float and str values to Decimal in one pass."""
+        if not isinstance(data, dict):
+            return data
+
+        converted = {}
+        for key in _DECIMAL_FIELDS:
+            value = data.get(key)
+            if isinstance(value, Decimal128):
+                converted[key] = value.to_decimal()
+            elif isinstance(value, (int, float, str)):
+                converted[key] = Decimal(str(value))
+        # Leave the caller's dict untouched
+        return {**data, **converted} if converted else data
 
     @field_validator('high_drift')
     @classmethod
@@ -79,41 +103,107 @@ class PositionEmbedded(BaseModel):
     @field_serializer('target', 'high_drift', 'low_drift')
     def serialize_decimal_fields(self, value: Decimal) -> Decimal128:
         """Serialize Decimal fields to Decimal128 for MongoDB storage."""
-        return Decimal128(str(value))
+        return _decimal128_from_str(str(value))
+
+    @classmethod
+    def from_mongo_trusted(cls, raw: Mapping[str, Any]) -> 'PositionEmbedded':
+        """Build from a stored subdocument without re-running validation.
+
+        Stored positions were validated on write, so only the Decimal128
+        values are converted.
+        """
+        return cls.model_construct(
+            **{key: _decimal128_to_decimal(value) for key, value in raw.items()}
+        )
 
     def to_domain_position(self) -> Position:
-        """Convert embedded document to domain Position entity."""
-        return Position(
-            security_id=self.security_id,
-            target=TargetPercentage(self.target),
-            drift_bounds=DriftBounds(
-                low_drift=self.low_drift, high_drift=self.high_drift
-            ),
+        """Convert embedded document to domain Position entity.
+
+        Domain positions are immutable, so equal positions read from any
+        document share one validated instance.
+        """
+        return _build_domain_position(
+            self.security_id,
+            str(self.target),
+            str(self.high_drift),
+            str(self.low_drift),
         )
 
     @classmethod
     def from_domain_position(cls, position: Position) -> 'PositionEmbedded':
-        """Create embedded document from domain Position entity."""
-        return cls(
-            security_id=position.security_id,
-            target=position.target.value,
-            high_drift=position.drift_bounds.high_drift,
-            low_drift=position.drift_bounds.low_drift,
+        """Create embedded document from domain Position entity.
+
+        Identical positions are re-saved with every model update, so the
+        validated embedded documents are memoized by position value.
+        """
+        return _build_position_embedded(
+            position.security_id,
+            str(position.target.value),
+            str(position.drift_bounds.high_drift),
+            str(position.drift_bounds.low_drift),
         )
 
 
+@lru_cache(maxsize=4096)
+def _build_position_embedded(
+    security_id: str, target: str, high_drift: str, low_drift: str
+) -> PositionEmbedded:
+    """Build a validated PositionEmbedded from position field values.
+
+    Decimals are keyed by their string form: Decimal('0.1') and
+    Decimal('0.10') hash equal but are stored differently.
+    """
+    return PositionEmbedded(
+        security_id=security_id,
+        target=target,
+        high_drift=high_drift,
+        low_drift=low_drift,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _build_domain_position(
+    security_id: str, target: str, high_drift: str, low_drift: str
+) -> Position:
+    """Build a validated domain Position from stored position values.
+
+    Keyed by string form like _build_position_embedded; Decimal(str(d))
+    round-trips the original representation.
+    """
+    return Position(
+        security_id=security_id,
+        target=TargetPercentage(Decimal(target)),
+        drift_bounds=DriftBounds(
+            low_drift=Decimal(low_drift), high_drift=Decimal(high_drift)
+        ),
+    )
+
+
+class ModelIdProjection(BaseModel):
+    """Projection of a model document onto its ID, for ID-only queries."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    id: ObjectId = Field(..., alias="_id")
+
+
 class ModelDocument(Document):
     """MongoDB document model for investment models using Beanie ODM."""
 
+    # Assignment is left unvalidated on purpose: fields are only reassigned
+    # from already validated domain entities, and validating would re-run the
+    # list validators over every position on each update
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         str_strip_whitespace=True,
+        validate_assignment=False,
     )
 
     # Use ObjectId for _id field
     id: Optional[ObjectId] = Field(default_factory=ObjectId, alias="_id")
 
-    name: str = Field(..., description="Unique model name")
+    # str_strip_whitespace strips name before min_length applies
+    name: str = Field(..., min_length=1, description="Unique model name")
     positions: List[PositionEmbedded] = Field(
         default_factory=list, description="List of security positions"
     )
@@ -123,55 +213,42 @@ class ModelDocument(Document):
     last_rebalance_date: Optional[datetime] = Field(
         None, description="Last rebalancing timestamp"
     )
-    version: int = Field(default=1, description="Version for optimistic locking")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    @field_validator('name')
-    @classmethod
-    def validate_name_not_empty(cls, v):
-        """Validate model name is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Model name cannot be empty")
-        return v.strip()
+    version: int = Field(default=1, ge=1, description="Version for optimistic locking")
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
     @field_validator('positions')
     @classmethod
-    def validate_position_targets_sum(cls, v):
-        """Validate position targets sum to <= 0.95."""
+    def validate_positions(cls, v):
+        """
+        Validate position targets sum to <= 0.95, at most 100 non-zero
+        positions, and no duplicate securities, in a single pass.
+        """
         if not v:
             return v
 
-        total_target = sum(pos.target for pos in v)
-        if total_target > Decimal('0.95'):
+        total_target = _ZERO
+        non_zero_count = 0
+        security_ids = set()
+        has_duplicates = False
+        for pos in v:
+            target = pos.target
+            total_target += target
+            if target > 0:
+                non_zero_count += 1
+            if pos.security_id in security_ids:
+                has_duplicates = True
+            security_ids.add(pos.security_id)
+
+        if total_target > _MAX_TOTAL_TARGET:
             raise ValueError(
                 f"Position targets sum {total_target} exceeds maximum 0.95"
             )
-        return v
-
-    @field_validator('positions')
-    @classmethod
-    def validate_position_count(cls, v):
-        """Validate maximum 100 positions with non-zero targets."""
-        if not v:
-            return v
-
-        non_zero_positions = [pos for pos in v if pos.target > 0]
-        if len(non_zero_positions) > 100:
+        if non_zero_count > 100:
             raise ValueError(
-                f"Maximum 100 non-zero positions allowed, got {len(non_zero_positions)}"
+                f"Maximum 100 non-zero positions allowed, got {non_zero_count}"
             )
-        return v
-
-    @field_validator('positions')
-    @classmethod
-    def validate_unique_securities(cls, v):
-        """Validate no duplicate securities in positions."""
-        if not v:
-            return v
-
-        security_ids = [pos.security_id for pos in v]
-        if len(security_ids) != len(set(security_ids)):
+        if has_duplicates:
             raise ValueError("Duplicate securities not allowed in model")
         return v
 
@@ -179,17 +256,28 @@ class ModelDocument(Document):
     @classmethod
     def validate_unique_portfolios(cls, v):
         """Validate no duplicate portfolios."""
-        if len(v) != len(set(v)):
-            raise ValueError("Duplicate portfolios not allowed")
+        seen: set[str] = set()
+        add = seen.add
+        for portfolio_id in v:
+            if portfolio_id in seen:
+                raise ValueError("Duplicate portfolios not allowed")
+            add(portfolio_id)
         return v
 
-    @field_validator('version')
     @classmethod
-    def validate_version_positive(cls, v):
-        """Validate version is positive."""
-        if v < 1:
-            raise ValueError("Version must be positive")
-        return v
+    def from_mongo_trusted(cls, raw: Mapping[str, Any]) -> 'ModelDocument':
+        """Build from a stored MongoDB document without re-running validation.
+
+        For read-only paths over documents that were validated on write.
+        """
+        data: dict[str, Any] = dict(raw)
+        data['positions'] = [
+            PositionEmbedded.from_mongo_trusted(position)
+            for position in raw.get('positions', [])
+        ]
+        # Beanie types model_construct as returning Any
+        document: ModelDocument = cls.model_construct(**data)
+        return document
 
     def to_domain_model(self) -> InvestmentModel:
         """Convert document to domain InvestmentModel entity."""
@@ -214,7 +302,7 @@ class ModelDocument(Document):
             portfolios=model.portfolios.copy(),
             last_rebalance_date=model.last_rebalance_date,
             version=model.version,
-            updated_at=datetime.now(timezone.utc),
+            updated_at=utc_now(),
         )
 
     def update_from_domain_model(self, model: InvestmentModel) -> None:
@@ -226,7 +314,7 @@ class ModelDocument(Document):
         self.portfolios = model.portfolios.copy()
         self.last_rebalance_date = model.last_rebalance_date
         self.version = model.version
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = utc_now()
 
     class Settings:
         """Beanie document settings."""
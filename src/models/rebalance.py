@@ -6,15 +6,58 @@ for storing rebalance results with a three-level structure:
 Rebalance → Portfolio → Position
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, List, Literal, Mapping, Optional
 
 from beanie import Document
 from bson import Decimal128, ObjectId
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pymongo import IndexModel
 
+from src.core.utils import utc_now
+
+
+_POSITION_DECIMAL_FIELDS = (
+    'price',
+    'original_quantity',
+    'adjusted_quantity',
+    'original_position_market_value',
+    'adjusted_position_market_value',
+    'target',
+    'high_drift',
+    'low_drift',
+    'actual',
+    'actual_drift',
+)
+_PORTFOLIO_DECIMAL_FIELDS = (
+    'market_value',
+    'cash_before_rebalance',
+    'cash_after_rebalance',
+)
+
+
+def _decimal128_to_decimal(value: Any) -> Any:
+    """Convert a Decimal128 read from MongoDB to Decimal, passing others through."""
+    return value.to_decimal() if isinstance(value, Decimal128) else value
+
+
+def _convert_decimal128_fields(data: Any, fields: tuple[str, ...]) -> Any:
+    """Convert the named Decimal128 values of raw model input in one pass.
+
+    Returns a new dict when anything was converted, leaving the caller's
+    data untouched.
+    """
+    if not isinstance(data, dict):
+        return data
+
+    converted = {
+        key: data[key].to_decimal()
+        for key in fields
+        if isinstance(data.get(key), Decimal128)
+    }
+    return {**data, **converted} if converted else data
+
 
 class PositionEmbedded(BaseModel):
     """Embedded document for position data within rebalance results."""
@@ -22,100 +65,52 @@ class PositionEmbedded(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         str_strip_whitespace=True,
+        frozen=True,
     )
 
-    security_id: str = Field(..., description="Security identifier")
-    price: Decimal = Field(..., description="Price used for the rebalance")
-    original_quantity: Decimal = Field(..., description="Original value of u")
-    adjusted_quantity: Decimal = Field(..., description="New value of u'")
+    # Format, range and enum checks are schema constraints enforced by
+    # pydantic-core; only the Decimal128 conversion runs as a Python validator
+    security_id: str = Field(
+        ..., pattern=r'^[A-Za-z0-9]{24}$', description="Security identifier"
+    )
+    price: Decimal = Field(..., ge=0, description="Price used for the rebalance")
+    original_quantity: Decimal = Field(..., ge=0, description="Original value of u")
+    adjusted_quantity: Decimal = Field(..., ge=0, description="New value of u'")
     original_position_market_value: Decimal = Field(
-        ..., description="Original quantity times price"
+        ..., ge=0, description="Original quantity times price"
     )
     adjusted_position_market_value: Decimal = Field(
-        ..., description="Adjusted quantity times price"
+        ..., ge=0, description="Adjusted quantity times price"
     )
-    target: Decimal = Field(..., description="Target from the model")
-    high_drift: Decimal = Field(..., description="High drift from the model")
-    low_drift: Decimal = Field(..., description="Low drift from the model")
-    actual: Decimal = Field(..., description="(u' * p) / MV")
+    target: Decimal = Field(..., ge=0, description="Target from the model")
+    high_drift: Decimal = Field(..., ge=0, description="High drift from the model")
+    low_drift: Decimal = Field(..., ge=0, description="Low drift from the model")
+    actual: Decimal = Field(..., ge=0, description="(u' * p) / MV")
     actual_drift: Decimal = Field(..., description="(actual/target) - 1")
-    transaction_type: Optional[str] = Field(
+    transaction_type: Optional[Literal['BUY', 'SELL']] = Field(
         None, description="'BUY' or 'SELL' or None if no transaction"
     )
     trade_quantity: Optional[int] = Field(
-        None, description="Positive quantity to BUY or SELL"
+        None, gt=0, description="Positive quantity to BUY or SELL"
     )
     trade_date: Optional[datetime] = Field(None, description="Current date (no time)")
 
-    @field_validator(
-        'price',
-        'original_quantity',
-        'adjusted_quantity',
-        'original_position_market_value',
-        'adjusted_position_market_value',
-        'target',
-        'high_drift',
-        'low_drift',
-        'actual',
-        'actual_drift',
-        mode='before',
-    )
+    @model_validator(mode='before')
     @classmethod
-    def convert_decimal128_to_decimal(cls, v):
+    def convert_decimal128_to_decimal(cls, data):
         """Convert Decimal128 from MongoDB to Python Decimal."""
-        if isinstance(v, Decimal128):
-            return Decimal(str(v))
-        return v
-
-    @field_validator('security_id')
-    @classmethod
-    def validate_security_id_format(cls, v):
-        """Validate security ID format (24 alphanumeric characters)."""
-        if not isinstance(v, str) or len(v) != 24 or not v.isalnum():
-            raise ValueError("Security ID must be exactly 24 alphanumeric characters")
-        return v
+        return _convert_decimal128_fields(data, _POSITION_DECIMAL_FIELDS)
 
-    @field_validator('transaction_type')
     @classmethod
-    def validate_transaction_type(cls, v):
-        """Validate transaction type is BUY or SELL."""
-        if v is not None and v not in ('BUY', 'SELL'):
-            raise ValueError("Transaction type must be 'BUY' or 'SELL'")
-        return v
+    def from_mongo_trusted(cls, raw: Mapping[str, Any]) -> 'PositionEmbedded':
+        """Build from a stored subdocument without re-running validation.
 
-    @field_validator(
-        'price',
-        'original_quantity',
-        'adjusted_quantity',
-        'original_position_market_value',
-        'adjusted_position_market_value',
-        'target',
-        'high_drift',
-        'low_drift',
-        'actual',
-    )
-    @classmethod
-    def validate_non_negative_decimals(cls, v):
-        """Validate decimal fields are non-negative."""
-        if v is not None and v < 0:
-            raise ValueError("Decimal fields must be non-negative")
-        return v
-
-    @field_validator('actual_drift')
-    @classmethod
-    def validate_actual_drift(cls, v):
-        """Validate actual_drift is a valid Decimal (can be negative)."""
-        if v is not None and not isinstance(v, Decimal):
-            raise ValueError("Actual drift must be a Decimal")
-        return v
-
-    @field_validator('trade_quantity')
-    @classmethod
-    def validate_trade_quantity_positive(cls, v):
-        """Validate trade quantity is positive when present."""
-        if v is not None and v <= 0:
-            raise ValueError("Trade quantity must be positive")
-        return v
+        Stored positions were validated on write, so only the Decimal128
+        values are converted.
+        """
+        return cls.model_construct(
+            **{key: _decimal128_to_decimal(value) for key, value in raw.items()}
+        )
 
 
 class PortfolioEmbedded(BaseModel):
@@ -124,65 +119,65 @@ class PortfolioEmbedded(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         str_strip_whitespace=True,
+        frozen=True,
     )
 
-    portfolio_id: str = Field(..., description="Portfolio identifier")
-    market_value: Decimal = Field(..., description="Market value of the portfolio")
+    portfolio_id: str = Field(
+        ..., min_length=24, max_length=24, description="Portfolio identifier"
+    )
+    market_value: Decimal = Field(
+        ..., ge=0, description="Market value of the portfolio"
+    )
     cash_before_rebalance: Decimal = Field(
-        ..., description="Cash in the portfolio before rebalance"
+        ..., ge=0, description="Cash in the portfolio before rebalance"
     )
     cash_after_rebalance: Decimal = Field(
-        ..., description="Cash in the portfolio after rebalance"
+        ..., ge=0, description="Cash in the portfolio after rebalance"
     )
     positions: List[PositionEmbedded] = Field(
         default_factory=list, description="List of positions in the portfolio"
     )
 
-    @field_validator(
-        'market_value', 'cash_before_rebalance', 'cash_after_rebalance', mode='before'
-    )
+    @model_validator(mode='before')
     @classmethod
-    def convert_decimal128_to_decimal(cls, v):
+    def convert_decimal128_to_decimal(cls, data):
         """Convert Decimal128 from MongoDB to Python Decimal."""
-        if isinstance(v, Decimal128):
-            return Decimal(str(v))
-        return v
-
-    @field_validator('portfolio_id')
-    @classmethod
-    def validate_portfolio_id_format(cls, v):
-        """Validate portfolio ID format (24-character string)."""
-        if not isinstance(v, str) or len(v) != 24:
-            raise ValueError("Portfolio ID must be exactly 24 characters")
-        return v
-
-    @field_validator('market_value', 'cash_before_rebalance', 'cash_after_rebalance')
-    @classmethod
-    def validate_non_negative_values(cls, v):
-        """Validate monetary values are non-negative."""
-        if v < 0:
-            raise ValueError("Monetary values must be non-negative")
-        return v
+        return _convert_decimal128_fields(data, _PORTFOLIO_DECIMAL_FIELDS)
 
     @field_validator('positions')
     @classmethod
     def validate_unique_securities_in_positions(cls, v):
         """Validate no duplicate securities in positions."""
-        if not v:
-            return v
-
-        security_ids = [pos.security_id for pos in v]
-        if len(security_ids) != len(set(security_ids)):
-            raise ValueError("Duplicate securities not allowed in portfolio positions")
+        seen: set[str] = set()
+        add = seen.add
+        for pos in v:
+            if pos.security_id in seen:
+                raise ValueError(
+                    "Duplicate securities not allowed in portfolio positions"
+                )
+            add(pos.security_id)
         return v
 
+    @classmethod
+    def from_mongo_trusted(cls, raw: Mapping[str, Any]) -> 'PortfolioEmbedded':
+        """Build from a stored subdocument without re-running validation."""
+        data = {key: _decimal128_to_decimal(value) for key, value in raw.items()}
+        data['positions'] = [
+            PositionEmbedded.from_mongo_trusted(position)
+            for position in raw.get('positions', [])
+        ]
+        return cls.model_construct(**data)
+
 
 class RebalanceDocument(Document):
     """MongoDB document model for rebalance results using Beanie ODM."""
 
+    # Kept explicit: rebalance results are built from validated domain
+    # entities, and validated assignment would re-walk every portfolio
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         str_strip_whitespace=True,
+        validate_assignment=False,
     )
 
     # Use ObjectId for _id field
@@ -190,58 +185,46 @@ class RebalanceDocument(Document):
 
     model_id: ObjectId = Field(..., description="ID of the model that was rebalanced")
     rebalance_date: datetime = Field(..., description="Date of the rebalance")
-    model_name: str = Field(..., description="Name of the model that was rebalanced")
+    # Length and range checks are schema constraints; str_strip_whitespace
+    # strips model_name before min_length applies
+    model_name: str = Field(
+        ..., min_length=1, description="Name of the model that was rebalanced"
+    )
     number_of_portfolios: int = Field(
-        ..., description="Number of portfolios in the rebalance"
+        ..., gt=0, description="Number of portfolios in the rebalance"
     )
     portfolios: List[PortfolioEmbedded] = Field(
         default_factory=list, description="List of portfolios rebalanced"
     )
-    version: int = Field(default=1, description="Version for optimistic locking")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    @field_validator('model_name')
-    @classmethod
-    def validate_model_name_not_empty(cls, v):
-        """Validate model name is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Model name cannot be empty")
-        return v.strip()
-
-    @field_validator('number_of_portfolios')
-    @classmethod
-    def validate_number_of_portfolios_positive(cls, v):
-        """Validate number of portfolios is positive."""
-        if v <= 0:
-            raise ValueError("Number of portfolios must be positive")
-        return v
-
-    @field_validator('portfolios')
-    @classmethod
-    def validate_portfolio_count_matches(cls, v, info):
-        """Validate actual portfolio count matches number_of_portfolios."""
-        # Note: This validator runs before all fields are set, so we check at document level
-        return v
+    version: int = Field(default=1, ge=1, description="Version for optimistic locking")
+    created_at: datetime = Field(default_factory=utc_now)
 
     @field_validator('portfolios')
     @classmethod
     def validate_unique_portfolios(cls, v):
         """Validate no duplicate portfolios."""
-        if not v:
-            return v
-
-        portfolio_ids = [portfolio.portfolio_id for portfolio in v]
-        if len(portfolio_ids) != len(set(portfolio_ids)):
-            raise ValueError("Duplicate portfolios not allowed in rebalance")
+        seen: set[str] = set()
+        add = seen.add
+        for portfolio in v:
+            if portfolio.portfolio_id in seen:
+                raise ValueError("Duplicate portfolios not allowed in rebalance")
+            add(portfolio.portfolio_id)
         return v
 
-    @field_validator('version')
     @classmethod
-    def validate_version_positive(cls, v):
-        """Validate version is positive."""
-        if v < 1:
-            raise ValueError("Version must be positive")
-        return v
+    def from_mongo_trusted(cls, raw: Mapping[str, Any]) -> 'RebalanceDocument':
+        """Build from a stored MongoDB document without re-running validation.
+
+        For read-only paths over documents that were validated on write.
+        """
+        data: dict[str, Any] = dict(raw)
+        data['portfolios'] = [
+            PortfolioEmbedded.from_mongo_trusted(portfolio)
+            for portfolio in raw.get('portfolios', [])
+        ]
+        # Beanie types model_construct as returning Any
+        document: RebalanceDocument = cls.model_construct(**data)
+        return document
 
     def validate_portfolio_count_consistency(self) -> None:
         """Validate that the number of portfolios matches the actual count."""
@@ -12,17 +12,59 @@ All schemas include comprehensive validation, custom validators for financial da
 and bidirectional conversion methods to/from domain entities.
 """
 
-import re
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional, Union
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from operator import attrgetter
+from typing import Annotated, List, Optional, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    field_validator,
+    model_validator,
+)
 
 from src.domain.entities.model import InvestmentModel, Position
 from src.domain.value_objects.drift_bounds import DriftBounds
 from src.domain.value_objects.target_percentage import TargetPercentage
 
+# Matched by pydantic-core's Rust regex engine, where $ only matches at the end
+_SECURITY_ID_PATTERN = r'^[A-Za-z0-9]{24}$'
+
+# Timestamps are rendered with isoformat() ("+00:00" rather than pydantic's "Z");
+# Decimal fields use pydantic's default JSON string form
+_IsoDatetime = Annotated[
+    datetime, PlainSerializer(datetime.isoformat, return_type=str, when_used='json')
+]
+
+# A target is zero or a multiple of 0.005, and position targets may sum to at
+# most 0.95; both checks use exact Decimal arithmetic
+_TARGET_INCREMENT = Decimal('0.005')
+_TARGET_MAX_SUM = Decimal('0.95')
+_get_target = attrgetter('target')
+
+
+def _ensure_unique_portfolios(portfolios: List[str]) -> List[str]:
+    """Raise on the first repeated portfolio ID, without building a full set."""
+    seen: set[str] = set()
+    add = seen.add
+    for portfolio_id in portfolios:
+        if portfolio_id in seen:
+            raise ValueError("Portfolio list cannot contain duplicate portfolio IDs")
+        add(portfolio_id)
+    return portfolios
+
+
+def _target_sum_exceeds_max(positions: List['ModelPositionDTO']) -> bool:
+    """Check whether position targets sum above 0.95.
+
+    The map keeps the per-position attribute lookup in C, without a
+    generator frame.
+    """
+    return sum(map(_get_target, positions)) > _TARGET_MAX_SUM
+
 
 class ModelPositionDTO(BaseModel):
     """
@@ -31,15 +73,14 @@ class ModelPositionDTO(BaseModel):
     Represents a security position with target allocation and drift tolerances.
     """
 
-    model_config = ConfigDict(
-        json_encoders={Decimal: str}  # Serialize Decimal as string for JSON
-    )
+    model_config = ConfigDict(frozen=True)
 
     security_id: str = Field(
         ...,
         description="24-character alphanumeric security identifier",
         min_length=24,
         max_length=24,
+        pattern=_SECURITY_ID_PATTERN,
     )
 
     target: Decimal = Field(
@@ -63,26 +104,12 @@ class ModelPositionDTO(BaseModel):
         le=Decimal("1"),
     )
 
-    @field_validator('security_id')
-    @classmethod
-    def validate_security_id(cls, v: str) -> str:
-        """Validate security ID format: exactly 24 alphanumeric characters."""
-        if not re.match(r'^[A-Za-z0-9]{24}$', v):
-            raise ValueError("Security ID must be exactly 24 alphanumeric characters")
-        return v
-
     @field_validator('target')
     @classmethod
     def validate_target_precision(cls, v: Decimal) -> Decimal:
         """Validate target is zero or a multiple of 0.005."""
-        if v == Decimal("0"):
-            return v
-
-        # Check if it's a multiple of 0.005
-        remainder = v % Decimal("0.005")
-        if remainder != Decimal("0"):
+        if v % _TARGET_INCREMENT:
             raise ValueError("Target must be 0 or a multiple of 0.005")
-
         return v
 
     @model_validator(mode='after')
@@ -120,13 +147,6 @@ class ModelDTO(BaseModel):
     Used for GET responses and complete model data transfer.
     """
 
-    model_config = ConfigDict(
-        json_encoders={
-            Decimal: str,
-            datetime: lambda dt: dt.isoformat() if dt else None,
-        }
-    )
-
     model_id: str = Field(
         ..., description="Unique model identifier (24-character hex string)"
     )
@@ -143,7 +163,7 @@ class ModelDTO(BaseModel):
         ..., description="Associated portfolio IDs", min_length=1
     )
 
-    last_rebalance_date: Optional[datetime] = Field(
+    last_rebalance_date: Optional[_IsoDatetime] = Field(
         None, description="Last rebalancing timestamp (UTC)"
     )
 
@@ -157,16 +177,6 @@ class ModelDTO(BaseModel):
             raise ValueError("Model name cannot be empty or whitespace only")
         return v.strip()
 
-    @field_validator('positions')
-    @classmethod
-    def validate_position_count(
-        cls, v: List[ModelPositionDTO]
-    ) -> List[ModelPositionDTO]:
-        """Validate maximum number of positions."""
-        if len(v) > 100:
-            raise ValueError("Model cannot have more than 100 positions")
-        return v
-
     @field_validator('portfolios')
     @classmethod
     def validate_portfolios_not_empty_and_unique(cls, v: List[str]) -> List[str]:
@@ -174,16 +184,12 @@ class ModelDTO(BaseModel):
         if len(v) == 0:
             raise ValueError("Model must be associated with at least one portfolio")
 
-        if len(v) != len(set(v)):
-            raise ValueError("Portfolio list cannot contain duplicate portfolio IDs")
-
-        return v
+        return _ensure_unique_portfolios(v)
 
     @model_validator(mode='after')
     def validate_target_sum(self):
         """Validate that sum of position targets does not exceed 0.95."""
-        total_target = sum(position.target for position in self.positions)
-        if total_target > Decimal("0.95"):
+        if _target_sum_exceeds_max(self.positions):
             raise ValueError("Sum of position targets cannot exceed 0.95 (95%)")
         return self
 
@@ -218,8 +224,6 @@ class ModelPostDTO(BaseModel):
     Used for POST /models endpoint.
     """
 
-    model_config = ConfigDict(json_encoders={Decimal: str})
-
     name: str = Field(..., description="Model name", min_length=1, max_length=255)
 
     positions: List[ModelPositionDTO] = Field(
@@ -242,15 +246,12 @@ class ModelPostDTO(BaseModel):
     @classmethod
     def validate_portfolios_unique(cls, v: List[str]) -> List[str]:
         """Validate portfolios list contains no duplicates."""
-        if len(v) != len(set(v)):
-            raise ValueError("Portfolio list cannot contain duplicate portfolio IDs")
-        return v
+        return _ensure_unique_portfolios(v)
 
     @model_validator(mode='after')
     def validate_target_sum(self):
         """Validate that sum of position targets does not exceed 0.95."""
-        total_target = sum(position.target for position in self.positions)
-        if total_target > Decimal("0.95"):
+        if _target_sum_exceeds_max(self.positions):
             raise ValueError("Sum of position targets cannot exceed 0.95 (95%)")
         return self
 
@@ -262,13 +263,6 @@ class ModelPutDTO(BaseModel):
     Used for PUT /model/{model_id} endpoint.
     """
 
-    model_config = ConfigDict(
-        json_encoders={
-            Decimal: str,
-            datetime: lambda dt: dt.isoformat() if dt else None,
-        }
-    )
-
     name: str = Field(..., description="Model name", min_length=1, max_length=255)
 
     positions: List[ModelPositionDTO] = Field(
@@ -279,7 +273,7 @@ class ModelPutDTO(BaseModel):
         ..., description="Updated portfolio associations", min_length=1
     )
 
-    last_rebalance_date: Optional[datetime] = Field(
+    last_rebalance_date: Optional[_IsoDatetime] = Field(
         None, description="Last rebalancing timestamp (UTC)"
     )
 
@@ -299,15 +293,12 @@ class ModelPutDTO(BaseModel):
     @classmethod
     def validate_portfolios_unique(cls, v: List[str]) -> List[str]:
         """Validate portfolios list contains no duplicates."""
-        if len(v) != len(set(v)):
-            raise ValueError("Portfolio list cannot contain duplicate portfolio IDs")
-        return v
+        return _ensure_unique_portfolios(v)
 
     @model_validator(mode='after')
     def validate_target_sum(self):
         """Validate that sum of position targets does not exceed 0.95."""
-        total_target = sum(position.target for position in self.positions)
-        if total_target > Decimal("0.95"):
+        if _target_sum_exceeds_max(self.positions):
             raise ValueError("Sum of position targets cannot exceed 0.95 (95%)")
         return self
 
@@ -338,6 +329,4 @@ class ModelPortfolioDTO(BaseModel):
     @classmethod
     def validate_portfolios_unique(cls, v: List[str]) -> List[str]:
         """Validate portfolios list contains no duplicates."""
-        if len(v) != len(set(v)):
-            raise ValueError("Portfolio list cannot contain duplicate portfolio IDs")
-        return v
+        return _ensure_unique_portfolios(v)
@@ -7,156 +7,169 @@ including request and response DTOs.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from bson import ObjectId
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    model_validator,
+)
 
 from src.schemas.transactions import TransactionDTO
 
 
+_SECURITY_ID_PATTERN = r'^[A-Za-z0-9]{24}$'
+# Same format ObjectId.is_valid accepts for strings, without building an ObjectId
+_OBJECT_ID_PATTERN = r'^[0-9a-fA-F]{24}$'
+
+# Portfolio and rebalance responses render Decimals as JSON numbers and
+# timestamps with isoformat(); DriftDTO keeps pydantic's Decimal strings
+_FloatDecimal = Annotated[
+    Decimal, PlainSerializer(float, return_type=float, when_used='json')
+]
+_IsoDatetime = Annotated[
+    datetime, PlainSerializer(datetime.isoformat, return_type=str, when_used='json')
+]
+
+# Range-constrained Decimals shared by the DriftDTO fields
+_NonNegativeQuantity = Annotated[Decimal, Field(ge=Decimal("0"))]
+_TargetFraction = Annotated[Decimal, Field(ge=Decimal("0"), le=Decimal("0.95"))]
+_DriftFraction = Annotated[Decimal, Field(ge=Decimal("0"), le=Decimal("1"))]
+
+
 class PositionDTO(BaseModel):
     """DTO for a position within a portfolio for the portfolio endpoint API."""
 
-    model_config = ConfigDict(
-        json_encoders={
-            Decimal: lambda v: float(v),
-        }
+    security_id: str = Field(
+        ...,
+        description="Unique identifier for the security",
+        min_length=24,
+        max_length=24,
     )
-
-    security_id: str = Field(..., description="Unique identifier for the security")
-    price: Decimal = Field(..., description="Current price per share/unit", gt=0)
-    original_quantity: Decimal = Field(
+    price: _FloatDecimal = Field(..., description="Current price per share/unit", gt=0)
+    original_quantity: _FloatDecimal = Field(
         ..., description="Quantity before rebalancing", ge=0
     )
-    adjusted_quantity: Decimal = Field(
+    adjusted_quantity: _FloatDecimal = Field(
         ..., description="Quantity after rebalancing", ge=0
     )
-    original_position_market_value: Decimal = Field(
+    original_position_market_value: _FloatDecimal = Field(
         ..., description="Market value before rebalancing", ge=0
     )
-    adjusted_position_market_value: Decimal = Field(
+    adjusted_position_market_value: _FloatDecimal = Field(
         ..., description="Market value after rebalancing", ge=0
     )
-    target: Decimal = Field(
+    target: _FloatDecimal = Field(
         ..., description="Target allocation percentage (as decimal)", ge=0, le=1
     )
-    high_drift: Decimal = Field(
+    high_drift: _FloatDecimal = Field(
         ..., description="High drift threshold (as decimal)", ge=0, le=1
     )
-    low_drift: Decimal = Field(
+    low_drift: _FloatDecimal = Field(
         ..., description="Low drift threshold (as decimal)", ge=0, le=1
     )
-    actual: Decimal = Field(
+    actual: _FloatDecimal = Field(
         ..., description="Actual allocation percentage (as decimal)", ge=0, le=1
     )
-    actual_drift: Decimal = Field(
+    actual_drift: _FloatDecimal = Field(
         ..., description="Actual drift from target (as decimal)"
     )
 
-    @field_validator('security_id')
-    @classmethod
-    def validate_security_id_format(cls, v):
-        """Validate security ID is 24-character string."""
-        if not isinstance(v, str) or len(v) != 24:
-            raise ValueError("Security ID must be exactly 24 characters")
-        return v
-
 
 class PortfolioWithPositionsDTO(BaseModel):
     """DTO for a portfolio with positions for the portfolio endpoint API."""
 
-    model_config = ConfigDict(
-        json_encoders={
-            Decimal: lambda v: float(v),
-        }
+    portfolio_id: str = Field(
+        ...,
+        description="Unique identifier for the portfolio",
+        pattern=_OBJECT_ID_PATTERN,
     )
-
-    portfolio_id: str = Field(..., description="Unique identifier for the portfolio")
-    market_value: Decimal = Field(
+    market_value: _FloatDecimal = Field(
         ..., description="Total market value of the portfolio", gt=0
     )
-    cash_before_rebalance: Decimal = Field(
+    cash_before_rebalance: _FloatDecimal = Field(
         ..., description="Cash amount before rebalancing", ge=0
     )
-    cash_after_rebalance: Decimal = Field(
+    cash_after_rebalance: _FloatDecimal = Field(
         ..., description="Cash amount after rebalancing", ge=0
     )
     positions: List[PositionDTO] = Field(
         default_factory=list, description="Array of position objects in this portfolio"
     )
 
-    @field_validator('portfolio_id')
-    @classmethod
-    def validate_portfolio_id_format(cls, v):
-        """Validate portfolio ID is 24-character MongoDB ObjectId."""
-        if not isinstance(v, str) or len(v) != 24:
-            raise ValueError("Portfolio ID must be exactly 24 characters")
-        if not ObjectId.is_valid(v):
-            raise ValueError("Portfolio ID must be a valid MongoDB ObjectId")
-        return v
-
 
 class RebalancePositionDTO(BaseModel):
     """DTO for a position within a rebalanced portfolio."""
 
+    model_config = ConfigDict(frozen=True)
+
     security_id: str = Field(..., description="Security identifier")
-    price: Decimal = Field(..., description="Price used for the rebalance")
-    original_quantity: Decimal = Field(..., description="Original value of u")
-    adjusted_quantity: Decimal = Field(..., description="New value of u'")
-    original_position_market_value: Decimal = Field(
+    price: _FloatDecimal = Field(..., description="Price used for the rebalance")
+    original_quantity: _FloatDecimal = Field(..., description="Original value of u")
+    adjusted_quantity: _FloatDecimal = Field(..., description="New value of u'")
+    original_position_market_value: _FloatDecimal = Field(
         ..., description="Original quantity times price"
     )
-    adjusted_position_market_value: Decimal = Field(
+    adjusted_position_market_value: _FloatDecimal = Field(
         ..., description="Adjusted quantity times price"
     )
-    target: Decimal = Field(..., description="Target from the model")
-    high_drift: Decimal = Field(..., description="High drift from the model")
-    low_drift: Decimal = Field(..., description="Low drift from the model")
-    actual: Decimal = Field(..., description="(u' * p) / MV")
-    actual_drift: Decimal = Field(..., description="(actual/target) - 1")
+    target: _FloatDecimal = Field(..., description="Target from the model")
+    high_drift: _FloatDecimal = Field(..., description="High drift from the model")
+    low_drift: _FloatDecimal = Field(..., description="Low drift from the model")
+    actual: _FloatDecimal = Field(..., description="(u' * p) / MV")
+    actual_drift: _FloatDecimal = Field(..., description="(actual/target) - 1")
     transaction_type: Optional[str] = Field(
         None, description="'BUY' or 'SELL' or None if no transaction"
     )
     trade_quantity: Optional[int] = Field(
         None, description="Positive quantity to BUY or SELL"
     )
-    trade_date: Optional[datetime] = Field(None, description="Current date (no time)")
+    trade_date: Optional[_IsoDatetime] = Field(
+        None, description="Current date (no time)"
+    )
+
+    @classmethod
+    def from_trusted(cls, **data) -> 'RebalancePositionDTO':
+        """Build without validation from an already validated rebalance position.
 
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v),
-            datetime: lambda v: v.isoformat() if v else None,
-        }
+        For read paths over stored rebalances, which can hold thousands of
+        positions; API input goes through the validating constructor.
+        """
+        return cls.model_construct(**data)
 
 
 class RebalancePortfolioDTO(BaseModel):
     """DTO for a portfolio within a rebalance operation."""
 
     portfolio_id: str = Field(..., description="Portfolio identifier")
-    market_value: Decimal = Field(..., description="Market value of the portfolio")
-    cash_before_rebalance: Decimal = Field(
+    market_value: _FloatDecimal = Field(
+        ..., description="Market value of the portfolio"
+    )
+    cash_before_rebalance: _FloatDecimal = Field(
         ..., description="Cash in the portfolio before rebalance"
     )
-    cash_after_rebalance: Decimal = Field(
+    cash_after_rebalance: _FloatDecimal = Field(
         ..., description="Cash in the portfolio after rebalance"
     )
     positions: List[RebalancePositionDTO] = Field(
         default_factory=list, description="List of positions in the portfolio"
     )
 
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v),
-        }
-
 
 class RebalanceResultDTO(BaseModel):
     """DTO for a complete rebalance operation (new API)."""
 
-    rebalance_id: str = Field(..., description="Unique rebalance identifier")
-    model_id: str = Field(..., description="ID of the model that was rebalanced")
-    rebalance_date: datetime = Field(..., description="Date of the rebalance")
+    rebalance_id: str = Field(
+        ..., description="Unique rebalance identifier", pattern=_OBJECT_ID_PATTERN
+    )
+    model_id: str = Field(
+        ...,
+        description="ID of the model that was rebalanced",
+        pattern=_OBJECT_ID_PATTERN,
+    )
+    rebalance_date: _IsoDatetime = Field(..., description="Date of the rebalance")
     model_name: str = Field(..., description="Name of the model that was rebalanced")
     number_of_portfolios: int = Field(
         ..., description="Number of portfolios in the rebalance"
@@ -165,68 +178,17 @@ class RebalanceResultDTO(BaseModel):
         default_factory=list, description="List of portfolios rebalanced"
     )
     version: int = Field(default=1, description="Version for optimistic locking")
-    created_at: datetime = Field(..., description="Creation timestamp")
-
-    @field_validator('rebalance_id', 'model_id')
-    @classmethod
-    def validate_object_id_format(cls, v):
-        """Validate ObjectId string format."""
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid ObjectId format")
-        return v
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    created_at: _IsoDatetime = Field(..., description="Creation timestamp")
 
 
 class RebalancesByPortfoliosRequestDTO(BaseModel):
     """Request DTO for retrieving rebalances by portfolios."""
 
-    portfolios: List[str] = Field(..., description="List of portfolio IDs to filter by")
-
-    @field_validator('portfolios')
-    @classmethod
-    def validate_portfolios_not_empty(cls, v):
-        """Validate portfolios list is not empty."""
-        if not v:
-            raise ValueError("Portfolios list cannot be empty")
-        return v
-
-    @field_validator('portfolios')
-    @classmethod
-    def validate_portfolio_id_lengths(cls, v):
-        """Validate portfolio ID format (24-character strings)."""
-        for portfolio_id in v:
-            if not isinstance(portfolio_id, str) or len(portfolio_id) != 24:
-                raise ValueError("Portfolio IDs must be exactly 24 characters")
-        return v
-
-
-# The original RebalanceDTO (for backward compatibility)
-class RebalanceDTO(BaseModel):
-    """Original DTO for backward compatibility with existing rebalance API."""
-
-    portfolio_id: str = Field(
-        ..., description="Portfolio identifier", min_length=24, max_length=24
-    )
-    rebalance_id: str = Field(..., description="Rebalance record identifier")
-    transactions: List["TransactionDTO"] = Field(
-        default_factory=list, description="List of transactions"
-    )
-    drifts: List["DriftDTO"] = Field(
-        default_factory=list, description="List of drift information"
+    # The non-empty and 24-character ID checks run in pydantic-core
+    portfolios: List[Annotated[str, Field(min_length=24, max_length=24)]] = Field(
+        ..., description="List of portfolio IDs to filter by", min_length=1
     )
 
-    @field_validator('rebalance_id')
-    @classmethod
-    def validate_rebalance_id_format(cls, v):
-        """Validate ObjectId string format."""
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid ObjectId format")
-        return v
-
 
 class DriftDTO(BaseModel):
     """
@@ -237,44 +199,34 @@ class DriftDTO(BaseModel):
     allocation after rebalancing.
     """
 
-    model_config = ConfigDict(
-        json_encoders={Decimal: str}  # Serialize Decimal as string for JSON
-    )
+    model_config = ConfigDict(frozen=True)
 
     security_id: str = Field(
         ...,
         description="24-character alphanumeric security identifier",
         min_length=24,
         max_length=24,
+        pattern=_SECURITY_ID_PATTERN,
     )
 
-    original_quantity: Decimal = Field(
-        ..., description="Original quantity before rebalancing", ge=Decimal("0")
+    original_quantity: _NonNegativeQuantity = Field(
+        ..., description="Original quantity before rebalancing"
     )
 
-    adjusted_quantity: Decimal = Field(
-        ..., description="Adjusted quantity after rebalancing", ge=Decimal("0")
+    adjusted_quantity: _NonNegativeQuantity = Field(
+        ..., description="Adjusted quantity after rebalancing"
     )
 
-    target: Decimal = Field(
-        ...,
-        description="Target allocation percentage (0-0.95)",
-        ge=Decimal("0"),
-        le=Decimal("0.95"),
+    target: _TargetFraction = Field(
+        ..., description="Target allocation percentage (0-0.95)"
     )
 
-    high_drift: Decimal = Field(
-        ...,
-        description="Maximum allowable drift above target (0-1)",
-        ge=Decimal("0"),
-        le=Decimal("1"),
+    high_drift: _DriftFraction = Field(
+        ..., description="Maximum allowable drift above target (0-1)"
     )
 
-    low_drift: Decimal = Field(
-        ...,
-        description="Maximum allowable drift below target (0-1)",
-        ge=Decimal("0"),
-        le=Decimal("1"),
+    low_drift: _DriftFraction = Field(
+        ..., description="Maximum allowable drift below target (0-1)"
     )
 
     actual: Decimal = Field(
@@ -282,32 +234,6 @@ class DriftDTO(BaseModel):
         description="Actual allocation percentage after rebalancing (4 decimal places)",
     )
 
-    @field_validator('security_id')
-    @classmethod
-    def validate_security_id(cls, v: str) -> str:
-        """Validate security ID format: exactly 24 alphanumeric characters."""
-        import re
-
-        if not re.match(r'^[A-Za-z0-9]{24}$', v):
-            raise ValueError("Security ID must be exactly 24 alphanumeric characters")
-        return v
-
-    @field_validator('target')
-    @classmethod
-    def validate_target_range(cls, v: Decimal) -> Decimal:
-        """Validate target percentage is within allowed range."""
-        if v < Decimal("0") or v > Decimal("0.95"):
-            raise ValueError("Target must be between 0 and 0.95")
-        return v
-
-    @field_validator('original_quantity', 'adjusted_quantity')
-    @classmethod
-    def validate_quantities_non_negative(cls, v: Decimal) -> Decimal:
-        """Validate quantities are non-negative."""
-        if v < Decimal("0"):
-            raise ValueError("Quantities must be non-negative")
-        return v
-
     @model_validator(mode='after')
     def validate_drift_bounds(self):
         """Validate that low drift does not exceed high drift."""
@@ -316,5 +242,19 @@ class DriftDTO(BaseModel):
         return self
 
 
-# Forward reference resolution
-RebalanceDTO.model_rebuild()
+# The original RebalanceDTO (for backward compatibility)
+class RebalanceDTO(BaseModel):
+    """Original DTO for backward compatibility with existing rebalance API."""
+
+    portfolio_id: str = Field(
+        ..., description="Portfolio identifier", min_length=24, max_length=24
+    )
+    rebalance_id: str = Field(
+        ..., description="Rebalance record identifier", pattern=_OBJECT_ID_PATTERN
+    )
+    transactions: List[TransactionDTO] = Field(
+        default_factory=list, description="List of transactions"
+    )
+    drifts: List[DriftDTO] = Field(
+        default_factory=list, description="List of drift information"
+    )
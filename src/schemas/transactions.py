@@ -9,7 +9,6 @@ All schemas include comprehensive validation for financial data and secure
 handling of transaction information.
 """
 
-import re
 from datetime import date
 from enum import Enum
 from typing import Union
@@ -17,6 +16,9 @@ from typing import Union
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
+_SECURITY_ID_PATTERN = r'^[A-Za-z0-9]{24}$'
+
+
 class TransactionType(str, Enum):
     """
     Transaction type enumeration.
@@ -33,12 +35,14 @@ class TransactionType(str, Enum):
     def _missing_(cls, value):
         """Handle case-insensitive enum lookup."""
         if isinstance(value, str):
-            for item in cls:
-                if item.value.lower() == value.lower():
-                    return item
+            return _TRANSACTION_TYPES.get(value.upper())
         return super()._missing_(value)
 
 
+# Transaction types keyed by their upper-case value, for case-insensitive parsing
+_TRANSACTION_TYPES = {item.value: item for item in TransactionType}
+
+
 class TransactionDTO(BaseModel):
     """
     Buy/sell order representation.
@@ -47,9 +51,7 @@ class TransactionDTO(BaseModel):
     on a given trade date.
     """
 
-    model_config = ConfigDict(
-        use_enum_values=True, json_encoders={date: lambda dt: dt.isoformat()}
-    )
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
     transaction_type: TransactionType = Field(
         ..., description="Type of transaction (BUY or SELL)"
@@ -60,6 +62,7 @@ class TransactionDTO(BaseModel):
         description="24-character alphanumeric security identifier",
         min_length=24,
         max_length=24,
+        pattern=_SECURITY_ID_PATTERN,
     )
 
     quantity: int = Field(..., description="Number of shares/units to trade", gt=0)
@@ -68,33 +71,13 @@ class TransactionDTO(BaseModel):
         ..., description="Date when the transaction should be executed"
     )
 
-    @field_validator('security_id')
-    @classmethod
-    def validate_security_id(cls, v: str) -> str:
-        """Validate security ID format: exactly 24 alphanumeric characters."""
-        if not re.match(r'^[A-Za-z0-9]{24}$', v):
-            raise ValueError("Security ID must be exactly 24 alphanumeric characters")
-        return v
-
-    @field_validator('quantity')
-    @classmethod
-    def validate_quantity_positive(cls, v: int) -> int:
-        """Validate quantity is positive."""
-        if v <= 0:
-            raise ValueError("Quantity must be positive")
-        return v
-
     @field_validator('transaction_type', mode='before')
     @classmethod
     def parse_transaction_type(cls, v: Union[str, TransactionType]) -> TransactionType:
         """Parse transaction type, handling case-insensitive strings."""
         if isinstance(v, str):
-            try:
-                return TransactionType(v.upper())
-            except ValueError:
-                # Try case-insensitive lookup
-                for transaction_type in TransactionType:
-                    if transaction_type.value.lower() == v.lower():
-                        return transaction_type
+            transaction_type = _TRANSACTION_TYPES.get(v.upper())
+            if transaction_type is None:
                 raise ValueError(f"Invalid transaction type: {v}")
+            return transaction_type
         return v
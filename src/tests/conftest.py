@@ -7,9 +7,11 @@ and sample test data.
 """
 
 import asyncio
+import functools
 import os
 from collections.abc import AsyncGenerator
 from decimal import Decimal
+from types import MappingProxyType
 from unittest.mock import AsyncMock
 
 import pytest
@@ -20,6 +22,10 @@ from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from prometheus_client import REGISTRY, CollectorRegistry
 from testcontainers.mongodb import MongoDbContainer
 
+# Skip OTLP exporter setup when src.main is imported; there is no collector
+# to export to during tests
+os.environ.setdefault("OTEL_ENABLED", "false")
+
 from src.config import Settings, get_settings
 from src.main import create_app
 
@@ -81,18 +87,30 @@ async def test_database_url(mongodb_container):
     return mongodb_container.get_connection_url()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_settings(test_database_url):
-    """Create test settings with MongoDB container URL."""
-    settings = TestSettings(database_url=test_database_url)
+    """Create test settings with MongoDB container URL.
+
+    Each pytest-xdist worker gets its own database, so workers sharing a
+    MongoDB server never see each other's documents.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    settings = TestSettings(
+        database_url=test_database_url,
+        database_name=f"test-order-generation-{worker_id}",
+    )
     return settings
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_db_client(
     test_settings: TestSettings,
 ) -> AsyncGenerator[AsyncIOMotorClient, None]:
-    """Create a test database client."""
+    """Create a test database client shared by the whole session.
+
+    test_database wipes the collections around each test, so one client and
+    its connection pool can serve every test.
+    """
     client = AsyncIOMotorClient(test_settings.database_url)
     try:
         yield client
@@ -101,24 +119,48 @@ async def test_db_client(
             client.close()  # Motor's close() is synchronous, not async
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def test_database(
     test_db_client: AsyncIOMotorClient, test_settings: TestSettings
 ) -> AsyncGenerator[AsyncIOMotorDatabase, None]:
     """Create a clean test database for each test."""
     database = test_db_client[test_settings.database_name]
 
+    async def drop_collections():
+        # Drops are independent, so issue them concurrently
+        collection_names = await database.list_collection_names()
+        await asyncio.gather(*(database[name].drop() for name in collection_names))
+
     # Clean up any existing data
-    collection_names = await database.list_collection_names()
-    for collection_name in collection_names:
-        await database[collection_name].drop()
+    await drop_collections()
 
     yield database
 
     # Clean up after test
-    collection_names = await database.list_collection_names()
-    for collection_name in collection_names:
-        await database[collection_name].drop()
+    await drop_collections()
+
+
+def _freeze(value):
+    """Recursively convert dicts and lists into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _frozen(fixture_function):
+    """Freeze the sample data returned by a session-scoped fixture.
+
+    The same objects are shared by every test in the session, so they are
+    made read-only to keep one test from changing what the next one sees.
+    """
+
+    @functools.wraps(fixture_function)
+    def wrapper():
+        return _freeze(fixture_function())
+
+    return wrapper
 
 
 @pytest.fixture
@@ -146,7 +188,8 @@ def mock_external_services():
     return mocks
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+@_frozen
 def sample_portfolio_balances():
     """Sample portfolio balance data for testing."""
     return [
@@ -168,7 +211,8 @@ def sample_portfolio_balances():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+@_frozen
 def sample_security_prices():
     """Sample security price data for testing."""
     return {
@@ -177,7 +221,8 @@ def sample_security_prices():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+@_frozen
 def sample_investment_model():
     """Sample investment model for testing."""
     return {
@@ -200,7 +245,8 @@ def sample_investment_model():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+@_frozen
 def sample_investment_models():
     """Multiple sample investment models for testing."""
     return [
@@ -243,9 +289,9 @@ def sample_investment_models():
     ]
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_app(test_settings: TestSettings):
-    """Create a test FastAPI application."""
+    """Create a test FastAPI application shared by the whole session."""
 
     # Override settings for testing
     def get_test_settings():
@@ -260,14 +306,28 @@ async def test_app(test_settings: TestSettings):
     app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(autouse=True)
+def restore_dependency_overrides(request):
+    """Undo dependency overrides a test added to the shared test app."""
+    if "test_app" not in request.fixturenames:
+        yield
+        return
+
+    app = request.getfixturevalue("test_app")
+    overrides = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(overrides)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_client(test_app):
     """Create a test client for the FastAPI application."""
     with TestClient(test_app) as client:
         yield client
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_test_client(test_app):
     """Create an async test client for the FastAPI application."""
     async with AsyncClient(app=test_app, base_url="http://testserver") as client:
@@ -275,7 +335,8 @@ async def async_test_client(test_app):
 
 
 # Mathematical test fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
+@_frozen
 def simple_optimization_problem():
     """Simple optimization problem for mathematical validation."""
     return {
@@ -288,7 +349,8 @@ def simple_optimization_problem():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+@_frozen
 def complex_optimization_problem():
     """Complex optimization problem with many positions."""
     num_positions = 20
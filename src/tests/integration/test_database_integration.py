@@ -8,6 +8,7 @@ database integration before implementing the actual repository.
 Tests use MongoDB test containers for isolated testing environment.
 """
 
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import List, Optional
@@ -27,46 +28,104 @@ from src.infrastructure.database.repositories.model_repository import (
 )
 from src.models.model import ModelDocument
 
+# The Beanie fixtures share the session-scoped Motor client, which is bound to the
+# event loop it first ran on
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Decimals repeated across tests, parsed once at import
+_TARGET_40PCT = Decimal("0.40")
+_DRIFT_1PCT = Decimal("0.01")
+_DRIFT_2PCT = Decimal("0.02")
+_DRIFT_3PCT = Decimal("0.03")
+
+# Value objects are immutable, so sample_model's can be built once and shared
+_STOCK_TARGET = TargetPercentage(_TARGET_40PCT)
+_STOCK_DRIFT_BOUNDS = DriftBounds(low_drift=_DRIFT_2PCT, high_drift=_DRIFT_3PCT)
+_BOND_TARGET = TargetPercentage(Decimal("0.35"))
+_BOND_DRIFT_BOUNDS = DriftBounds(
+    low_drift=Decimal("0.015"), high_drift=Decimal("0.025")
+)
+
+# Fixed timestamps keep the rebalance-date tests deterministic; the test Motor
+# client is not tz_aware, so stored dates read back naive
+_REBALANCE_DATE = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+_REBALANCE_CUTOFF = _REBALANCE_DATE.replace(tzinfo=None)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def beanie_initialized(test_db_client, test_settings):
+    """Register ModelDocument with Beanie once for the whole session.
+
+    init_beanie re-parses the document model and ensures its indexes on every
+    call, so it runs once rather than per test. Returns the test database.
+    """
+    database = test_db_client[test_settings.database_name]
+    await init_beanie(database=database, document_models=[ModelDocument])
+    return database
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def model_collection(beanie_initialized):
+    """Empty the models collection around each test.
+
+    Documents are deleted rather than the collection dropped, so the indexes
+    built by beanie_initialized survive between tests.
+    """
+    collection = ModelDocument.get_motor_collection()
+    await collection.delete_many({})
+    yield collection
+    await collection.delete_many({})
+
 
 @pytest.mark.integration
 class TestMongoModelRepositoryIntegration:
     """Integration tests for MongoDB model repository implementation."""
 
-    @pytest_asyncio.fixture
-    async def repository(self, test_database) -> MongoModelRepository:
+    @pytest_asyncio.fixture(loop_scope="session")
+    async def repository(self, model_collection) -> MongoModelRepository:
         """Create a MongoDB model repository instance."""
-        # Initialize Beanie for testing
-        await init_beanie(database=test_database, document_models=[ModelDocument])
         return MongoModelRepository()
 
-    @pytest_asyncio.fixture
-    async def sample_model(self) -> InvestmentModel:
-        """Create a sample investment model for testing."""
+    @pytest.fixture(scope="session")
+    def sample_model_template(self) -> InvestmentModel:
+        """Build the sample investment model once for the session."""
         return InvestmentModel(
             model_id=ObjectId(),
             name="Integration Test Model",
             positions=[
                 Position(
                     security_id="STOCK1234567890123456789",
-                    target=TargetPercentage(Decimal("0.40")),
-                    drift_bounds=DriftBounds(
-                        low_drift=Decimal("0.02"), high_drift=Decimal("0.03")
-                    ),
+                    target=_STOCK_TARGET,
+                    drift_bounds=_STOCK_DRIFT_BOUNDS,
                 ),
                 Position(
                     security_id="BOND1111111111111111111A",
-                    target=TargetPercentage(Decimal("0.35")),
-                    drift_bounds=DriftBounds(
-                        low_drift=Decimal("0.015"), high_drift=Decimal("0.025")
-                    ),
+                    target=_BOND_TARGET,
+                    drift_bounds=_BOND_DRIFT_BOUNDS,
                 ),
             ],
             portfolios=["portfolio-integration-1", "portfolio-integration-2"],
             version=1,
         )
 
+    @pytest.fixture
+    def sample_model(self, sample_model_template) -> InvestmentModel:
+        """Create a sample investment model for testing.
+
+        Positions are frozen and shared with the template; the lists and the
+        model itself are fresh for each test.
+        """
+        return replace(
+            sample_model_template,
+            model_id=ObjectId(),
+            positions=list(sample_model_template.positions),
+            portfolios=list(sample_model_template.portfolios),
+        )
+
     @pytest.mark.asyncio
-    async def test_create_model_success(self, repository, sample_model):
+    async def test_create_model_success(
+        self, repository, model_collection, sample_model
+    ):
         """Test successful model creation in MongoDB."""
         # Act
         result = await repository.create(sample_model)
@@ -80,10 +139,9 @@ class TestMongoModelRepositoryIntegration:
         assert result.version == 1
         assert result.last_rebalance_date is None
 
-        # Verify persistence
-        retrieved = await repository.get_by_id(str(result.model_id))
-        assert retrieved is not None
-        assert retrieved.name == sample_model.name
+        # Verify persistence; reading the model back is covered by
+        # test_get_by_id_success, so a count avoids rehydrating it
+        assert await model_collection.count_documents({"_id": result.model_id}) == 1
 
     @pytest.mark.asyncio
     async def test_create_model_duplicate_name_fails(self, repository, sample_model):
@@ -100,7 +158,7 @@ class TestMongoModelRepositoryIntegration:
                     security_id="DIFFERENT123456789012345",
                     target=TargetPercentage(Decimal("0.50")),
                     drift_bounds=DriftBounds(
-                        low_drift=Decimal("0.01"), high_drift=Decimal("0.02")
+                        low_drift=_DRIFT_1PCT, high_drift=_DRIFT_2PCT
                     ),
                 )
             ],
@@ -113,13 +171,31 @@ class TestMongoModelRepositoryIntegration:
             await repository.create(duplicate_model)
 
     @pytest.mark.asyncio
-    async def test_get_by_id_success(self, repository, sample_model):
-        """Test successful model retrieval by ID."""
+    async def test_create_many_duplicate_name_fails(self, repository, sample_model):
+        """Test that a batch containing an existing model name fails."""
+        # Arrange
+        await repository.create(sample_model)
+        duplicate_model = InvestmentModel(
+            model_id=ObjectId(),
+            name=sample_model.name,  # Same name
+            positions=[],
+            portfolios=["different-portfolio"],
+            version=1,
+        )
+
+        # Act & Assert
+        with pytest.raises(RepositoryError, match="already exist"):
+            await repository.create_many([duplicate_model])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("id_type", [str, ObjectId])
+    async def test_get_by_id_success(self, repository, sample_model, id_type):
+        """Test successful model retrieval by hex string or ObjectId."""
         # Arrange
         created = await repository.create(sample_model)
 
         # Act
-        result = await repository.get_by_id(str(created.model_id))
+        result = await repository.get_by_id(id_type(created.model_id))
 
         # Assert
         assert result is not None
@@ -132,7 +208,7 @@ class TestMongoModelRepositoryIntegration:
     async def test_get_by_id_not_found(self, repository):
         """Test model retrieval with non-existent ID."""
         # Arrange
-        non_existent_id = str(ObjectId())
+        non_existent_id = ObjectId()
 
         # Act
         result = await repository.get_by_id(non_existent_id)
@@ -175,7 +251,7 @@ class TestMongoModelRepositoryIntegration:
             name="Updated Integration Test Model",
             positions=created.positions,
             portfolios=created.portfolios + ["new-portfolio"],
-            last_rebalance_date=datetime.now(timezone.utc),
+            last_rebalance_date=_REBALANCE_DATE,
             version=created.version,
         )
 
@@ -187,7 +263,7 @@ class TestMongoModelRepositoryIntegration:
         assert len(result.portfolios) == 3
         assert "new-portfolio" in result.portfolios
         assert result.version == created.version + 1
-        assert result.last_rebalance_date is not None
+        assert result.last_rebalance_date == _REBALANCE_DATE
 
     @pytest.mark.asyncio
     async def test_update_model_concurrent_modification_fails(
@@ -216,26 +292,47 @@ class TestMongoModelRepositoryIntegration:
             await repository.update(updated_model)
 
     @pytest.mark.asyncio
-    async def test_delete_model_success(self, repository, sample_model):
+    @pytest.mark.parametrize("version_offset", [-1, 1])
+    async def test_update_model_version_mismatch_fails(
+        self, repository, sample_model, version_offset
+    ):
+        """Test that updates carrying any version but the stored one are rejected."""
+        # Arrange - the mismatch is made in memory, without a concurrent write
+        created = await repository.create(sample_model)
+        mismatched_model = InvestmentModel(
+            model_id=created.model_id,
+            name="Mismatched Update",
+            positions=created.positions,
+            portfolios=created.portfolios,
+            version=created.version + version_offset,
+        )
+
+        # Act & Assert
+        with pytest.raises(ConcurrencyError, match="has been modified"):
+            await repository.update(mismatched_model)
+
+    @pytest.mark.asyncio
+    async def test_delete_model_success(
+        self, repository, model_collection, sample_model
+    ):
         """Test successful model deletion."""
         # Arrange
         created = await repository.create(sample_model)
 
         # Act
-        success = await repository.delete(str(created.model_id))
+        success = await repository.delete(created.model_id)
 
         # Assert
         assert success is True
 
         # Verify deletion
-        result = await repository.get_by_id(str(created.model_id))
-        assert result is None
+        assert await model_collection.count_documents({"_id": created.model_id}) == 0
 
     @pytest.mark.asyncio
     async def test_delete_model_not_found(self, repository):
         """Test deletion of non-existent model."""
         # Arrange
-        non_existent_id = str(ObjectId())
+        non_existent_id = ObjectId()
 
         # Act
         success = await repository.delete(non_existent_id)
@@ -246,9 +343,8 @@ class TestMongoModelRepositoryIntegration:
     @pytest.mark.asyncio
     async def test_list_all_models(self, repository, sample_model):
         """Test listing all models."""
-        # Arrange
-        model1 = await repository.create(sample_model)
-
+        # Arrange - seed both models in one batch
+        model1 = sample_model
         model2 = InvestmentModel(
             model_id=ObjectId(),
             name="Second Integration Model",
@@ -257,23 +353,25 @@ class TestMongoModelRepositoryIntegration:
                     security_id="STOCK9876543210987654321",
                     target=TargetPercentage(Decimal("0.60")),
                     drift_bounds=DriftBounds(
-                        low_drift=Decimal("0.03"), high_drift=Decimal("0.04")
+                        low_drift=_DRIFT_3PCT, high_drift=Decimal("0.04")
                     ),
                 )
             ],
             portfolios=["portfolio-2"],
             version=1,
         )
-        model2 = await repository.create(model2)
+        await repository.create_many([model1, model2])
 
         # Act
         results = await repository.list_all()
 
-        # Assert
-        assert len(results) >= 2
-        model_ids = [model.model_id for model in results]
-        assert model1.model_id in model_ids
-        assert model2.model_id in model_ids
+        # Assert - model_collection starts each test empty, so list_all only
+        # scans the two models seeded here
+        assert {model.model_id for model in results} == {
+            model1.model_id,
+            model2.model_id,
+        }
+        assert len(results) == 2
 
     @pytest.mark.asyncio
     async def test_exists_by_name_true(self, repository, sample_model):
@@ -306,11 +404,25 @@ class TestMongoModelRepositoryIntegration:
         results = await repository.find_by_portfolio("portfolio-integration-1")
 
         # Assert
-        assert len(results) >= 1
-        found_model = next((m for m in results if m.model_id == created.model_id), None)
-        assert found_model is not None
+        # model_collection starts each test empty, so this model is the only match
+        [found_model] = results
+        assert found_model.model_id == created.model_id
         assert "portfolio-integration-1" in found_model.portfolios
 
+    @pytest.mark.asyncio
+    async def test_find_ids_by_portfolio(self, repository, sample_model):
+        """Test finding only the IDs of models associated with a portfolio."""
+        # Arrange
+        created = await repository.create(sample_model)
+
+        # Act
+        ids = await repository.find_ids_by_portfolio("portfolio-integration-1")
+        missing = await repository.find_ids_by_portfolio("non-existent-portfolio")
+
+        # Assert
+        assert created.model_id in ids
+        assert missing == []
+
     @pytest.mark.asyncio
     async def test_find_by_portfolio_no_results(self, repository):
         """Test finding models by non-existent portfolio."""
@@ -324,33 +436,20 @@ class TestMongoModelRepositoryIntegration:
     async def test_find_by_last_rebalance_date(self, repository, sample_model):
         """Test finding models by last rebalance date."""
         # Arrange - Use a fixed cutoff date to avoid precision issues
-        cutoff_date = datetime(
-            2024, 1, 1, 12, 0, 0
-        )  # Timezone-naive to match domain entity
+        cutoff_date = _REBALANCE_CUTOFF
 
         # Create model with recent rebalance date
-        recent_model = InvestmentModel(
-            model_id=sample_model.model_id,
-            name=sample_model.name,
-            positions=sample_model.positions,
-            portfolios=sample_model.portfolios,
-            last_rebalance_date=cutoff_date,
-            version=1,
-        )
+        recent_model = replace(sample_model, last_rebalance_date=cutoff_date)
         created = await repository.create(recent_model)
 
         # Act
         results = await repository.find_by_last_rebalance_date(cutoff_date)
 
         # Assert
-        assert len(results) >= 1
-        found_model = next((m for m in results if m.model_id == created.model_id), None)
-        assert found_model is not None
-        # Convert both to naive datetime for comparison if needed
-        found_date = found_model.last_rebalance_date
-        if found_date and found_date.tzinfo is not None:
-            found_date = found_date.replace(tzinfo=None)
-        assert found_date >= cutoff_date
+        # model_collection starts each test empty, so this model is the only match
+        [found_model] = results
+        assert found_model.model_id == created.model_id
+        assert found_model.last_rebalance_date >= cutoff_date
 
     @pytest.mark.asyncio
     async def test_get_models_by_security(self, repository, sample_model):
@@ -362,9 +461,9 @@ class TestMongoModelRepositoryIntegration:
         results = await repository.get_models_by_security("STOCK1234567890123456789")
 
         # Assert
-        assert len(results) >= 1
-        found_model = next((m for m in results if m.model_id == created.model_id), None)
-        assert found_model is not None
+        # model_collection starts each test empty, so this model is the only match
+        [found_model] = results
+        assert found_model.model_id == created.model_id
 
         # Verify the security is in the model
         security_ids = [pos.security_id for pos in found_model.positions]
@@ -398,13 +497,8 @@ class TestMongoModelRepositoryIntegration:
     async def test_find_models_needing_rebalance(self, repository, sample_model):
         """Test finding models that need rebalancing."""
         # Arrange - Create model without recent rebalance
-        old_rebalance_model = InvestmentModel(
-            model_id=sample_model.model_id,
-            name=sample_model.name,
-            positions=sample_model.positions,
-            portfolios=sample_model.portfolios,
-            last_rebalance_date=None,  # Never rebalanced
-            version=1,
+        old_rebalance_model = replace(
+            sample_model, last_rebalance_date=None  # Never rebalanced
         )
         created = await repository.create(old_rebalance_model)
 
@@ -412,9 +506,9 @@ class TestMongoModelRepositoryIntegration:
         results = await repository.find_models_needing_rebalance(days_threshold=1)
 
         # Assert
-        assert len(results) >= 1
-        found_model = next((m for m in results if m.model_id == created.model_id), None)
-        assert found_model is not None
+        # model_collection starts each test empty, so this model is the only match
+        [found_model] = results
+        assert found_model.model_id == created.model_id
         assert found_model.last_rebalance_date is None
 
     @pytest.mark.asyncio
@@ -430,18 +524,18 @@ class TestMongoModelRepositoryIntegration:
     @pytest.mark.asyncio
     async def test_large_model_handling(self, repository):
         """Test handling of models with many positions."""
-        # Arrange - Create model with maximum positions
-        positions = []
-        for i in range(100):  # Maximum allowed positions
-            positions.append(
-                Position(
-                    security_id=f"STOCK{i:019d}",  # 24-char security ID
-                    target=TargetPercentage(Decimal("0.005")),  # Small valid target
-                    drift_bounds=DriftBounds(
-                        low_drift=Decimal("0.01"), high_drift=Decimal("0.02")
-                    ),
-                )
+        # Arrange - Create model with maximum positions; the value objects are
+        # immutable, so every position shares one target and one drift bounds
+        target = TargetPercentage(Decimal("0.005"))  # Small valid target
+        drift_bounds = DriftBounds(low_drift=_DRIFT_1PCT, high_drift=_DRIFT_2PCT)
+        positions = [
+            Position(
+                security_id=f"STOCK{i:019d}",  # 24-char security ID
+                target=target,
+                drift_bounds=drift_bounds,
             )
+            for i in range(100)  # Maximum allowed positions
+        ]
 
         large_model = InvestmentModel(
             model_id=ObjectId(),
@@ -451,14 +545,13 @@ class TestMongoModelRepositoryIntegration:
             version=1,
         )
 
-        # Act
+        # Act - create returns the model converted from the saved document
         created = await repository.create(large_model)
-        retrieved = await repository.get_by_id(str(created.model_id))
 
         # Assert
-        assert retrieved is not None
-        assert len(retrieved.positions) == 100
-        assert retrieved.name == "Large Integration Model"
+        assert created is not None
+        assert len(created.positions) == 100
+        assert created.name == "Large Integration Model"
 
 
 @pytest.mark.integration
@@ -466,20 +559,17 @@ class TestBeanieODMIntegration:
     """Integration tests for Beanie ODM document operations."""
 
     @pytest.mark.asyncio
-    async def test_document_creation_and_validation(self, test_database):
+    async def test_document_creation_and_validation(self, model_collection):
         """Test Beanie document creation with validation."""
-        # Initialize Beanie for testing
-        await init_beanie(database=test_database, document_models=[ModelDocument])
-
         # Arrange
         doc = ModelDocument(
             name="ODM Test Model",
             positions=[
                 {
                     "security_id": "STOCK1234567890123456789",
-                    "target": Decimal("0.40"),
-                    "high_drift": Decimal("0.03"),
-                    "low_drift": Decimal("0.02"),
+                    "target": _TARGET_40PCT,
+                    "high_drift": _DRIFT_3PCT,
+                    "low_drift": _DRIFT_2PCT,
                 }
             ],
             portfolios=["odm-portfolio"],
@@ -496,21 +586,19 @@ class TestBeanieODMIntegration:
         assert saved_doc.version == 1
 
     @pytest.mark.asyncio
-    async def test_document_indexing(self, test_database):
+    async def test_document_indexing(self, model_collection):
         """Test that database indexes are working correctly."""
-        # Initialize Beanie for testing
-        await init_beanie(database=test_database, document_models=[ModelDocument])
-
         # Arrange - Create multiple documents
-        docs = []
-        for i in range(5):
-            doc = ModelDocument(
+        docs = [
+            ModelDocument(
                 name=f"Index Test Model {i}",
                 positions=[],
                 portfolios=[f"portfolio-{i}"],
                 version=1,
             )
-            docs.append(await doc.create())
+            for i in range(5)
+        ]
+        await ModelDocument.insert_many(docs)
 
         # Act - Query by name (should use unique index)
         found_by_name = await ModelDocument.find_one({"name": "Index Test Model 2"})
@@ -529,29 +617,27 @@ class TestBeanieODMIntegration:
         assert found_by_portfolio[0].name == "Index Test Model 3"
 
     @pytest.mark.asyncio
-    async def test_document_aggregation_pipeline(self, test_database):
+    async def test_document_aggregation_pipeline(self, model_collection):
         """Test MongoDB aggregation pipeline operations."""
-        # Initialize Beanie for testing
-        await init_beanie(database=test_database, document_models=[ModelDocument])
-
         # Arrange - Create test documents
-        test_docs = []
-        for i in range(3):
-            doc = ModelDocument(
+        test_docs = [
+            ModelDocument(
                 name=f"Aggregation Model {i}",
                 positions=[
                     {
                         "security_id": f"STOCK{j:019d}",
                         "target": Decimal("0.10"),
-                        "high_drift": Decimal("0.02"),
-                        "low_drift": Decimal("0.01"),
+                        "high_drift": _DRIFT_2PCT,
+                        "low_drift": _DRIFT_1PCT,
                     }
                     for j in range(i + 1)  # Different number of positions
                 ],
                 portfolios=[f"agg-portfolio-{i}"],
                 version=1,
             )
-            test_docs.append(await doc.create())
+            for i in range(3)
+        ]
+        await ModelDocument.insert_many(test_docs)
 
         # Act - Aggregate position counts
         pipeline = [
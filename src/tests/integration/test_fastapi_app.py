@@ -11,6 +11,7 @@ This module tests the full application configuration including:
 """
 
 import json
+from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -24,7 +25,7 @@ from src.core.exceptions import (
     OptimizationError,
     ValidationError,
 )
-from src.main import create_app
+from src.main import create_app, main
 
 
 class TestApplicationFactory:
@@ -36,9 +37,76 @@ class TestApplicationFactory:
 
         assert app.title == "GlobeCo Order Generation Service"
         assert app.version == "0.1.0"
-        assert app.docs_url == "/docs"
-        assert app.redoc_url == "/redoc"
-        assert app.openapi_url == "/openapi.json"
+        # Docs are only exposed in debug builds
+        assert app.docs_url is None
+        assert app.redoc_url is None
+        assert app.openapi_url is None
+
+    def test_module_app_built_lazily_once(self):
+        """Test that src.main:app is built on first access and then reused."""
+        import src.main
+
+        with patch("src.main.create_app", wraps=create_app) as mock_create_app:
+            src.main.__dict__.pop("app", None)
+            src.main.get_app.cache_clear()
+            first = src.main.app
+            second = src.main.app
+
+        assert first is second
+        assert src.main.get_app() is first
+        mock_create_app.assert_called_once()
+
+    def test_opentelemetry_setup_skipped_when_disabled(self):
+        """Test that OTel providers are not installed when export is disabled."""
+        import src.main
+
+        with patch("opentelemetry.trace.set_tracer_provider") as mock_set_provider:
+            src.main._configure_opentelemetry(Settings(otel_enabled=False))
+
+        mock_set_provider.assert_not_called()
+
+    def test_opentelemetry_tracer_samples_by_ratio(self):
+        """Test that the tracer provider uses the configured sample ratio."""
+        import src.main
+
+        settings = Settings(otel_enabled=True, otel_sample_ratio=0.01)
+        with (
+            patch.object(src.main, "_otel_configured", False),
+            patch("opentelemetry.trace.set_tracer_provider") as mock_set_provider,
+            patch("opentelemetry.metrics.set_meter_provider"),
+        ):
+            src.main._configure_opentelemetry(settings)
+
+        tracer_provider = mock_set_provider.call_args.args[0]
+        assert "TraceIdRatioBased{0.01}" in tracer_provider.sampler.get_description()
+        tracer_provider.shutdown()
+
+    def test_scrape_and_probe_endpoints_not_traced(self):
+        """Test that /metrics and /health requests are excluded from tracing."""
+        with (
+            patch("src.main.get_settings", return_value=Settings(otel_enabled=True)),
+            patch(
+                "opentelemetry.instrumentation.fastapi.FastAPIInstrumentor.instrument_app"
+            ) as mock_instrument_app,
+        ):
+            create_app()
+
+        excluded_urls = mock_instrument_app.call_args.kwargs["excluded_urls"]
+        assert excluded_urls.split(",") == ["/metrics", "/health"]
+
+    def test_request_spans_disabled_with_tracing(self):
+        """Test that FastAPI is not instrumented when tracing is disabled."""
+        settings = Settings(otel_enabled=True, tracing_enabled=False)
+        with (
+            patch("src.main.get_settings", return_value=settings),
+            patch(
+                "opentelemetry.instrumentation.fastapi.FastAPIInstrumentor.instrument_app"
+            ) as mock_instrument_app,
+        ):
+            app = create_app()
+
+        mock_instrument_app.assert_not_called()
+        assert TestClient(app).get("/health/live").status_code == 200
 
     def test_app_includes_all_routers(self):
         """Test that application includes all required routers."""
@@ -90,6 +158,9 @@ class TestApplicationFactory:
             app = create_app()
             assert app.title == "Custom Test Service"
             assert app.version == "1.0.0"
+            assert app.docs_url == "/docs"
+            assert app.redoc_url == "/redoc"
+            assert app.openapi_url == "/openapi.json"
 
 
 class TestApplicationLifecycle:
@@ -225,6 +296,24 @@ class TestGlobalExceptionHandling:
             # Check that it's a string error message (actual format)
             assert "timed out" in str(error_response).lower()
 
+    def test_builtin_timeout_error_for_health_paths(self):
+        """Test TimeoutError on health paths returns the not-ready payload."""
+        app = create_app()
+
+        @app.get("/health/slow")
+        async def slow_health():
+            raise TimeoutError("probe timed out")
+
+        client = TestClient(app, raise_server_exceptions=False)
+        response = client.get("/health/slow")
+
+        assert response.status_code == 503
+        body = response.json()
+        assert body["status"] == "not_ready"
+        assert body["error"] == {"code": "TIMEOUT", "message": "probe timed out"}
+        assert body["timestamp"].endswith("Z")
+        datetime.fromisoformat(body["timestamp"].removesuffix("Z"))
+
     def test_validation_error_handling(self):
         """Test validation error responses."""
         app = create_app()
@@ -416,6 +505,22 @@ class TestGlobalExceptionHandling:
 class TestRouterIntegration:
     """Test router integration within the application."""
 
+    def test_metrics_endpoint_renders_off_event_loop(self):
+        """Test that /metrics renders the registry through the threadpool."""
+        app = create_app()
+        client = TestClient(app)
+
+        with patch(
+            "src.main.run_in_threadpool", new_callable=AsyncMock
+        ) as mock_threadpool:
+            mock_threadpool.return_value = b"# metrics\n"
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.content == b"# metrics\n"
+        assert response.headers["content-type"].startswith("text/plain")
+        assert mock_threadpool.await_args.args[0].__name__ == "generate_latest"
+
     def test_health_router_integration(self):
         """Test health router is properly integrated."""
         app = create_app()
@@ -525,6 +630,12 @@ class TestRouterIntegration:
 class TestOpenAPIDocumentation:
     """Test OpenAPI/Swagger documentation generation."""
 
+    @pytest.fixture
+    def debug_app(self):
+        """Create an application with debug-only docs endpoints enabled."""
+        with patch("src.main.get_settings", return_value=Settings(debug=True)):
+            return create_app()
+
     def test_openapi_schema_generation(self):
         """Test that OpenAPI schema is properly generated."""
         app = create_app()
@@ -535,28 +646,25 @@ class TestOpenAPIDocumentation:
         assert "paths" in openapi_schema
         assert "components" in openapi_schema
 
-    def test_docs_endpoint_accessible(self):
+    def test_docs_endpoint_accessible(self, debug_app):
         """Test that Swagger UI is accessible."""
-        app = create_app()
-        client = TestClient(app)
+        client = TestClient(debug_app)
 
         response = client.get("/docs")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_redoc_endpoint_accessible(self):
+    def test_redoc_endpoint_accessible(self, debug_app):
         """Test that ReDoc documentation is accessible."""
-        app = create_app()
-        client = TestClient(app)
+        client = TestClient(debug_app)
 
         response = client.get("/redoc")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_openapi_json_endpoint(self):
+    def test_openapi_json_endpoint(self, debug_app):
         """Test that OpenAPI JSON schema is accessible."""
-        app = create_app()
-        client = TestClient(app)
+        client = TestClient(debug_app)
 
         response = client.get("/openapi.json")
         assert response.status_code == 200
@@ -567,6 +675,15 @@ class TestOpenAPIDocumentation:
         assert "info" in openapi_data
         assert "paths" in openapi_data
 
+    def test_docs_disabled_outside_debug(self):
+        """Test that docs and schema endpoints are not served in production."""
+        with patch("src.main.get_settings", return_value=Settings(debug=False)):
+            app = create_app()
+        client = TestClient(app)
+
+        for path in ("/docs", "/redoc", "/openapi.json"):
+            assert client.get(path).status_code == 404
+
     def test_api_endpoints_documented(self):
         """Test that all API endpoints are documented in OpenAPI."""
         app = create_app()
@@ -664,6 +781,43 @@ class TestApplicationConfiguration:
             assert app.title == "Test Service"
 
 
+class TestMainEntryPoint:
+    """Test the uvicorn entry point configuration."""
+
+    def test_main_uses_uvloop_httptools_and_workers(self):
+        """Test that main() runs uvicorn with the fast loop/parser and workers."""
+        custom_settings = Settings(debug=False, workers=4)
+
+        with (
+            patch("src.main.get_settings", return_value=custom_settings),
+            patch("uvicorn.run") as mock_run,
+        ):
+            main()
+
+        kwargs = mock_run.call_args.kwargs
+        assert mock_run.call_args.args == ("src.main:get_app",)
+        assert kwargs["factory"] is True
+        assert kwargs["loop"] == "uvloop"
+        assert kwargs["http"] == "httptools"
+        assert kwargs["workers"] == 4
+        assert kwargs["reload"] is False
+        assert kwargs["access_log"] is False
+
+    def test_main_reload_excludes_workers(self):
+        """Test that debug reload mode does not request multiple workers."""
+        custom_settings = Settings(debug=True, workers=4)
+
+        with (
+            patch("src.main.get_settings", return_value=custom_settings),
+            patch("uvicorn.run") as mock_run,
+        ):
+            main()
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["reload"] is True
+        assert kwargs["workers"] is None
+
+
 class TestApplicationSecurity:
     """Test application security configuration."""
 
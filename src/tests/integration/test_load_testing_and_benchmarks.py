@@ -25,16 +25,27 @@ from src.schemas.models import ModelDTO
 from src.schemas.rebalance import DriftDTO, RebalanceDTO, TransactionDTO
 
 
+@pytest.fixture(scope="module")
+def app_client():
+    """Create one test client with the full application for the module.
+
+    The app is built once; tests only swap services through dependency
+    overrides, which clear_dependency_overrides resets after each test.
+    """
+    return TestClient(create_app())
+
+
+@pytest.fixture(autouse=True)
+def clear_dependency_overrides(app_client):
+    """Remove the service mocks a test installed on the shared app."""
+    yield
+    app_client.app.dependency_overrides.clear()
+
+
 @pytest.mark.integration
 class TestConcurrentLoadScenarios:
     """Test system behavior under concurrent load scenarios."""
 
-    @pytest.fixture
-    def app_client(self):
-        """Create test client with full application."""
-        app = create_app()
-        return TestClient(app)
-
     @pytest.fixture
     def performance_model_data(self):
         """Large model data for performance testing."""
@@ -115,9 +126,6 @@ class TestConcurrentLoadScenarios:
                 data = response.json()
                 assert isinstance(data, list), "Response should be a list of models"
 
-        # Cleanup
-        app_client.app.dependency_overrides.clear()
-
     @pytest.mark.asyncio
     async def test_concurrent_rebalancing_load(self, app_client):
         """Test concurrent rebalancing requests under load."""
@@ -181,9 +189,6 @@ class TestConcurrentLoadScenarios:
         total_time = end_time - start_time
         assert total_time < 10.0, f"Took too long: {total_time:.2f}s"
 
-        # Cleanup
-        app_client.app.dependency_overrides.clear()
-
     @pytest.mark.asyncio
     async def test_mixed_operation_load_testing(
         self, app_client, performance_model_data
@@ -267,20 +272,11 @@ class TestConcurrentLoadScenarios:
         assert avg_response_time < 0.1  # Average response time under 100ms
         assert total_time < 15.0  # Total time under 15 seconds
 
-        # Cleanup
-        app_client.app.dependency_overrides.clear()
-
 
 @pytest.mark.integration
 class TestPerformanceBenchmarks:
     """Test system performance benchmarks and SLA compliance."""
 
-    @pytest.fixture
-    def app_client(self):
-        """Create test client with full application."""
-        app = create_app()
-        return TestClient(app)
-
     @pytest.mark.asyncio
     @pytest.mark.xfail(
         reason="Complex service dependency mocking conflicts with portfolio ID validation chains. "
@@ -374,9 +370,6 @@ class TestPerformanceBenchmarks:
         assert benchmarks["get_model"] < 0.2  # Read operations under 200ms
         assert benchmarks["rebalance_portfolio"] < 0.5  # Rebalancing under 500ms
 
-        # Cleanup
-        app_client.app.dependency_overrides.clear()
-
     @pytest.mark.asyncio
     @pytest.mark.xfail(
         reason="Complex service dependency mocking conflicts with portfolio ID validation chains. "
@@ -448,9 +441,6 @@ class TestPerformanceBenchmarks:
         avg_response_time = total_time / len(responses)
         assert avg_response_time < 0.5  # Average response time under 500ms
 
-        # Cleanup
-        app_client.app.dependency_overrides.clear()
-
     @pytest.mark.asyncio
     async def test_scalability_stress_testing(self, app_client):
         """Test system scalability under increasing stress levels."""
@@ -507,20 +497,11 @@ class TestPerformanceBenchmarks:
             # Response time shouldn't more than double with increased load
             assert curr_time < prev_time * 2.5
 
-        # Cleanup
-        app_client.app.dependency_overrides.clear()
-
 
 @pytest.mark.integration
 class TestMathematicalComplexityScenarios:
     """Test system behavior with mathematically complex optimization scenarios."""
 
-    @pytest.fixture
-    def app_client(self):
-        """Create test client with full application."""
-        app = create_app()
-        return TestClient(app)
-
     @pytest.mark.asyncio
     @pytest.mark.xfail(
         reason="Complex service dependency mocking conflicts with portfolio ID validation chains. "
@@ -628,9 +609,6 @@ class TestMathematicalComplexityScenarios:
             total_time < 15.0
         ), f"Complex optimization took too long: {total_time:.2f}s"
 
-        # Cleanup
-        app_client.app.dependency_overrides.clear()
-
     @pytest.mark.asyncio
     @pytest.mark.xfail(
         reason="Complex service dependency mocking conflicts with portfolio ID validation chains. "
@@ -762,6 +740,3 @@ class TestMathematicalComplexityScenarios:
         assert (
             total_time < 15.0
         ), f"Complex optimization took too long: {total_time:.2f}s"
-
-        # Cleanup
-        app_client.app.dependency_overrides.clear()
@@ -9,9 +9,10 @@ This module tests the middleware stack including:
 - Error handling through middleware chain
 """
 
+import asyncio
 import json
 import uuid
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 from fastapi import Request, Response
@@ -19,7 +20,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
 
 from src.core.utils import get_correlation_id
-from src.main import correlation_middleware, create_app, security_headers_middleware
+from src.main import ContextAndHeadersMiddleware, create_app
 
 
 class TestCORSMiddleware:
@@ -96,167 +97,222 @@ class TestCORSMiddleware:
             assert method in response.headers["Access-Control-Allow-Methods"]
 
 
-class TestCorrelationMiddleware:
-    """Test correlation ID middleware for request tracing."""
+def make_scope(path="/api/v1/models", headers=None):
+    """Create a minimal ASGI HTTP scope."""
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": headers or [],
+        "client": ("127.0.0.1", 12345),
+    }
 
-    @pytest.fixture
-    def mock_request(self):
-        """Create a mock request object."""
-        request = Mock(spec=Request)
-        request.method = "GET"
-        request.url = Mock()
-        request.url.path = "/api/v1/models"
-        request.url.__str__ = Mock(return_value="http://test/api/v1/models")
-        request.client = Mock()
-        request.client.host = "127.0.0.1"
-        request.headers = {}
-        return request
 
-    @pytest.fixture
-    def mock_response(self):
-        """Create a mock response object."""
-        response = Mock(spec=Response)
-        response.headers = {}
-        response.status_code = 200
-        return response
+def make_downstream_app(status=200, headers=None):
+    """Create a downstream ASGI app returning an empty response."""
+
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": list(headers or []),
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
 
-    @pytest.fixture
-    def mock_call_next(self, mock_response):
-        """Create a mock call_next function."""
 
-        async def call_next(request):
-            return mock_response
+async def run_middleware(middleware, scope):
+    """Run an ASGI middleware and return the response start headers as a dict."""
+    messages = []
 
-        return call_next
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    start = messages[0]
+    return {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in start["headers"]
+    }
+
+
+class TestCorrelationHandling:
+    """Test correlation ID handling for request tracing."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create the context middleware wrapping a trivial downstream app."""
+        return ContextAndHeadersMiddleware(make_downstream_app())
 
     @pytest.mark.asyncio
-    async def test_correlation_id_generated_when_missing(
-        self, mock_request, mock_call_next
-    ):
+    async def test_correlation_id_generated_when_missing(self, middleware):
         """Test that correlation ID is generated when not provided."""
         # No correlation ID in headers
-        mock_request.headers = {}
-
-        response = await correlation_middleware(mock_request, mock_call_next)
+        headers = await run_middleware(middleware, make_scope())
 
         # Verify correlation ID was added to response
-        assert "X-Correlation-ID" in response.headers
-        correlation_id = response.headers["X-Correlation-ID"]
+        assert "x-correlation-id" in headers
+        correlation_id = headers["x-correlation-id"]
         assert len(correlation_id) > 0
         # Should be a valid UUID format
         uuid.UUID(correlation_id)  # Will raise ValueError if invalid
 
     @pytest.mark.asyncio
-    async def test_correlation_id_preserved_when_provided(
-        self, mock_request, mock_call_next
-    ):
+    async def test_correlation_id_preserved_when_provided(self, middleware):
         """Test that existing correlation ID is preserved."""
         existing_id = str(uuid.uuid4())
-        mock_request.headers = {"X-Correlation-ID": existing_id}
+        scope = make_scope(headers=[(b"x-correlation-id", existing_id.encode())])
 
-        response = await correlation_middleware(mock_request, mock_call_next)
+        headers = await run_middleware(middleware, scope)
 
         # Verify existing correlation ID was preserved
-        assert response.headers["X-Correlation-ID"] == existing_id
+        assert headers["x-correlation-id"] == existing_id
 
     @pytest.mark.asyncio
-    async def test_correlation_id_set_in_context(self, mock_request, mock_call_next):
+    async def test_correlation_id_set_in_context(self, middleware):
         """Test that correlation ID is set in request context."""
         correlation_id = str(uuid.uuid4())
-        mock_request.headers = {"X-Correlation-ID": correlation_id}
+        scope = make_scope(headers=[(b"x-correlation-id", correlation_id.encode())])
 
         with patch("src.main.set_correlation_id") as mock_set_id:
-            await correlation_middleware(mock_request, mock_call_next)
+            await run_middleware(middleware, scope)
             mock_set_id.assert_called_once_with(correlation_id)
 
     @pytest.mark.asyncio
-    async def test_request_logging(self, mock_request, mock_call_next):
+    async def test_correlation_id_visible_downstream(self):
+        """Test that the downstream app sees the request's correlation ID."""
+        seen = []
+
+        async def downstream(scope, receive, send):
+            seen.append(get_correlation_id())
+            await make_downstream_app()(scope, receive, send)
+
+        correlation_id = str(uuid.uuid4())
+        scope = make_scope(headers=[(b"x-correlation-id", correlation_id.encode())])
+
+        await run_middleware(ContextAndHeadersMiddleware(downstream), scope)
+
+        assert seen == [correlation_id]
+
+    @pytest.mark.asyncio
+    async def test_correlation_id_isolated_between_concurrent_requests(self):
+        """Test that concurrent requests do not leak correlation IDs."""
+
+        async def downstream(scope, receive, send):
+            expected = dict(scope["headers"])[b"x-correlation-id"].decode()
+            await asyncio.sleep(0)
+            assert get_correlation_id() == expected
+            await make_downstream_app()(scope, receive, send)
+
+        middleware = ContextAndHeadersMiddleware(downstream)
+        correlation_ids = [str(uuid.uuid4()) for _ in range(10)]
+
+        results = await asyncio.gather(
+            *(
+                asyncio.create_task(
+                    run_middleware(
+                        middleware,
+                        make_scope(headers=[(b"x-correlation-id", cid.encode())]),
+                    )
+                )
+                for cid in correlation_ids
+            )
+        )
+
+        assert [r["x-correlation-id"] for r in results] == correlation_ids
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passed_through(self):
+        """Test that non-HTTP scopes bypass correlation handling."""
+        downstream = AsyncMock()
+        middleware = ContextAndHeadersMiddleware(downstream)
+        scope = {"type": "lifespan"}
+
+        with patch("src.main.set_correlation_id") as mock_set_id:
+            await middleware(scope, None, None)
+
+        downstream.assert_awaited_once_with(scope, None, None)
+        mock_set_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_request_logging(self, middleware):
         """Test that requests are logged with proper details."""
         with patch("src.main.logger") as mock_logger:
-            await correlation_middleware(mock_request, mock_call_next)
+            await run_middleware(middleware, make_scope())
 
             # Verify request logging
-            mock_logger.info.assert_any_call(
+            mock_logger.debug.assert_any_call(
                 "Request received",
                 method="GET",
-                url="http://test/api/v1/models",
+                path="/api/v1/models",
+                query="",
                 client_ip="127.0.0.1",
             )
 
     @pytest.mark.asyncio
-    async def test_response_logging(self, mock_request, mock_call_next):
+    async def test_response_logging(self, middleware):
         """Test that responses are logged with proper details."""
         with patch("src.main.logger") as mock_logger:
-            await correlation_middleware(mock_request, mock_call_next)
+            await run_middleware(middleware, make_scope())
 
             # Verify response logging
-            mock_logger.info.assert_any_call(
+            mock_logger.debug.assert_any_call(
                 "Request completed",
                 method="GET",
-                url="http://test/api/v1/models",
+                path="/api/v1/models",
                 status_code=200,
+                duration_ms=ANY,
             )
 
+    @pytest.mark.asyncio
+    async def test_request_logging_skipped_above_debug(self, middleware):
+        """Test that no per-request logging happens when debug is disabled."""
+        with patch("src.main.logger") as mock_logger:
+            mock_logger.is_enabled_for.return_value = False
 
-class TestSecurityHeadersMiddleware:
-    """Test security headers middleware."""
+            headers = await run_middleware(middleware, make_scope())
 
-    @pytest.fixture
-    def mock_request(self):
-        """Create a mock request object."""
-        request = Mock(spec=Request)
-        # Mock URL with non-docs path
-        request.url.path = "/api/v1/models"
-        return request
+            mock_logger.debug.assert_not_called()
+            assert "x-correlation-id" in headers
 
-    @pytest.fixture
-    def mock_response(self):
-        """Create a mock response object."""
-        response = Mock(spec=Response)
-        response.headers = {}
-        return response
-
-    @pytest.fixture
-    def mock_call_next(self, mock_response):
-        """Create a mock call_next function."""
 
-        async def call_next(request):
-            return mock_response
+class TestSecurityHeaders:
+    """Test security headers added by the context middleware."""
 
-        return call_next
+    @pytest.fixture
+    def middleware(self):
+        """Create the context middleware wrapping a trivial downstream app."""
+        return ContextAndHeadersMiddleware(make_downstream_app())
 
     @pytest.mark.asyncio
-    async def test_security_headers_added_regular_endpoints(
-        self, mock_call_next, mock_response
-    ):
+    async def test_security_headers_added_regular_endpoints(self, middleware):
         """Test that all required security headers are added for regular endpoints."""
-        # Create mock request for regular endpoint
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/api/v1/models"
-
-        response = await security_headers_middleware(mock_request, mock_call_next)
+        headers = await run_middleware(middleware, make_scope("/api/v1/models"))
 
         # Verify all expected security headers are present
         expected_headers = {
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block",
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Content-Security-Policy": "default-src 'self'",
+            "x-content-type-options": "nosniff",
+            "x-frame-options": "DENY",
+            "x-xss-protection": "1; mode=block",
+            "strict-transport-security": "max-age=31536000; includeSubDomains",
+            "referrer-policy": "strict-origin-when-cross-origin",
+            "content-security-policy": "default-src 'self'",
         }
 
         for header, value in expected_headers.items():
-            assert response.headers[header] == value
+            assert headers[header] == value
 
     @pytest.mark.asyncio
-    async def test_security_headers_docs_endpoints(self, mock_call_next, mock_response):
+    async def test_security_headers_docs_endpoints(self, middleware):
         """Test that docs endpoints get relaxed CSP headers."""
-        # Create mock request for docs endpoint
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/docs"
-
-        response = await security_headers_middleware(mock_request, mock_call_next)
+        headers = await run_middleware(middleware, make_scope("/docs"))
 
         # Verify relaxed CSP for docs endpoints
         expected_csp = (
@@ -267,25 +323,58 @@ class TestSecurityHeadersMiddleware:
             "font-src 'self' https://cdn.jsdelivr.net https://unpkg.com;"
         )
 
-        assert response.headers["Content-Security-Policy"] == expected_csp
+        assert headers["content-security-policy"] == expected_csp
 
         # Other headers should remain the same
-        assert response.headers["X-Content-Type-Options"] == "nosniff"
-        assert response.headers["X-Frame-Options"] == "DENY"
+        assert headers["x-content-type-options"] == "nosniff"
+        assert headers["x-frame-options"] == "DENY"
 
     @pytest.mark.asyncio
-    async def test_security_headers_not_overwritten(self, mock_request, mock_call_next):
-        """Test that existing security headers are not overwritten."""
-        response = Mock(spec=Response)
-        response.headers = {"X-Frame-Options": "SAMEORIGIN"}
+    async def test_docs_csp_not_relaxed_when_docs_disabled(self):
+        """Test that docs paths keep the strict CSP when docs are disabled."""
+        middleware = ContextAndHeadersMiddleware(
+            make_downstream_app(), docs_enabled=False
+        )
+
+        headers = await run_middleware(middleware, make_scope("/docs"))
 
-        async def call_next_with_headers(request):
-            return response
+        assert headers["content-security-policy"] == "default-src 'self'"
+
+    @pytest.mark.asyncio
+    async def test_security_headers_not_overwritten(self):
+        """Test that existing security headers are not overwritten."""
+        middleware = ContextAndHeadersMiddleware(
+            make_downstream_app(headers=[(b"x-frame-options", b"SAMEORIGIN")])
+        )
 
-        result = await security_headers_middleware(mock_request, call_next_with_headers)
+        headers = await run_middleware(middleware, make_scope())
 
         # Security middleware should overwrite with default values
-        assert result.headers["X-Frame-Options"] == "DENY"
+        assert headers["x-frame-options"] == "DENY"
+
+    @pytest.mark.asyncio
+    async def test_headers_set_in_single_pass(self):
+        """Test that correlation and security headers replace downstream values once."""
+        messages = []
+        downstream = make_downstream_app(
+            headers=[
+                (b"x-correlation-id", b"downstream-id"),
+                (b"content-type", b"application/json"),
+            ]
+        )
+        middleware = ContextAndHeadersMiddleware(downstream)
+        scope = make_scope(headers=[(b"x-correlation-id", b"request-id")])
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(scope, AsyncMock(), send)
+
+        names = [name for name, _ in messages[0]["headers"]]
+        assert names.count(b"x-correlation-id") == 1
+        assert names.count(b"x-frame-options") == 1
+        assert (b"x-correlation-id", b"request-id") in messages[0]["headers"]
+        assert (b"content-type", b"application/json") in messages[0]["headers"]
 
 
 class TestMiddlewareIntegration:
@@ -310,10 +399,10 @@ class TestMiddlewareIntegration:
         # Verify CORS headers (outer middleware) - actual requests get "*"
         assert response.headers["Access-Control-Allow-Origin"] == "*"
 
-        # Verify correlation ID (middle middleware)
+        # Verify correlation ID (context middleware)
         assert response.headers["X-Correlation-ID"] == correlation_id
 
-        # Verify security headers (inner middleware)
+        # Verify security headers (same context middleware pass)
         assert response.headers["X-Content-Type-Options"] == "nosniff"
         assert response.headers["X-Frame-Options"] == "DENY"
 
@@ -476,18 +565,20 @@ class TestMiddlewareLogging:
             response = client.get("/api/v1/models")
 
             # Verify structured logging calls
-            mock_logger.info.assert_any_call(
+            mock_logger.debug.assert_any_call(
                 "Request received",
                 method="GET",
-                url="http://testserver/api/v1/models",
+                path="/api/v1/models",
+                query="",
                 client_ip="testclient",
             )
 
-            mock_logger.info.assert_any_call(
+            mock_logger.debug.assert_any_call(
                 "Request completed",
                 method="GET",
-                url="http://testserver/api/v1/models",
+                path="/api/v1/models",
                 status_code=200,  # Should be 200 with proper mocking
+                duration_ms=ANY,
             )
 
     def test_sensitive_data_not_logged(self):
@@ -0,0 +1,163 @@
+"""
+Tests for core utility functions.
+
+This module tests the cross-cutting helpers in src.core.utils:
+- Cached UTC timestamp formatting
+- Standard response metadata
+- Pre-encoded error envelopes
+- Structured log enrichment
+"""
+
+import contextvars
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from src.core import utils
+from src.core.utils import (
+    create_response_metadata,
+    encode_error_template,
+    format_utc_timestamp,
+    render_error_template,
+    set_correlation_id,
+    set_request_time,
+    utc_now,
+)
+
+
+@pytest.mark.unit
+class TestFormatUtcTimestamp:
+    """Test cached UTC timestamp formatting."""
+
+    def test_matches_datetime_isoformat(self):
+        """Test that the formatted value matches datetime's ISO format."""
+        epoch = datetime(2024, 12, 19, 10, 30, 0, tzinfo=UTC).timestamp() + 0.25
+
+        with patch("src.core.utils.time.time", return_value=epoch):
+            assert format_utc_timestamp() == "2024-12-19T10:30:00.250000"
+
+    def test_prefix_reused_within_same_second(self):
+        """Test that the date prefix is only rendered once per second."""
+        base = datetime(2024, 12, 19, 10, 30, 0, tzinfo=UTC).timestamp()
+
+        with patch("src.core.utils.time.time", return_value=base + 0.1):
+            first = format_utc_timestamp()
+        cached = utils._timestamp_cache
+
+        with patch("src.core.utils.time.time", return_value=base + 0.5):
+            second = format_utc_timestamp()
+
+        assert utils._timestamp_cache is cached
+        assert first[:19] == second[:19]
+        assert second.endswith(".500000")
+
+    def test_prefix_refreshed_on_new_second(self):
+        """Test that the prefix is regenerated when the second changes."""
+        base = datetime(2024, 12, 19, 10, 30, 59, tzinfo=UTC).timestamp()
+
+        with patch("src.core.utils.time.time", return_value=base + 0.9):
+            assert format_utc_timestamp().startswith("2024-12-19T10:30:59")
+        with patch("src.core.utils.time.time", return_value=base + 1.0):
+            assert format_utc_timestamp() == "2024-12-19T10:31:00.000000"
+
+
+@pytest.mark.unit
+class TestUtcNow:
+    """Test the request-scoped UTC clock."""
+
+    def test_returns_current_time_outside_request(self):
+        """Test that the wall clock is used when no request time is set."""
+        before = datetime.now(UTC)
+
+        now = contextvars.Context().run(utc_now)
+
+        assert before <= now <= datetime.now(UTC)
+        assert now.tzinfo is UTC
+
+    def test_returns_request_time_within_request(self):
+        """Test that every call within a request returns its start time."""
+
+        def handle_request():
+            request_time = set_request_time()
+            return request_time, utc_now(), utc_now()
+
+        request_time, first, second = contextvars.Context().run(handle_request)
+
+        assert first is request_time
+        assert second is request_time
+
+
+@pytest.mark.unit
+class TestCreateResponseMetadata:
+    """Test standard response metadata."""
+
+    def test_metadata_fields(self):
+        """Test that metadata contains timestamp, correlation and service info."""
+        set_correlation_id("test-correlation-id")
+
+        metadata = create_response_metadata()
+
+        assert metadata["correlation_id"] == "test-correlation-id"
+        assert metadata["service"] == "order-generation-service"
+        assert metadata["version"] == "0.1.0"
+        datetime.fromisoformat(metadata["timestamp"])
+
+
+@pytest.mark.unit
+class TestErrorTemplates:
+    """Test pre-encoded error envelopes."""
+
+    def test_rendered_template_matches_metadata_envelope(self):
+        """Test that a rendered template equals the dict-built envelope."""
+        set_correlation_id("test-correlation-id")
+        template = encode_error_template("SERVICE_TIMEOUT", "Request timed out")
+
+        with patch("src.core.utils.time.time", return_value=1734604200.5):
+            body = orjson.loads(render_error_template(template))
+            expected = {
+                "error": {
+                    "code": "SERVICE_TIMEOUT",
+                    "message": "Request timed out",
+                    **create_response_metadata(),
+                }
+            }
+
+        assert body == expected
+
+    def test_correlation_id_is_escaped(self):
+        """Test that client-supplied correlation IDs cannot break the JSON."""
+        set_correlation_id('abc","injected":"x')
+        template = encode_error_template("INTERNAL_SERVER_ERROR", "Boom")
+
+        body = orjson.loads(render_error_template(template))
+
+        assert body["error"]["correlation_id"] == 'abc","injected":"x'
+        assert "injected" not in body["error"]
+
+
+@pytest.mark.unit
+class TestStructuredLogging:
+    """Test structured log event enrichment."""
+
+    def test_trace_context_added_inside_recording_span(self, capsys):
+        """Test that trace and span IDs are emitted for recorded spans only."""
+        from opentelemetry.sdk.trace import TracerProvider
+
+        utils.configure_structured_logging("DEBUG")
+        # Other test modules disable the SDK process-wide; this test needs real spans
+        with patch.dict("os.environ", {"OTEL_SDK_DISABLED": "false"}):
+            tracer = TracerProvider().get_tracer(__name__)
+        capsys.readouterr()
+
+        with tracer.start_as_current_span("request") as span:
+            utils.get_logger("test").info("inside span")
+        utils.get_logger("test").info("outside span")
+
+        inside, outside = (
+            orjson.loads(line) for line in capsys.readouterr().out.splitlines()
+        )
+        assert inside["trace_id"] == format(span.get_span_context().trace_id, "032x")
+        assert inside["span_id"] == format(span.get_span_context().span_id, "016x")
+        assert "trace_id" not in outside
@@ -87,6 +87,25 @@ class TestRebalancePosition:
                 actual_drift=Decimal("0.2000"),
             )
 
+    def test_non_ascii_security_id_rejected(self):
+        """Test that Unicode alphanumerics are rejected in security IDs."""
+        with pytest.raises(
+            ValueError, match="Security ID must be exactly 24 alphanumeric characters"
+        ):
+            RebalancePosition(
+                security_id="abc123def456ghi789jkl01\u00e9",
+                price=Decimal("100.50"),
+                original_quantity=Decimal("10"),
+                adjusted_quantity=Decimal("15"),
+                original_position_market_value=Decimal("1005.00"),
+                adjusted_position_market_value=Decimal("1507.50"),
+                target=Decimal("0.05"),
+                high_drift=Decimal("0.1"),
+                low_drift=Decimal("0.05"),
+                actual=Decimal("0.0600"),
+                actual_drift=Decimal("0.2000"),
+            )
+
     def test_invalid_transaction_type(self):
         """Test validation of transaction type."""
         with pytest.raises(
@@ -95,6 +95,7 @@ class TestPositionCreation:
             "STOCK12345678901234567 8",  # Contains space, exactly 24 chars
             "STOCK12345678901234567@8",  # Contains special character, exactly 24 chars
             "STOCK12345678901234567.8",  # Contains period, exactly 24 chars
+            "STOCK123456789012345678\n",  # Trailing newline, exactly 24 chars
         ]
 
         for invalid_id in invalid_security_ids:
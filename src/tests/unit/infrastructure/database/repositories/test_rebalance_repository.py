@@ -25,12 +25,16 @@ from src.infrastructure.database.repositories.rebalance_repository import (
 )
 from src.models.rebalance import PortfolioEmbedded, PositionEmbedded, RebalanceDocument
 
+# test_database shares the session-scoped Motor client, which is bound to the
+# event loop it first ran on
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
 @pytest.mark.unit
 class TestMongoRebalanceRepository:
     """Test cases for MongoRebalanceRepository."""
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def repository(self, test_database):
         """Create repository instance for testing."""
         # Initialize Beanie for testing
@@ -77,7 +81,7 @@ class TestMongoRebalanceRepository:
             created_at=datetime.now(timezone.utc),
         )
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def sample_rebalance_document(self, test_database):
         """Create a sample rebalance document for testing."""
         # Initialize Beanie first
@@ -227,6 +231,7 @@ class TestMongoRebalanceRepository:
 
         # Mock the raw MongoDB collection operation
         mock_collection = AsyncMock()
+        mock_collection.with_options = MagicMock(return_value=mock_collection)
         mock_collection.find_one.return_value = {
             '_id': sample_rebalance_document.id,
             'model_id': sample_rebalance_document.model_id,
@@ -257,6 +262,7 @@ class TestMongoRebalanceRepository:
 
         # Mock the raw MongoDB collection operation
         mock_collection = AsyncMock()
+        mock_collection.with_options = MagicMock(return_value=mock_collection)
         mock_collection.find_one.return_value = None
 
         with patch.object(
@@ -488,6 +494,56 @@ class TestMongoRebalanceRepository:
         )
         assert len(result.portfolios) == len(sample_rebalance_document.portfolios)
 
+    @pytest.mark.asyncio
+    async def test_trusted_raw_document_to_entity_conversion(self):
+        """Test conversion of a stored document built without revalidation."""
+        raw = {
+            '_id': ObjectId("507f1f77bcf86cd799439012"),
+            'model_id': ObjectId("507f1f77bcf86cd799439011"),
+            'rebalance_date': datetime(2024, 12, 20, 10, 30, 0, tzinfo=timezone.utc),
+            'model_name': "Test Model",
+            'number_of_portfolios': 1,
+            'portfolios': [
+                {
+                    'portfolio_id': "def456ghi789jkl012mno345",
+                    'market_value': Decimal("25000.00"),
+                    'cash_before_rebalance': Decimal("1000.00"),
+                    'cash_after_rebalance': Decimal("500.00"),
+                    'positions': [
+                        {
+                            'security_id': "abc123def456ghi789jkl012",
+                            'price': Decimal("100.50"),
+                            'original_quantity': Decimal("10"),
+                            'adjusted_quantity': Decimal("15"),
+                            'original_position_market_value': Decimal("1005.00"),
+                            'adjusted_position_market_value': Decimal("1507.50"),
+                            'target': Decimal("0.05"),
+                            'high_drift': Decimal("0.1"),
+                            'low_drift': Decimal("0.05"),
+                            'actual': Decimal("0.0600"),
+                            'actual_drift': Decimal("0.2000"),
+                            'transaction_type': "BUY",
+                            'trade_quantity': 5,
+                            'trade_date': datetime.now(timezone.utc),
+                        }
+                    ],
+                }
+            ],
+            'version': 2,
+            'created_at': datetime.now(timezone.utc),
+        }
+
+        document = RebalanceDocument.from_mongo_trusted(raw)
+        result = MongoRebalanceRepository()._convert_to_domain(document)
+
+        assert result.rebalance_id == raw['_id']
+        assert result.version == 2
+        [portfolio] = result.portfolios
+        assert portfolio.market_value == Decimal("25000.00")
+        [position] = portfolio.positions
+        assert position.price == Decimal("100.50")
+        assert position.trade_quantity == 5
+
     @pytest.mark.asyncio
     async def test_concurrent_access_handling(
         self, repository, sample_rebalance_entity
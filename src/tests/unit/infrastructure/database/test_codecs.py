@@ -0,0 +1,50 @@
+"""
+Unit tests for the BSON codec options used on raw MongoDB reads.
+"""
+
+from decimal import Decimal
+
+import bson
+import pytest
+from bson import CodecOptions, Decimal128
+from pymongo import MongoClient
+
+from src.infrastructure.database.codecs import DECIMAL_TYPE_REGISTRY, with_decimal_codec
+
+
+@pytest.mark.unit
+class TestDecimalCodec:
+    """Test cases for Decimal128 decoding."""
+
+    def test_decimal128_decoded_as_decimal(self):
+        """Test that nested Decimal128 values decode to Decimal."""
+        raw = bson.encode(
+            {'portfolios': [{'positions': [{'price': Decimal128('100.50'), 'qty': 3}]}]}
+        )
+
+        document = bson.decode(raw, CodecOptions(type_registry=DECIMAL_TYPE_REGISTRY))
+
+        position = document['portfolios'][0]['positions'][0]
+        assert position['price'] == Decimal('100.50')
+        assert isinstance(position['price'], Decimal)
+        assert position['qty'] == 3
+
+    def test_decimal_representation_preserved(self):
+        """Test that numerically equal values keep their own representation."""
+        raw = bson.encode({'a': Decimal128('0.1'), 'b': Decimal128('0.10')})
+
+        document = bson.decode(raw, CodecOptions(type_registry=DECIMAL_TYPE_REGISTRY))
+
+        assert str(document['a']) == '0.1'
+        assert str(document['b']) == '0.10'
+
+    def test_with_decimal_codec_keeps_other_options(self):
+        """Test that applying the codec preserves existing codec options."""
+        client = MongoClient(tz_aware=True, connect=False)
+        collection = client['test']['rebalances']
+
+        decoded = with_decimal_codec(collection)
+
+        assert decoded.codec_options.tz_aware is True
+        assert decoded.codec_options.type_registry is DECIMAL_TYPE_REGISTRY
+        client.close()
@@ -0,0 +1,116 @@
+"""
+Unit tests for MongoDB connection management.
+
+This module tests connection pool configuration, pool warmup on startup,
+and shutdown behaviour of the DatabaseManager.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config import Settings
+from src.infrastructure.database.database import DatabaseManager
+
+
+@pytest.mark.unit
+class TestDatabaseManagerPool:
+    """Test cases for DatabaseManager connection pooling."""
+
+    @pytest.fixture
+    def settings(self):
+        """Create settings with a small connection pool."""
+        return Settings(
+            database_url="mongodb://localhost:27017",
+            database_name="pool_test",
+            database_min_connections=3,
+            database_max_connections=20,
+            database_wait_queue_timeout_ms=2500,
+        )
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a Motor client mock with a database of collections."""
+        client = MagicMock()
+        client.admin.command = AsyncMock(return_value={"ok": 1})
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value=None)
+        database = MagicMock()
+        database.__getitem__.return_value = collection
+        client.__getitem__.return_value = database
+        return client
+
+    @pytest.mark.asyncio
+    async def test_connect_configures_pool_and_warms_connections(
+        self, settings, mock_client
+    ):
+        """Test that connect sizes the pool and pre-opens min connections."""
+        manager = DatabaseManager()
+
+        with (
+            patch(
+                "src.infrastructure.database.database.get_settings",
+                return_value=settings,
+            ),
+            patch(
+                "src.infrastructure.database.database.AsyncIOMotorClient",
+                return_value=mock_client,
+            ) as mock_client_class,
+            patch(
+                "src.infrastructure.database.database.init_beanie",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await manager.connect()
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["maxPoolSize"] == 20
+        assert kwargs["minPoolSize"] == 3
+        assert kwargs["waitQueueTimeoutMS"] == 2500
+        collection = mock_client["pool_test"]["models"]
+        assert collection.find_one.await_count == 3
+        assert manager.is_connected
+
+    @pytest.mark.asyncio
+    async def test_connect_succeeds_when_pool_warmup_fails(self, settings, mock_client):
+        """Test that a failed warmup read is logged without aborting startup."""
+        collection = mock_client["pool_test"]["models"]
+        collection.find_one.side_effect = Exception("not authorized on pool_test")
+        manager = DatabaseManager()
+
+        with (
+            patch(
+                "src.infrastructure.database.database.get_settings",
+                return_value=settings,
+            ),
+            patch(
+                "src.infrastructure.database.database.AsyncIOMotorClient",
+                return_value=mock_client,
+            ),
+            patch(
+                "src.infrastructure.database.database.init_beanie",
+                new_callable=AsyncMock,
+            ),
+            patch("src.infrastructure.database.database.logger") as mock_logger,
+        ):
+            await manager.connect()
+
+        assert manager.is_connected
+        mock_logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_logs_topology_and_closes_client(self, mock_client):
+        """Test that disconnect reports the topology before closing."""
+        manager = DatabaseManager()
+        manager.client = mock_client
+        manager._is_initialized = True
+
+        with patch("src.infrastructure.database.database.logger") as mock_logger:
+            await manager.disconnect()
+
+        mock_client.close.assert_called_once()
+        assert any(
+            "Closing MongoDB pool" in call.args[0]
+            for call in mock_logger.info.call_args_list
+        )
+        assert not manager.is_connected
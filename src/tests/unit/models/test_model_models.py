@@ -0,0 +1,222 @@
+"""
+Unit tests for investment model Beanie document models.
+
+This module tests the MongoDB document models for investment models,
+focusing on position validation.
+"""
+
+from decimal import Decimal
+
+import pytest
+from bson import Decimal128, ObjectId
+from pydantic import ValidationError
+
+from src.domain.entities.position import Position
+from src.domain.value_objects.drift_bounds import DriftBounds
+from src.domain.value_objects.target_percentage import TargetPercentage
+from src.models.model import ModelDocument, PositionEmbedded
+
+
+def make_position(security_id, target="0.01"):
+    """Create an embedded position with fixed drift bounds."""
+    return PositionEmbedded(
+        security_id=security_id,
+        target=Decimal(target),
+        high_drift=Decimal("0.02"),
+        low_drift=Decimal("0.01"),
+    )
+
+
+class TestModelDocumentPositions:
+    """Test ModelDocument position validation.
+
+    The validator is called directly because constructing a Beanie document
+    requires an initialized collection.
+    """
+
+    def test_valid_positions_accepted(self):
+        """Test that valid positions pass validation unchanged."""
+        positions = [make_position(f"STOCK{i:019d}") for i in range(3)]
+
+        assert ModelDocument.validate_positions(positions) is positions
+
+    def test_target_sum_exceeding_maximum_rejected(self):
+        """Test that targets summing above 0.95 are rejected."""
+        positions = [make_position(f"STOCK{i:019d}", "0.5") for i in range(2)]
+
+        with pytest.raises(ValueError, match="exceeds maximum 0.95"):
+            ModelDocument.validate_positions(positions)
+
+    def test_too_many_non_zero_positions_rejected(self):
+        """Test that more than 100 non-zero positions are rejected."""
+        positions = [make_position(f"STOCK{i:019d}", "0.005") for i in range(101)]
+        positions = positions[:90] + [
+            make_position(p.security_id, "0.001") for p in positions[90:]
+        ]
+
+        with pytest.raises(ValueError, match="Maximum 100 non-zero positions"):
+            ModelDocument.validate_positions(positions)
+
+    def test_duplicate_securities_rejected(self):
+        """Test that duplicate security IDs are rejected."""
+        positions = [make_position("STOCK1234567890123456789")] * 2
+
+        with pytest.raises(ValueError, match="Duplicate securities"):
+            ModelDocument.validate_positions(positions)
+
+
+class TestModelDocumentPortfolios:
+    """Test ModelDocument portfolio validation."""
+
+    def test_unique_portfolios_accepted(self):
+        """Test that distinct portfolio IDs pass validation unchanged."""
+        portfolios = ["portfolio1", "portfolio2"]
+
+        assert ModelDocument.validate_unique_portfolios(portfolios) is portfolios
+
+    def test_duplicate_portfolios_rejected(self):
+        """Test that a repeated portfolio ID is rejected."""
+        with pytest.raises(ValueError, match="Duplicate portfolios not allowed"):
+            ModelDocument.validate_unique_portfolios(["portfolio1", "portfolio1"])
+
+
+class TestPositionEmbeddedFromDomain:
+    """Test PositionEmbedded construction from domain positions."""
+
+    @staticmethod
+    def make_domain_position(target):
+        """Create a domain position with the given target."""
+        return Position(
+            security_id="STOCK1234567890123456789",
+            target=TargetPercentage(Decimal(target)),
+            drift_bounds=DriftBounds(
+                low_drift=Decimal("0.01"), high_drift=Decimal("0.02")
+            ),
+        )
+
+    def test_equal_positions_share_cached_instance(self):
+        """Test that equal domain positions reuse one embedded document."""
+        first = PositionEmbedded.from_domain_position(self.make_domain_position("0.1"))
+        second = PositionEmbedded.from_domain_position(self.make_domain_position("0.1"))
+
+        assert first is second
+        assert first.target == Decimal("0.1")
+
+    def test_decimal_representation_preserved(self):
+        """Test that numerically equal targets keep their own representation."""
+        short = PositionEmbedded.from_domain_position(self.make_domain_position("0.1"))
+        padded = PositionEmbedded.from_domain_position(
+            self.make_domain_position("0.10")
+        )
+
+        assert short is not padded
+        assert str(padded.target) == "0.10"
+
+    def test_embedded_position_is_frozen(self):
+        """Test that shared embedded documents cannot be mutated."""
+        position = PositionEmbedded.from_domain_position(
+            self.make_domain_position("0.1")
+        )
+
+        with pytest.raises(ValidationError):
+            position.target = Decimal("0.2")
+
+
+class TestModelDocumentTrustedReads:
+    """Test construction of model documents from stored MongoDB data."""
+
+    def test_from_mongo_trusted_converts_to_domain(self):
+        """Test that a stored document converts to the domain model."""
+        raw = {
+            "_id": ObjectId(),
+            "name": "Stored Model",
+            "positions": [
+                {
+                    "security_id": "STOCK1234567890123456789",
+                    "target": Decimal128("0.25"),
+                    "high_drift": Decimal128("0.05"),
+                    "low_drift": Decimal128("0.03"),
+                }
+            ],
+            "portfolios": ["portfolio1"],
+            "version": 3,
+        }
+
+        model = ModelDocument.from_mongo_trusted(raw).to_domain_model()
+
+        assert model.model_id == raw["_id"]
+        assert model.version == 3
+        assert model.positions[0].target.value == Decimal("0.25")
+        assert model.positions[0].drift_bounds.high_drift == Decimal("0.05")
+
+
+class TestPositionEmbeddedSerialization:
+    """Test PositionEmbedded serialization for MongoDB storage."""
+
+    def test_decimal_fields_serialized_as_shared_decimal128(self):
+        """Test that equal Decimal values reuse one Decimal128 instance."""
+        first = make_position("STOCK1234567890123456789", "0.10").model_dump()
+        second = make_position("STOCK1234567890123456780", "0.10").model_dump()
+
+        assert first["target"] == Decimal128("0.10")
+        assert first["target"] is second["target"]
+        assert first["high_drift"] is second["high_drift"]
+
+
+class TestModelDocumentUpdate:
+    """Test updating model documents from domain models."""
+
+    def test_update_from_domain_model_does_not_share_portfolios(self):
+        """Test that updates copy values without aliasing the entity's lists."""
+        from src.domain.entities.model import InvestmentModel
+
+        document = ModelDocument.model_construct(
+            name="Old", positions=[], portfolios=[], version=1
+        )
+        model = InvestmentModel(
+            model_id=ObjectId(),
+            name="New",
+            positions=[
+                TestPositionEmbeddedFromDomain.make_domain_position("0.1"),
+            ],
+            portfolios=["portfolio1"],
+            version=2,
+        )
+
+        document.update_from_domain_model(model)
+
+        assert document.name == "New"
+        assert document.version == 2
+        assert document.positions[0].target == Decimal("0.1")
+        assert document.portfolios == ["portfolio1"]
+        assert document.portfolios is not model.portfolios
+
+    def test_to_domain_model_does_not_share_portfolios(self):
+        """Test that the domain model gets its own copy of the portfolio list."""
+        document = ModelDocument.model_construct(
+            id=ObjectId(),
+            name="Stored",
+            positions=[],
+            portfolios=["portfolio1"],
+            version=1,
+        )
+
+        model = document.to_domain_model()
+        model.portfolios.append("portfolio2")
+
+        assert document.portfolios == ["portfolio1"]
+
+
+class TestPositionEmbeddedToDomain:
+    """Test conversion of embedded positions to domain positions."""
+
+    def test_equal_positions_share_domain_instance(self):
+        """Test that equal embedded positions convert to one domain position."""
+        first = make_position("STOCK1234567890123456789", "0.10")
+        second = make_position("STOCK1234567890123456789", "0.10")
+
+        domain_position = first.to_domain_position()
+
+        assert domain_position is second.to_domain_position()
+        assert str(domain_position.target.value) == "0.10"
+        assert domain_position.drift_bounds.high_drift == Decimal("0.02")
@@ -5,11 +5,14 @@ This module tests the MongoDB document models using Beanie ODM,
 focusing on Decimal128 conversion and validation.
 """
 
+import subprocess
+import sys
 from datetime import datetime
 from decimal import Decimal
 
 import pytest
 from bson import Decimal128
+from pydantic import ValidationError
 
 from src.models.rebalance import PortfolioEmbedded, PositionEmbedded, RebalanceDocument
 
@@ -83,6 +86,38 @@ class TestPositionEmbedded:
         assert position.target == Decimal('0.25')
         assert isinstance(position.price, Decimal)
 
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ('security_id', 'STOCK12345678901234567'),
+            ('security_id', 'STOCK12345678901234567-9'),
+            ('price', Decimal128('-1')),
+            ('trade_quantity', 0),
+            ('transaction_type', 'HOLD'),
+        ],
+    )
+    def test_schema_constraints_reject_invalid_values(self, field, value):
+        """Test that format, range and enum constraints reject bad values."""
+        position_data = {
+            'security_id': 'STOCK1234567890123456789',
+            'price': Decimal('100.50'),
+            'original_quantity': Decimal('500'),
+            'adjusted_quantity': Decimal('600'),
+            'original_position_market_value': Decimal('50250.00'),
+            'adjusted_position_market_value': Decimal('60300.00'),
+            'target': Decimal('0.25'),
+            'high_drift': Decimal('0.05'),
+            'low_drift': Decimal('0.03'),
+            'actual': Decimal('0.2515'),
+            'actual_drift': Decimal('-0.006'),
+            'transaction_type': 'SELL',
+            'trade_quantity': 100,
+        }
+        position_data[field] = value
+
+        with pytest.raises(ValidationError):
+            PositionEmbedded(**position_data)
+
 
 class TestPortfolioEmbedded:
     """Test PortfolioEmbedded Beanie model."""
@@ -110,6 +145,41 @@ class TestPortfolioEmbedded:
         assert portfolio.cash_before_rebalance == Decimal('10000.00')
         assert portfolio.cash_after_rebalance == Decimal('9950.00')
 
+    def test_decimal128_conversion_leaves_input_unchanged(self):
+        """Test that converting Decimal128 values does not modify the input dict."""
+        portfolio_data = {
+            'portfolio_id': '683b6d88a29ee10e8b499643',
+            'market_value': Decimal128('240000.00'),
+            'cash_before_rebalance': Decimal('10000.00'),
+            'cash_after_rebalance': Decimal128('9950.00'),
+        }
+
+        portfolio = PortfolioEmbedded.model_validate(portfolio_data)
+
+        assert portfolio.market_value == Decimal('240000.00')
+        assert isinstance(portfolio_data['market_value'], Decimal128)
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ('portfolio_id', '683b6d88a29ee10e8b49964'),
+            ('market_value', Decimal128('-1')),
+            ('cash_after_rebalance', Decimal('-0.01')),
+        ],
+    )
+    def test_schema_constraints_reject_invalid_values(self, field, value):
+        """Test that length and range constraints reject bad values."""
+        portfolio_data = {
+            'portfolio_id': '683b6d88a29ee10e8b499643',
+            'market_value': Decimal('240000.00'),
+            'cash_before_rebalance': Decimal('10000.00'),
+            'cash_after_rebalance': Decimal('9950.00'),
+        }
+        portfolio_data[field] = value
+
+        with pytest.raises(ValidationError):
+            PortfolioEmbedded(**portfolio_data)
+
     def test_portfolio_with_decimal128_positions(self):
         """Test portfolio with positions that have Decimal128 values."""
         position = PositionEmbedded(
@@ -241,3 +311,72 @@ class TestRebalanceDocument:
 
         # This proves the Decimal128 conversion will work in RebalanceDocument
         # since it uses these same embedded models
+
+
+class TestTrustedReads:
+    """Test construction of rebalance documents from stored MongoDB data."""
+
+    def test_from_mongo_trusted_builds_nested_documents(self):
+        """Test that stored documents are rebuilt with Decimal values."""
+        from bson import ObjectId
+
+        raw = {
+            '_id': ObjectId(),
+            'model_id': ObjectId(),
+            'rebalance_date': datetime.now(),
+            'model_name': 'Test Model',
+            'number_of_portfolios': 1,
+            'portfolios': [
+                {
+                    'portfolio_id': '683b6d88a29ee10e8b499643',
+                    'market_value': Decimal128('240000.00'),
+                    'cash_before_rebalance': Decimal128('10000.00'),
+                    'cash_after_rebalance': Decimal128('9950.00'),
+                    'positions': [
+                        {
+                            'security_id': 'STOCK1234567890123456789',
+                            'price': Decimal128('100.50'),
+                            'target': Decimal128('0.25'),
+                            'actual_drift': Decimal128('0.006'),
+                            'transaction_type': 'BUY',
+                            'trade_quantity': 100,
+                        }
+                    ],
+                }
+            ],
+            'version': 1,
+        }
+
+        rebalance = RebalanceDocument.from_mongo_trusted(raw)
+
+        assert rebalance.id == raw['_id']
+        portfolio = rebalance.portfolios[0]
+        assert isinstance(portfolio, PortfolioEmbedded)
+        assert portfolio.market_value == Decimal('240000.00')
+        position = portfolio.positions[0]
+        assert isinstance(position, PositionEmbedded)
+        assert position.price == Decimal('100.50')
+        assert position.actual_drift == Decimal('0.006')
+        assert position.trade_quantity == 100
+
+
+class TestModelsPackageExports:
+    """Test the lazily resolved src.models package exports."""
+
+    def test_rebalance_position_alias(self):
+        """Test that the package alias resolves to the rebalance PositionEmbedded."""
+        from src.models import RebalancePositionEmbedded
+
+        assert RebalancePositionEmbedded is PositionEmbedded
+
+    def test_rebalance_import_does_not_load_model_module(self):
+        """Test that importing rebalance documents leaves src.models.model unloaded."""
+        code = (
+            "import sys, src.models.rebalance; "
+            "print('src.models.model' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
@@ -46,6 +46,20 @@ class TestModelPositionDTO:
         assert position_dto.high_drift == Decimal("0.05")
         assert position_dto.low_drift == Decimal("0.03")
 
+    def test_position_dto_is_immutable(self):
+        """Test that position DTOs cannot be modified after validation."""
+        from src.schemas.models import ModelPositionDTO
+
+        position_dto = ModelPositionDTO(
+            security_id="STOCK1234567890123456789",
+            target=Decimal("0.25"),
+            high_drift=Decimal("0.05"),
+            low_drift=Decimal("0.03"),
+        )
+
+        with pytest.raises(ValidationError):
+            position_dto.target = Decimal("0.90")
+
     def test_position_dto_security_id_validation(self):
         """Test security ID validation requirements."""
         from src.schemas.models import ModelPositionDTO
@@ -69,7 +83,7 @@ class TestModelPositionDTO:
             )
 
         # Test invalid characters (underscore)
-        with pytest.raises(ValidationError, match="exactly 24.*alphanumeric"):
+        with pytest.raises(ValidationError, match="should match pattern"):
             ModelPositionDTO(
                 security_id="STOCK123456789012345_789",  # 24 chars with underscore
                 target=Decimal("0.25"),
@@ -108,6 +122,25 @@ class TestModelPositionDTO:
                 low_drift=Decimal("0.03"),
             )
 
+    @pytest.mark.parametrize(
+        "target",
+        [
+            Decimal("0.0050000000000000000000000000001"),
+            Decimal("0.0049999999999999999999999999999"),
+        ],
+    )
+    def test_position_dto_high_precision_target_rejected(self, target):
+        """Test that targets just off a 0.005 multiple are rejected exactly."""
+        from src.schemas.models import ModelPositionDTO
+
+        with pytest.raises(ValidationError, match="multiple of 0.005"):
+            ModelPositionDTO(
+                security_id="STOCK1234567890123456789",
+                target=target,
+                high_drift=Decimal("0.05"),
+                low_drift=Decimal("0.05"),
+            )
+
     def test_position_dto_drift_validation(self):
         """Test drift bounds validation."""
         from src.schemas.models import ModelPositionDTO
@@ -294,6 +327,30 @@ class TestModelDTO:
                 version=1,
             )
 
+    def test_model_dto_target_sum_at_maximum_accepted(self):
+        """Test that targets summing to exactly 0.95 are accepted."""
+        from src.schemas.models import ModelDTO, ModelPositionDTO
+
+        positions = [
+            ModelPositionDTO(
+                security_id=f"STOCK{i:019d}",
+                target=Decimal("0.050"),
+                high_drift=Decimal("0.02"),
+                low_drift=Decimal("0.02"),
+            )
+            for i in range(19)
+        ]
+
+        model = ModelDTO(
+            model_id="507f1f77bcf86cd799439011",
+            name="Fully Allocated",
+            positions=positions,
+            portfolios=["portfolio1"],
+            version=1,
+        )
+
+        assert sum(position.target for position in model.positions) == Decimal("0.95")
+
     def test_model_dto_portfolios_validation(self):
         """Test portfolios list validation."""
         from src.schemas.models import ModelDTO
@@ -59,6 +59,19 @@ class TestTransactionDTO:
         )
 
         assert transaction_dto.transaction_type == TransactionType.BUY
+        assert TransactionType("Sell") is TransactionType.SELL
+
+    def test_invalid_transaction_type_rejected(self):
+        """Test that unknown transaction types are rejected."""
+        from src.schemas.transactions import TransactionDTO
+
+        with pytest.raises(ValidationError, match="Invalid transaction type: hold"):
+            TransactionDTO(
+                transaction_type="hold",
+                security_id="STOCK1234567890123456789",
+                quantity=100,
+                trade_date=date(2024, 12, 19),
+            )
 
     def test_transaction_dto_security_id_validation(self):
         """Test security ID validation in transactions."""
@@ -134,6 +147,20 @@ class TestTransactionDTO:
         assert sell_transaction.transaction_type == TransactionType.SELL
         assert sell_transaction.quantity == 250
 
+    def test_transaction_dto_is_immutable(self):
+        """Test that transaction DTOs cannot be modified after validation."""
+        from src.schemas.transactions import TransactionDTO, TransactionType
+
+        transaction = TransactionDTO(
+            transaction_type=TransactionType.BUY,
+            security_id="STOCK1234567890123456789",
+            quantity=100,
+            trade_date=date(2024, 12, 20),
+        )
+
+        with pytest.raises(ValidationError):
+            transaction.quantity = 200
+
 
 @pytest.mark.unit
 class TestDriftDTO:
@@ -180,6 +207,23 @@ class TestDriftDTO:
         assert drift_dto.original_quantity == Decimal("500.123456")
         assert drift_dto.actual == Decimal("0.275123")
 
+    def test_drift_dto_is_immutable(self):
+        """Test that drift DTOs cannot be modified after validation."""
+        from src.schemas.rebalance import DriftDTO
+
+        drift_dto = DriftDTO(
+            security_id="STOCK1234567890123456789",
+            original_quantity=Decimal("500"),
+            adjusted_quantity=Decimal("600"),
+            target=Decimal("0.25"),
+            high_drift=Decimal("0.05"),
+            low_drift=Decimal("0.03"),
+            actual=Decimal("0.2750"),
+        )
+
+        with pytest.raises(ValidationError):
+            drift_dto.low_drift = Decimal("0.10")
+
     def test_drift_dto_target_validation(self):
         """Test target percentage validation in drift DTO."""
         from src.schemas.rebalance import DriftDTO
@@ -300,6 +344,24 @@ class TestRebalanceDTO:
                 drifts=[],
             )
 
+    @pytest.mark.parametrize(
+        "rebalance_id",
+        [
+            "507f1f77bcf86cd79943904g",  # Non-hex character
+            "507f1f77bcf86cd79943904",  # 23 characters
+            "507f1f77bcf86cd799439040\n",  # Trailing newline
+        ],
+    )
+    def test_rebalance_dto_rebalance_id_validation(self, rebalance_id):
+        """Test that rebalance IDs must be 24-character hex strings."""
+        from src.schemas.rebalance import RebalanceDTO
+
+        with pytest.raises(ValidationError, match="should match pattern"):
+            RebalanceDTO(
+                portfolio_id="683b6d88a29ee10e8b499643",
+                rebalance_id=rebalance_id,
+            )
+
     def test_rebalance_dto_empty_lists_allowed(self):
         """Test that empty transactions and drifts lists are allowed."""
         from src.schemas.rebalance import RebalanceDTO
@@ -316,6 +378,70 @@ class TestRebalanceDTO:
         assert len(rebalance_dto.drifts) == 0
 
 
+@pytest.mark.unit
+class TestRebalancePositionDTO:
+    """Test RebalancePositionDTO construction."""
+
+    def test_from_trusted_matches_validated_construction(self):
+        """Test that trusted construction serializes like the validating one."""
+        from src.schemas.rebalance import RebalancePositionDTO
+
+        data = {
+            "security_id": "STOCK1234567890123456789",
+            "price": Decimal("100.50"),
+            "original_quantity": Decimal("500"),
+            "adjusted_quantity": Decimal("600"),
+            "original_position_market_value": Decimal("50250.00"),
+            "adjusted_position_market_value": Decimal("60300.00"),
+            "target": Decimal("0.25"),
+            "high_drift": Decimal("0.05"),
+            "low_drift": Decimal("0.03"),
+            "actual": Decimal("0.2515"),
+            "actual_drift": Decimal("0.006"),
+            "transaction_type": "BUY",
+            "trade_quantity": 100,
+            "trade_date": datetime(2024, 12, 19, tzinfo=timezone.utc),
+        }
+
+        trusted = RebalancePositionDTO.from_trusted(**data)
+
+        assert trusted == RebalancePositionDTO(**data)
+        assert trusted.model_dump(mode='json') == RebalancePositionDTO(
+            **data
+        ).model_dump(mode='json')
+
+
+@pytest.mark.unit
+class TestRebalancesByPortfoliosRequestDTO:
+    """Test RebalancesByPortfoliosRequestDTO portfolio validation."""
+
+    def test_valid_portfolios_accepted(self):
+        """Test that a list of 24-character portfolio IDs is accepted."""
+        from src.schemas.rebalance import RebalancesByPortfoliosRequestDTO
+
+        portfolios = ["683b6d88a29ee10e8b499643", "683b6d88a29ee10e8b499644"]
+
+        request = RebalancesByPortfoliosRequestDTO(portfolios=portfolios)
+
+        assert request.portfolios == portfolios
+
+    def test_empty_portfolios_rejected(self):
+        """Test that an empty portfolio list is rejected."""
+        from src.schemas.rebalance import RebalancesByPortfoliosRequestDTO
+
+        with pytest.raises(ValidationError, match="at least 1 item"):
+            RebalancesByPortfoliosRequestDTO(portfolios=[])
+
+    def test_wrong_length_portfolio_id_rejected(self):
+        """Test that a portfolio ID that is not 24 characters is rejected."""
+        from src.schemas.rebalance import RebalancesByPortfoliosRequestDTO
+
+        with pytest.raises(ValidationError, match="at most 24 characters"):
+            RebalancesByPortfoliosRequestDTO(
+                portfolios=["683b6d88a29ee10e8b499643", "683b6d88a29ee10e8b4996430"]
+            )
+
+
 @pytest.mark.unit
 class TestSchemaSerialization:
     """Test JSON serialization and deserialization of rebalance schemas."""
@@ -359,3 +485,31 @@ class TestSchemaSerialization:
         assert json_data["adjusted_quantity"] == "600.456"
         assert json_data["target"] == "0.25"
         assert json_data["actual"] == "0.2750"
+
+    def test_rebalance_result_dto_json_serialization(self):
+        """Test that rebalance results render Decimals as numbers and ISO dates."""
+        from src.schemas.rebalance import RebalancePortfolioDTO, RebalanceResultDTO
+
+        rebalance_date = datetime(2024, 12, 19, 10, 30, tzinfo=timezone.utc)
+        result = RebalanceResultDTO(
+            rebalance_id="507f1f77bcf86cd799439011",
+            model_id="507f1f77bcf86cd799439012",
+            rebalance_date=rebalance_date,
+            model_name="Test Model",
+            number_of_portfolios=1,
+            portfolios=[
+                RebalancePortfolioDTO(
+                    portfolio_id="683b6d88a29ee10e8b499643",
+                    market_value=Decimal("100000.50"),
+                    cash_before_rebalance=Decimal("500"),
+                    cash_after_rebalance=Decimal("250.25"),
+                )
+            ],
+            created_at=rebalance_date,
+        )
+
+        json_data = result.model_dump(mode='json')
+
+        assert json_data["rebalance_date"] == "2024-12-19T10:30:00+00:00"
+        assert json_data["portfolios"][0]["market_value"] == 100000.5
+        assert json_data["portfolios"][0]["cash_after_rebalance"] == 250.25
@@ -354,6 +354,7 @@ class TestHTTPMetricsMiddleware:
 
             # Create mock request and response
             request = Mock(spec=Request)
+            request.scope = {}  # not routed, so no matched route
             request.method = "GET"
             request.url.path = "/api/v1/models"
 
@@ -410,6 +411,7 @@ class TestHTTPMetricsMiddleware:
 
             # Create mock request
             request = Mock(spec=Request)
+            request.scope = {}  # not routed, so no matched route
             request.method = "POST"
             request.url.path = "/api/v1/models"
 
@@ -534,7 +536,7 @@ class TestHTTPMetricsIntegration:
                 # Second call: GET /test/{item_id}
                 assert call_args_list[1][1] == {
                     "method": "GET",
-                    "path": "/test/{id}",
+                    "path": "/test/{item_id}",
                     "status": "200",
                 }
 